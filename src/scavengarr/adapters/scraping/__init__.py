@@ -1,5 +1,24 @@
 from __future__ import annotations
 
-from .scrapy_adapter import ScrapyAdapter
+from .scrapy_adapter import (
+    CrawlContext,
+    CrawlIncompleteError,
+    ExecutionPlan,
+    PageExtraction,
+    ScrapyAdapter,
+    get_plan,
+)
+from .selectors import LxmlBackend, ParserBackend, SoupBackend, get_backend
 
-__all__ = ["ScrapyAdapter"]
+__all__ = [
+    "CrawlContext",
+    "CrawlIncompleteError",
+    "ExecutionPlan",
+    "LxmlBackend",
+    "PageExtraction",
+    "ParserBackend",
+    "ScrapyAdapter",
+    "SoupBackend",
+    "get_backend",
+    "get_plan",
+]
@@ -0,0 +1,492 @@
+"""
+Container-scoped partial parsing.
+
+Most stages only need a few regions of a page (e.g. the stream list container
+and a handful of headings). When every document-level selector of a stage
+starts with an "anchor" compound that can be recognised from the start tag
+alone (tag name + id/class/attribute conditions), the stage only needs the
+subtrees rooted at anchor matches:
+
+    div#grap-stream-list ul li a   -> anchor: div#grap-stream-list
+    span[itemprop='description']   -> anchor: span[itemprop='description']
+
+DocumentScope cuts those subtrees out of the raw bytes and returns a small
+document made of just these regions, which is then parsed by the stage's
+backend instead of the full page. The scan avoids per-tag Python work:
+
+1. Find anchor candidates with bytes.find() on the lowercased page: the
+   anchor's id/class/attribute literal (or "<tag" if it has none).
+2. Confirm each candidate against its parsed start tag.
+3. Find the anchor's end tag by counting start/end tags of the same name
+   inside the region (comments and raw-text elements are skipped).
+4. Check that no end tag in the region closes an element opened before it
+   (e.g. "<p><span>a</p>...</span>": the "</p>" implicitly ends the span).
+
+Scoping is only compiled when it is equivalent for the selectors: only
+descendant/child combinators, no pseudo-classes on the anchor, and anchor
+tags whose end tag is required. Whenever a region cannot be delimited
+(unclosed or implicitly closed anchor, non-ASCII-compatible encoding), the
+parsers may disagree with the scan (markup inside textarea, title, xmp,
+iframe, noembed, noframes, template or plaintext, which the backends treat
+differently or which changes how its content is parsed), or no region is
+found, the full page is parsed.
+"""
+
+from __future__ import annotations
+
+import bisect
+import codecs
+import html
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from cssselect import SelectorError as CssSelectorError
+from cssselect import parse as parse_css
+from cssselect.parser import Attrib, Class, CombinedSelector, Element, Hash
+
+# Anchor tags: end tag required and no implicit closing by sibling start tags,
+# so a region can be delimited by counting start/end tags of the same name.
+_ANCHOR_TAGS = frozenset(
+    {
+        "article",
+        "aside",
+        "div",
+        "dl",
+        "footer",
+        "form",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "header",
+        "main",
+        "nav",
+        "ol",
+        "section",
+        "span",
+        "table",
+        "ul",
+    }
+)
+
+# Combinators that keep every match inside the anchor's subtree
+_SCOPED_COMBINATORS = frozenset({" ", ">"})
+
+# Operators supported for attribute conditions (cssselect semantics)
+_OPERATORS = frozenset({"exists", "=", "~=", "|=", "^=", "$=", "*=", "!="})
+
+# Comments and raw-text elements are skipped (may contain tag-like text):
+# opener -> closer
+_SKIPPED = {
+    b"<!--": b"-->",
+    b"<script": b"</script",
+    b"<style": b"</style",
+}
+
+# Elements whose content the backends parse differently (raw text for lxml,
+# markup for html.parser; inert for <template>; <plaintext> never ends).
+# Skipped like raw text if they are closed and hold plain text only; with
+# markup-like content ("<") or unclosed, the page is not scoped.
+_TEXT_ONLY = {
+    b"<textarea": b"</textarea",
+    b"<title": b"</title",
+    b"<xmp": b"</xmp",
+    b"<iframe": b"</iframe",
+    b"<noembed": b"</noembed",
+    b"<noframes": b"</noframes",
+    b"<template": b"</template",
+    b"<plaintext": None,
+}
+
+# Characters that may follow a tag name
+_TAG_NAME_END = frozenset(b" \t\r\n\f/>")
+
+# How many "<" to look back from a literal for its start tag (a "<" inside an
+# attribute value before the literal needs more than one step)
+_MAX_LOOKBACK = 4
+
+# Attribute units of a start tag: plain char or whole quoted value
+_UNIT = rb"""(?:[^>"']|"[^"]*"|'[^']*')"""
+
+_START_TAG_RE = re.compile(rb"<([A-Za-z][A-Za-z0-9]*)" + _UNIT + rb"*>")
+
+# Start/end tags of any element (on the lowercased page)
+_ANY_TAG_RE = re.compile(rb"<(/?)([a-z][a-z0-9]*)(?=[\s/>])")
+
+# Literals usable as a byte-level prefilter (never entity-encoded in practice)
+_LITERAL_RE = re.compile(r"[\w.:/-]+", re.ASCII)
+
+_ATTR_RE = re.compile(r"""([^\s"'>/=]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+)))?""")
+
+# XPath normalize-space() whitespace (as used by cssselect for ~= and classes)
+_WHITESPACE_RE = re.compile(r"[ \t\r\n]+")
+
+
+@dataclass(frozen=True)
+class _AttrCondition:
+    """Attribute test with the same semantics as cssselect's XPath."""
+
+    name: str
+    operator: str
+    value: Optional[str] = None
+
+    def matches(self, attrs: Dict[str, str]) -> bool:
+        actual = attrs.get(self.name)
+        if self.operator == "!=":
+            return actual != self.value
+        if actual is None:
+            return False
+        if self.operator == "exists":
+            return True
+
+        value = self.value or ""
+        if self.operator == "=":
+            return actual == value
+        if self.operator == "|=":
+            return actual == value or actual.startswith(value + "-")
+        if not value:
+            return False  # ~=, ^=, $=, *= never match an empty value
+        if self.operator == "~=":
+            # Either whitespace definition (XPath for lxml, any whitespace for
+            # soupsieve): an extra region never changes what the backend matches
+            return value in _WHITESPACE_RE.split(actual) or value in actual.split()
+        if self.operator == "^=":
+            return actual.startswith(value)
+        if self.operator == "$=":
+            return actual.endswith(value)
+        return value in actual  # *=
+
+    def literal(self) -> Optional[bytes]:
+        """Lowercased text every matching start tag contains (None if unknown)."""
+        if self.operator == "!=":
+            return None
+        text = self.name if self.operator == "exists" else self.value or ""
+        if not _LITERAL_RE.fullmatch(text):
+            return None
+        return text.lower().encode("ascii")
+
+
+@dataclass(frozen=True)
+class _Anchor:
+    """Leftmost compound of a selector: tag name + attribute conditions."""
+
+    tag: str
+    conditions: Tuple[_AttrCondition, ...]
+
+    def matches(self, attrs: Dict[str, str]) -> bool:
+        return all(condition.matches(attrs) for condition in self.conditions)
+
+    def needle(self) -> bytes:
+        """Lowercased bytes to search for: longest literal, else "<tag"."""
+        literals = [lit for c in self.conditions if (lit := c.literal())]
+        if literals:
+            return max(literals, key=len)
+        return b"<" + self.tag.encode("ascii")
+
+
+class DocumentScope:
+    """
+    Extracts the regions of a page that a stage's selectors can match.
+
+    Args:
+        anchors: Anchor compounds of all document-level selectors.
+    """
+
+    def __init__(self, anchors: Iterable[_Anchor]):
+        self.anchors: Dict[str, List[_Anchor]] = {}
+        for anchor in anchors:
+            self.anchors.setdefault(anchor.tag, []).append(anchor)
+
+        # needle -> anchor tags it can identify
+        self._needles: Dict[bytes, Set[bytes]] = {}
+        for tag, tag_anchors in self.anchors.items():
+            for anchor in tag_anchors:
+                self._needles.setdefault(anchor.needle(), set()).add(
+                    tag.encode("ascii")
+                )
+
+        self._tag_re = {
+            tag: re.compile(rb"<(/?)" + re.escape(tag.encode("ascii")) + rb"(?=[\s/>])")
+            for tag in self.anchors
+        }
+
+    @property
+    def tags(self) -> List[str]:
+        return sorted(self.anchors)
+
+    def reduce(
+        self, content: bytes, encoding: str, prefix: bool = False
+    ) -> Optional[bytes]:
+        """
+        Return a document containing only the anchored regions of `content`.
+
+        Regions keep their document order; nested matches are part of the
+        enclosing region. Returns None if the page cannot be scoped safely
+        (the caller then parses the full page).
+
+        With `prefix`, `content` is the first part of a page still being
+        received: only the regions before the first one that is not complete
+        yet are returned.
+        """
+        if not _is_ascii_compatible(encoding):
+            return None
+
+        if prefix:
+            # Drop a trailing partial tag, so every start tag seen is complete
+            content = content[: content.rfind(b">") + 1]
+
+        # ASCII lowercasing keeps byte offsets
+        lowered = content.lower()
+        skipped = _SkippedRanges(lowered)
+        if skipped.ambiguous:
+            return None  # the backends may not parse it like the scan
+
+        regions = self._regions(content, lowered, encoding, skipped, prefix)
+        if not regions:
+            return None  # nothing to scope to: parse (or wait for) the page
+        return b"<html><body>" + b"".join(regions) + b"</body></html>"
+
+    def _regions(
+        self,
+        content: bytes,
+        lowered: bytes,
+        encoding: str,
+        skipped: _SkippedRanges,
+        prefix: bool,
+    ) -> Optional[List[bytes]]:
+        """Anchored regions in document order (None if one is not safe)."""
+        regions: List[bytes] = []
+        pos = 0
+
+        for start in self._candidates(lowered):
+            if start < pos or skipped.contains(start):
+                continue  # inside an earlier region, a comment or raw text
+
+            start_tag = _START_TAG_RE.match(content, start)
+            if start_tag is None or not self._is_anchor(start_tag, encoding):
+                continue
+
+            tag = start_tag.group(1).decode("ascii").lower()
+            end = self._region_end(lowered, tag, start_tag.end(), skipped)
+            if end is None:
+                if prefix:
+                    break  # region continues in bytes not received yet
+                return None  # unclosed region: cannot delimit it safely
+            if not self._is_balanced(lowered, start, end, skipped):
+                return None  # an ancestor's end tag closes the anchor early
+
+            regions.append(content[start:end])
+            pos = end
+
+        return regions
+
+    def _candidates(self, lowered: bytes) -> List[int]:
+        """Offsets of start tags that may be anchors, in document order."""
+        found: Set[int] = set()
+        for needle, tags in self._needles.items():
+            index = lowered.find(needle)
+            while index != -1:
+                start = self._tag_start(lowered, index, needle, tags)
+                if start is not None:
+                    found.add(start)
+                index = lowered.find(needle, index + 1)
+        return sorted(found)
+
+    @staticmethod
+    def _tag_start(
+        lowered: bytes, index: int, needle: bytes, tags: Set[bytes]
+    ) -> Optional[int]:
+        """Start of the anchor-tag start tag containing `needle` at `index`."""
+        if needle.startswith(b"<"):
+            candidates = [index]
+        else:
+            candidates = []
+            end = index
+            for _ in range(_MAX_LOOKBACK):
+                end = lowered.rfind(b"<", 0, end)
+                if end == -1:
+                    break
+                candidates.append(end)
+
+        for start in candidates:
+            for tag in tags:
+                after = start + 1 + len(tag)
+                if (
+                    lowered.startswith(tag, start + 1)
+                    and after < len(lowered)
+                    and lowered[after] in _TAG_NAME_END
+                ):
+                    return start
+        return None
+
+    def _is_anchor(self, start_tag: re.Match[bytes], encoding: str) -> bool:
+        tag = start_tag.group(1).decode("ascii").lower()
+        attrs = _parse_attributes(start_tag.group(0).decode(encoding, "replace"))
+        return any(anchor.matches(attrs) for anchor in self.anchors.get(tag, ()))
+
+    def _region_end(
+        self, lowered: bytes, tag: str, pos: int, skipped: _SkippedRanges
+    ) -> Optional[int]:
+        """Offset after the end tag closing the element opened before `pos`."""
+        depth = 1
+        for match in self._tag_re[tag].finditer(lowered, pos):
+            if skipped.contains(match.start()):
+                continue
+            depth += -1 if match.group(1) else 1
+            if depth == 0:
+                end = lowered.find(b">", match.end())
+                return end + 1 if end != -1 else None
+        return None
+
+    @staticmethod
+    def _is_balanced(
+        lowered: bytes, start: int, end: int, skipped: _SkippedRanges
+    ) -> bool:
+        """False if an end tag in [start, end) has no start tag in the range."""
+        open_tags: Counter[bytes] = Counter()
+        for match in _ANY_TAG_RE.finditer(lowered, start, end):
+            if skipped.contains(match.start()):
+                continue
+            name = match.group(2)
+            if not match.group(1):
+                open_tags[name] += 1
+            elif open_tags[name]:
+                open_tags[name] -= 1
+            else:
+                return False
+        return True
+
+
+class _SkippedRanges:
+    """
+    Byte ranges of comments, raw-text elements (script, style) and
+    text-only elements (_TEXT_ONLY).
+
+    `ambiguous` is set if a _TEXT_ONLY element is unclosed or holds markup.
+    """
+
+    def __init__(self, lowered: bytes):
+        closers = {**_SKIPPED, **_TEXT_ONLY}
+        openers = sorted(
+            (index, opener)
+            for opener in closers
+            for index in _find_all(lowered, opener)
+        )
+
+        self.ambiguous = False
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        end = -1
+        for start, opener in openers:
+            if start < end:
+                continue  # e.g. "<script" inside a comment
+            after = start + len(opener)
+            if opener != b"<!--":
+                if after < len(lowered) and lowered[after] not in _TAG_NAME_END:
+                    continue  # "<titles", "<scripted", ...
+
+            closer = closers[opener]
+            close = -1 if closer is None else lowered.find(closer, after)
+            if opener in _TEXT_ONLY and (
+                close == -1 or b"<" in lowered[lowered.find(b">", after) + 1 : close]
+            ):
+                self.ambiguous = True
+                return
+            end = len(lowered) if close == -1 else close + len(closer)
+            self._starts.append(start)
+            self._ends.append(end)
+
+    def contains(self, pos: int) -> bool:
+        index = bisect.bisect_right(self._starts, pos) - 1
+        return index >= 0 and pos < self._ends[index]
+
+
+def _find_all(haystack: bytes, needle: bytes) -> Iterable[int]:
+    index = haystack.find(needle)
+    while index != -1:
+        yield index
+        index = haystack.find(needle, index + 1)
+
+
+def compile_scope(selectors: Iterable[str]) -> Optional[DocumentScope]:
+    """
+    Compile a DocumentScope for document-level CSS selectors.
+
+    Returns None if any selector cannot be scoped (the stage then always
+    parses full pages).
+    """
+    anchors: List[_Anchor] = []
+    for css in selectors:
+        try:
+            parsed = parse_css(css)
+        except CssSelectorError:
+            return None
+
+        for selector in parsed:
+            if selector.pseudo_element is not None:
+                return None
+            anchor = _anchor_of(selector.parsed_tree)
+            if anchor is None:
+                return None
+            anchors.append(anchor)
+
+    if not anchors:
+        return None
+    return DocumentScope(anchors)
+
+
+def _anchor_of(tree: object) -> Optional[_Anchor]:
+    """Leftmost compound of a parsed selector (None if not scopable)."""
+    while isinstance(tree, CombinedSelector):
+        if tree.combinator not in _SCOPED_COMBINATORS:
+            return None
+        tree = tree.selector
+
+    conditions: List[_AttrCondition] = []
+    while not isinstance(tree, Element):
+        if isinstance(tree, Hash):
+            conditions.append(_AttrCondition("id", "=", tree.id))
+        elif isinstance(tree, Class):
+            conditions.append(_AttrCondition("class", "~=", tree.class_name))
+        elif (
+            isinstance(tree, Attrib)
+            and tree.namespace is None
+            and tree.operator in _OPERATORS
+        ):
+            value = tree.value.value if tree.value is not None else None
+            conditions.append(_AttrCondition(tree.attrib.lower(), tree.operator, value))
+        else:
+            return None  # pseudo-class, negation, ... (context dependent)
+        tree = tree.selector
+
+    tag = (tree.element or "").lower()
+    if tree.namespace is not None or tag not in _ANCHOR_TAGS:
+        return None
+
+    return _Anchor(tag=tag, conditions=tuple(conditions))
+
+
+def _parse_attributes(start_tag: str) -> Dict[str, str]:
+    """Attributes of a start tag (names lowercased, entities decoded)."""
+    body = start_tag[1:-1].split(None, 1)
+    attrs: Dict[str, str] = {}
+    if len(body) < 2:
+        return attrs
+
+    for match in _ATTR_RE.finditer(body[1]):
+        name = match.group(1).lower()
+        raw = next((g for g in match.groups()[1:] if g is not None), "")
+        # First occurrence wins (like the HTML parsers)
+        attrs.setdefault(name, html.unescape(raw))
+    return attrs
+
+
+def _is_ascii_compatible(encoding: str) -> bool:
+    try:
+        return "<div>".encode(codecs.lookup(encoding).name) == b"<div>"
+    except (LookupError, UnicodeError):
+        return False
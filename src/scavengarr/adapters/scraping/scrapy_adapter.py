@@ -3,22 +3,36 @@ Scrapy Engine for Scavengarr.
 
 Supports cascading scrape pipelines with:
 - Async HTTP via httpx.AsyncClient (injected from FastAPI)
-- Diskcache for URL deduplication & result caching
+- URL deduplication & per-stage result caching (CachePort)
 - Exponential backoff retry logic
-- CSS selector-based extraction
+- Per-host circuit breakers (fail fast while an indexer is down)
+- Streamed response bodies (size cap, early stop once selectors matched)
+- Per-host token-bucket rate limiting with adaptive (AIMD) pacing
+- Single-flight coalescing of identical in-flight page loads
+- CSS selector-based extraction (selectors compiled once, lxml by default)
+- Container-scoped partial parsing (only the regions selectors can match)
+- Parsing/extraction in a worker pool (ParsePool), off the event loop
 - Pagination & nested data extraction
+- Concurrent breadth-first crawl frontier
+- Plugins compiled once into immutable execution plans (shared by searches)
+- Streaming mode (iter_scrape) yielding items as pages finish
 """
 
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, List, Optional, Set
-from urllib.parse import urljoin
+import dataclasses
+import hashlib
+import time
+import weakref
+from contextlib import aclosing
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Set
+from urllib.parse import urljoin, urlsplit
 
 import httpx
 import structlog
-from bs4 import BeautifulSoup
-from diskcache import Cache
 
 from scavengarr.domain.plugins import (
     NestedSelector,
@@ -26,38 +40,212 @@ from scavengarr.domain.plugins import (
     SearchResult,
     YamlPluginDefinition,
 )
+from scavengarr.domain.ports import CachePort
+from scavengarr.infrastructure.http.circuit_breaker import (
+    CircuitOpenError,
+    HostCircuitBreakers,
+)
+from scavengarr.infrastructure.http.hedging import RequestHedger
+from scavengarr.infrastructure.http.mirrors import MirrorHealth
+from scavengarr.infrastructure.http.pacing import AdaptivePacer, parse_retry_after
+from scavengarr.infrastructure.http.rate_limiter import HostRateLimiter, host_of
+from scavengarr.infrastructure.http.single_flight import SingleFlight
+from scavengarr.infrastructure.parsing import ParsePool
+
+from .scoping import compile_scope
+from .selectors import (
+    CompiledSelector,
+    ParserBackend,
+    SelectorError,
+    SoupBackend,
+    declared_encoding,
+    get_backend,
+    sniff_encoding,
+)
+from .stage_cache import CachedStagePage, StageCache
 
 logger = structlog.get_logger(__name__)
 
 
+@dataclass(frozen=True)
+class _CrawlRequest:
+    """A page waiting in the crawl frontier."""
+
+    stage_name: str
+    url: str
+    depth: int
+    # Position in the link tree, used to merge results in document order
+    order: tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class PageExtraction:
+    """Extraction result of one fetched page (plain, picklable data)."""
+
+    # Extracted item, None if the stage conditions are not met
+    data: Optional[Dict[str, Any]]
+    links: List[str] = dataclasses.field(default_factory=list)
+    next_page: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class _CrawledItem:
+    """An item extracted by the crawl, tagged with its document position."""
+
+    stage_name: str
+    data: Dict[str, Any]
+    order: tuple[int, ...]
+    index: int
+
+
 class StageScraper:
     """
     Single scraping stage executor.
 
     Responsibilities:
-    - Extract data using CSS selectors
+    - Parse pages with the configured parser backend (only the regions the
+      selectors can match, if the stage's selectors allow it)
+    - Extract data using CSS selectors (compiled once per stage)
     - Extract links to next stage
     - Handle pagination
     """
 
-    def __init__(self, stage: ScrapingStage, base_url: str):
+    def __init__(
+        self,
+        stage: ScrapingStage,
+        base_url: str,
+        backend: Optional[ParserBackend] = None,
+        partial_parse: bool = True,
+    ):
         self.stage = stage
         self.base_url = base_url
         self.name = stage.name
         self.selectors = stage.selectors
+        self.backend = backend or get_backend()
+        self._compiled = self._compile_selectors()
+        self._required = frozenset(self._document_selectors())
+        self.scope = compile_scope(self._required) if partial_parse else None
+
+        # Reading a page can stop once every selector has matched: only if
+        # all document-level selectors are single-match (no link list) and
+        # the matches can be delimited in the raw bytes (document scope)
+        self.early_stop = self.scope is not None and not self.selectors.link
+        logger.debug(
+            "stage_partial_parse",
+            stage=self.name,
+            enabled=self.scope is not None,
+            early_stop=self.early_stop,
+            anchor_tags=self.scope.tags if self.scope is not None else [],
+        )
+
+        # Fixed stage URL resolved once (url_pattern is formatted per search)
+        self._static_url = urljoin(base_url, stage.url) if stage.url else None
+
+    def _document_selectors(self) -> Set[str]:
+        """CSS selectors applied to the whole document (not to a container)."""
+        sel = self.selectors
+        found = {
+            sel.link,
+            sel.title,
+            sel.description,
+            sel.release_name,
+            sel.download_link,
+            sel.seeders,
+            sel.leechers,
+            sel.size,
+            sel.published_date,
+            *sel.custom.values(),
+        }
+
+        if sel.download_links:
+            found.add(sel.download_links.container)
+
+        if self.stage.pagination and self.stage.pagination.selector:
+            found.add(self.stage.pagination.selector)
+
+        found.discard(None)
+        return found
+
+    def _selector_strings(self) -> Set[str]:
+        """All CSS selectors used by this stage."""
+        found = self._document_selectors()
 
-    def build_url(self, url: Optional[str] = None, **url_params: Any) -> str:
-        """Build URL from template or use provided URL."""
+        if self.selectors.download_links:
+            nested = self.selectors.download_links
+            found.update({nested.item_group, nested.items})
+            found.update(nested.fields.values())
+
+        found.discard(None)
+        return found
+
+    def _compile_selectors(self) -> Dict[str, CompiledSelector]:
+        """
+        Compile all selectors once.
+        Falls back to BeautifulSoup if the backend cannot handle a selector.
+        """
+        try:
+            return {css: self.backend.compile(css) for css in self._selector_strings()}
+        except SelectorError as e:
+            if isinstance(self.backend, SoupBackend):
+                raise ValueError(f"Stage '{self.name}': {e}") from e
+
+            logger.warning(
+                "selector_backend_fallback",
+                stage=self.name,
+                backend=self.backend.name,
+                fallback="bs4",
+                error=str(e),
+            )
+            self.backend = SoupBackend()
+            return self._compile_selectors()
+
+    def parse(self, content: bytes, encoding: Optional[str] = None) -> Any:
+        """
+        Parse page content with this stage's backend.
+
+        With a document scope, only the regions the stage's selectors can
+        match are parsed (the full page if they cannot be delimited).
+        """
+        if self.scope is not None:
+            encoding = sniff_encoding(content, encoding)
+            scoped = self.scope.reduce(content, encoding)
+            if scoped is not None:
+                return self.backend.parse(scoped, encoding)
+
+        return self.backend.parse(content, encoding)
+
+    def _select_one(self, node: Any, css: str) -> Optional[Any]:
+        return self.backend.select_one(node, self._compiled[css])
+
+    def _select(self, node: Any, css: str) -> List[Any]:
+        return self.backend.select(node, self._compiled[css])
+
+    def build_url(
+        self,
+        url: Optional[str] = None,
+        *,
+        base_url: Optional[str] = None,
+        **url_params: Any,
+    ) -> str:
+        """
+        Build URL from template or use provided URL.
+
+        Relative templates resolve against `base_url` (the mirror a search
+        uses; default: the plugin's base_url).
+        """
         if url:
             return url
 
-        if self.stage.url:
-            return urljoin(self.base_url, self.stage.url)
+        base_url = base_url or self.base_url
+        if self._static_url:
+            if base_url == self.base_url:
+                return self._static_url
+            return urljoin(base_url, self.stage.url)
 
         if self.stage.url_pattern:
             try:
                 path = self.stage.url_pattern.format(**url_params)
-                return urljoin(self.base_url, path)
+                return urljoin(base_url, path)
             except KeyError as e:
                 raise ValueError(
                     f"Stage '{self.name}': Missing URL parameter {e} for pattern '{self.stage.url_pattern}'"
@@ -65,7 +253,24 @@ class StageScraper:
 
         raise ValueError(f"Stage '{self.name}': No URL or url_pattern defined")
 
-    def extract_data(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def build_page_url(
+        self, page: int, *, base_url: Optional[str] = None, **url_params: Any
+    ) -> str:
+        """Build the URL of pagination page `page` from pagination.url_pattern."""
+        pattern = self.stage.pagination.url_pattern if self.stage.pagination else None
+        if not pattern:
+            raise ValueError(f"Stage '{self.name}': No pagination url_pattern defined")
+
+        try:
+            path = pattern.format(**{**url_params, "page": page})
+            return urljoin(base_url or self.base_url, path)
+        except KeyError as e:
+            raise ValueError(
+                f"Stage '{self.name}': Missing URL parameter {e} "
+                f"for pagination pattern '{pattern}'"
+            )
+
+    def extract_data(self, doc: Any) -> Dict[str, Any]:
         """
         Extract data from page using selectors.
         """
@@ -87,8 +292,8 @@ class StageScraper:
             if not selector:
                 continue
 
-            elem = soup.select_one(selector)
-            if not elem:
+            elem = self._select_one(doc, selector)
+            if elem is None:
                 continue
 
             if extract_type == "attribute":
@@ -97,18 +302,18 @@ class StageScraper:
                 data[field] = self._extract_from_attributes(elem, attrs, field)
             else:
                 # Text-Extraktion
-                data[field] = elem.get_text(strip=True)
+                data[field] = self.backend.text(elem)
 
         # Custom fields (alle als text)
         for field, selector in self.selectors.custom.items():
-            elem = soup.select_one(selector)
-            if elem:
-                data[field] = elem.get_text(strip=True)
+            elem = self._select_one(doc, selector)
+            if elem is not None:
+                data[field] = self.backend.text(elem)
 
         # Nested selectors
         if self.selectors.download_links:
             data["download_links"] = self._extract_nested(
-                soup, self.selectors.download_links
+                doc, self.selectors.download_links
             )
 
         return data
@@ -123,7 +328,7 @@ class StageScraper:
         return self.stage.field_attributes.get(field_name, [])
 
     def _extract_nested(
-        self, soup: BeautifulSoup, nested_config: NestedSelector
+        self, doc: Any, nested_config: NestedSelector
     ) -> List[Dict[str, Any]]:
         """
         Generic nested extraction with optional grouping.
@@ -133,9 +338,9 @@ class StageScraper:
         2. item_group SET: All 'items' within each group = 1 merged result
         """
         results = []
-        container = soup.select_one(nested_config.container)
+        container = self._select_one(doc, nested_config.container)
 
-        if not container:
+        if container is None:
             logger.warning(
                 "nested_container_not_found",
                 stage=self.name,
@@ -145,12 +350,12 @@ class StageScraper:
 
         # MODE 1: Grouped extraction
         if nested_config.item_group:
-            groups = container.select(nested_config.item_group)
+            groups = self._select(container, nested_config.item_group)
 
             for group in groups:
                 merged_data = {}
 
-                for item in group.select(nested_config.items):
+                for item in self._select(group, nested_config.items):
                     item_data = self._extract_item_fields(item, nested_config)
                     # Merge fields (with multi-value support)
                     merged_data = self._merge_item_data(
@@ -169,7 +374,7 @@ class StageScraper:
 
         # MODE 2: Direct extraction
         else:
-            for item in container.select(nested_config.items):
+            for item in self._select(container, nested_config.items):
                 item_data = self._extract_item_fields(item, nested_config)
 
                 if item_data:
@@ -192,8 +397,8 @@ class StageScraper:
         item_data = {}
 
         for field_name, field_selector in nested_config.fields.items():
-            elem = item.select_one(field_selector)
-            if not elem:
+            elem = self._select_one(item, field_selector)
+            if elem is None:
                 continue
 
             # Link/URL extraction via attributes
@@ -202,7 +407,7 @@ class StageScraper:
                 value = self._extract_from_attributes(elem, attrs, field_name)
             else:
                 # Text extraction
-                value = elem.get_text(strip=True)
+                value = self.backend.text(elem)
 
             if value:
                 item_data[field_name] = value
@@ -281,26 +486,43 @@ class StageScraper:
             stage=self.name,
             field=field_name,
             tried_attributes=attributes,
-            element_preview=str(elem)[:200],
+            element_preview=self.backend.html(elem)[:200],
         )
         return None
 
-    def extract_links(self, soup: BeautifulSoup) -> List[str]:
+    def extract_links(self, doc: Any, base_url: Optional[str] = None) -> List[str]:
         """
         Extract links to next stage (for list stages).
-        Uses selectors.link to find all elements.
+        Uses selectors.link to find all elements; relative links resolve
+        against `base_url` (the mirror the page came from).
         """
         if not self.selectors.link:
             return []
 
+        base_url = base_url or self.base_url
         links = []
-        for elem in soup.select(self.selectors.link):
+        for elem in self._select(doc, self.selectors.link):
             href = elem.get("href")
             if href:
-                links.append(urljoin(self.base_url, href))
+                links.append(urljoin(base_url, href))
 
         return links
 
+    def extract_next_page(
+        self, doc: Any, base_url: Optional[str] = None
+    ) -> Optional[str]:
+        """Extract the "next page" URL (pagination selector), if any."""
+        pagination = self.stage.pagination
+        if not pagination or not pagination.selector:
+            return None
+
+        elem = self._select_one(doc, pagination.selector)
+        if elem is None:
+            return None
+
+        href = elem.get("href")
+        return urljoin(base_url or self.base_url, href) if href else None
+
     def should_process(self, data: Dict[str, Any]) -> bool:
         """
         Check if stage conditions are met.
@@ -326,6 +548,257 @@ class StageScraper:
 
         return True
 
+    def extract_page(
+        self,
+        content: bytes,
+        encoding: Optional[str],
+        url: str,
+        base_url: Optional[str] = None,
+    ) -> PageExtraction:
+        """
+        Parse a fetched page and run this stage's extraction on it.
+
+        Synchronous and CPU-bound: runs in the ParsePool. Only plain data
+        leaves this method, never the parsed document. Links resolve
+        against `base_url` (the mirror `url` was fetched from).
+        """
+        return self._extract(self.parse(content, encoding), url, base_url)
+
+    def extract_prefix(
+        self,
+        content: bytes,
+        encoding: Optional[str],
+        url: str,
+        base_url: Optional[str] = None,
+    ) -> Optional[PageExtraction]:
+        """
+        Extract a page from its first bytes, if they are enough.
+
+        Only for early_stop stages: once every selector matches inside the
+        complete regions of `content`, these are the elements the selectors
+        match in the full page, and the result equals extract_page() on it.
+        Returns None while more of the page is needed. Runs in the ParsePool.
+        """
+        if not self.early_stop:
+            return None
+
+        # Without a declared encoding, sniffing depends on the whole page
+        encoding = declared_encoding(content, encoding)
+        if encoding is None:
+            return None
+
+        scoped = self.scope.reduce(content, encoding, prefix=True)
+        if scoped is None:
+            return None
+
+        doc = self.backend.parse(scoped, encoding)
+        if any(self._select_one(doc, css) is None for css in self._required):
+            return None
+        return self._extract(doc, url, base_url)
+
+    def _extract(
+        self, doc: Any, url: str, base_url: Optional[str] = None
+    ) -> PageExtraction:
+        """Run this stage's extraction on a parsed page."""
+        data = self.extract_data(doc)
+        data["source_url"] = url
+
+        pagination = self.stage.pagination
+        follows_links = pagination and pagination.enabled and not pagination.url_pattern
+        next_page = self.extract_next_page(doc, base_url) if follows_links else None
+
+        # Check conditions
+        if not self.should_process(data):
+            logger.debug("stage_conditions_not_met", stage=self.name, data=data)
+            return PageExtraction(data=None, next_page=next_page)
+
+        return PageExtraction(
+            data=data, links=self.extract_links(doc, base_url), next_page=next_page
+        )
+
+
+@dataclass(frozen=True)
+class ExecutionPlan:
+    """
+    Compiled, immutable form of a plugin's scrape pipeline.
+
+    Holds the stage graph (stage executors with compiled selectors and URL
+    templates) and the start stage. Built once per plugin via get_plan() and
+    shared by every search on that plugin; per-search state lives in
+    CrawlContext.
+    """
+
+    plugin_name: str
+    base_url: str
+    stages: Mapping[str, StageScraper]
+    start_stage: str
+    # Digest of the plugin definition (identifies the plan across processes)
+    fingerprint: str
+
+    @classmethod
+    def compile(cls, plugin: YamlPluginDefinition) -> ExecutionPlan:
+        """Compile all stages of `plugin` (selectors for its parser backend)."""
+        base_url = str(plugin.base_url)
+        backend = get_backend(plugin.scraping.parser)
+
+        stages = {
+            stage_config.name: StageScraper(
+                stage_config,
+                base_url,
+                backend,
+                partial_parse=plugin.scraping.partial_parse,
+            )
+            for stage_config in plugin.scraping.stages or []
+        }
+
+        return cls(
+            plugin_name=str(getattr(plugin, "name", "unknown")),
+            base_url=base_url,
+            stages=MappingProxyType(stages),
+            start_stage=plugin.scraping.start_stage or next(iter(stages)),
+            fingerprint=hashlib.sha256(
+                plugin.model_dump_json().encode("utf-8")
+            ).hexdigest(),
+        )
+
+
+# Plans per plugin object: id(plugin) -> (weakref to plugin, plan).
+# Entries are dropped when the plugin definition is garbage collected.
+_plans: Dict[int, tuple[weakref.ref, ExecutionPlan]] = {}
+
+
+def get_plan(plugin: YamlPluginDefinition) -> ExecutionPlan:
+    """Return the execution plan of `plugin`, compiling it on first use."""
+    key = id(plugin)
+    entry = _plans.get(key)
+    if entry is not None and entry[0]() is plugin:
+        return entry[1]
+
+    plan = ExecutionPlan.compile(plugin)
+    _plans[key] = (weakref.ref(plugin), plan)
+    weakref.finalize(plugin, _plans.pop, key, None)
+
+    logger.info(
+        "execution_plan_compiled",
+        plugin=plan.plugin_name,
+        start_stage=plan.start_stage,
+        total_stages=len(plan.stages),
+    )
+    return plan
+
+
+# Plans compiled inside ParsePool worker processes: fingerprint -> plan.
+# Jobs carry the plugin definition, which is unpickled as a new object per
+# job, so worker plans are looked up by content instead of identity.
+_worker_plans: Dict[str, ExecutionPlan] = {}
+_MAX_WORKER_PLANS = 64
+
+
+def extract_in_worker(
+    plugin: YamlPluginDefinition,
+    fingerprint: str,
+    stage_name: str,
+    job: str,
+    content: bytes,
+    encoding: Optional[str],
+    url: str,
+    base_url: Optional[str] = None,
+) -> Optional[PageExtraction]:
+    """
+    ParsePool job for process workers: run StageScraper method `job`
+    ("extract_page" or "extract_prefix") with `plugin`'s plan.
+    """
+    plan = _worker_plans.get(fingerprint)
+    if plan is None:
+        if len(_worker_plans) >= _MAX_WORKER_PLANS:
+            _worker_plans.clear()
+        plan = _worker_plans[fingerprint] = ExecutionPlan.compile(plugin)
+    return getattr(plan.stages[stage_name], job)(content, encoding, url, base_url)
+
+
+# Longer server-requested waits give the page up instead of blocking the search
+_MAX_RETRY_AFTER_SECONDS = 30.0
+
+# Body size at which an early_stop stage first checks whether the bytes read
+# so far are enough; the next check happens once the size has doubled
+_EARLY_STOP_FIRST_CHECK = 16 * 1024
+
+
+@dataclass(frozen=True)
+class _FetchedPage:
+    """A fetched page: the body read (possibly only a prefix) and metadata."""
+
+    status_code: int
+    headers: httpx.Headers
+    content: bytes = b""
+    encoding: Optional[str] = None
+    # Extraction done while reading, if the stage stopped reading early
+    extraction: Optional[PageExtraction] = None
+    # URL actually fetched (another mirror's after a failover)
+    url: Optional[str] = None
+    # Body cut at scraping.max_response_bytes (not the whole page)
+    truncated: bool = False
+
+
+class CrawlIncompleteError(Exception):
+    """Raised by iter_scrape() after its last item if pages had to be skipped.
+
+    scrape() attaches the results it collected before the error (`results`).
+    """
+
+    def __init__(
+        self,
+        skipped_urls: List[str],
+        results: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    ) -> None:
+        super().__init__(f"{len(skipped_urls)} page(s) skipped (circuit open)")
+        self.skipped_urls = skipped_urls
+        self.results = results or {}
+
+
+@dataclass
+class CrawlContext:
+    """Mutable state of a single scrape (never shared between searches)."""
+
+    visited_urls: Set[str] = dataclasses.field(default_factory=set)
+
+    # URL template parameters of this search (query, category, ...)
+    url_params: Dict[str, Any] = dataclasses.field(default_factory=dict)
+
+    # Mirror (base URL) this search uses; changes on failover
+    # (None = the plugin's base_url)
+    base_url: Optional[str] = None
+
+    # Terminal-stage items the caller needs (None = crawl everything)
+    item_budget: Optional[int] = None
+    terminal_items: int = 0
+
+    # Pages loaded so far, and pages skipped because their host's circuit
+    # opened mid-crawl (the results are incomplete)
+    pages_loaded: int = 0
+    skipped_urls: List[str] = dataclasses.field(default_factory=list)
+
+    def wants_more(self, pending: int = 0) -> bool:
+        """
+        True while the item budget is not met, counting `pending` items that
+        have been extracted but not yet recorded.
+        """
+        return (
+            self.item_budget is None or self.terminal_items + pending < self.item_budget
+        )
+
+    def record_items(self, count: int) -> None:
+        """Count items extracted by a terminal stage towards the budget."""
+        self.terminal_items += count
+
+    def claim(self, url: str) -> bool:
+        """Mark URL as visited. Returns False if it was already visited."""
+        if url in self.visited_urls:
+            logger.debug("url_already_visited", url=url)
+            return False
+        self.visited_urls.add(url)
+        return True
+
 
 class ScrapyAdapter:
     """
@@ -334,26 +807,48 @@ class ScrapyAdapter:
     Orchestrates cascading stages:
     1. Load plugin config
     2. Execute start stage
-    3. Follow links to next stages recursively
-    4. Aggregate results
+    3. Follow links to next stages (breadth-first, bounded concurrency)
+    4. Aggregate results (scrape) or stream them as pages finish (iter_scrape)
     5. Normalize to SearchResult
 
     Features:
     - Async HTTP via httpx.AsyncClient (injected)
-    - Diskcache for visited URL tracking
+    - Stage-output cache via CachePort (per-stage cache_ttl)
     - Exponential backoff retry logic
-    - Rate limiting via asyncio.sleep
+    - Per-host circuit breaker (shared HostCircuitBreakers): while a host's
+      circuit is open, fetches fail immediately with CircuitOpenError (the
+      search fails on its start page; later pages are skipped)
+    - Per-host token-bucket rate limiting (shared HostRateLimiter), paced
+      adaptively (shared AdaptivePacer: slows down on 429/503/Retry-After)
+    - Identical concurrent page loads share one fetch (shared SingleFlight)
+    - Concurrent crawl frontier (scraping.max_concurrency workers)
+    - Result budget: link/page expansion stops once enough terminal-stage
+      items exist (max_results); per-stage max_links caps links per page
+      (unset: 10, or the result budget if larger)
+    - Parse+extract in an injected ParsePool (thread/process), so large
+      pages do not stall the event loop
+    - Stateless between searches: stages come from the plugin's cached
+      ExecutionPlan, per-search state lives in a CrawlContext, so one adapter
+      can serve concurrent searches
     """
 
     def __init__(
         self,
         plugin: YamlPluginDefinition,
         http_client: httpx.AsyncClient,
-        cache: Cache,
-        delay_seconds: float = 1.5,
+        cache: Optional[CachePort],
+        delay_seconds: Optional[float] = None,
         max_depth: int = 5,
         max_retries: int = 3,
         retry_backoff_base: float = 2.0,
+        max_concurrency: Optional[int] = None,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        parse_pool: Optional[ParsePool] = None,
+        single_flight: Optional[SingleFlight] = None,
+        circuit_breakers: Optional[HostCircuitBreakers] = None,
+        pacer: Optional[AdaptivePacer] = None,
+        hedger: Optional[RequestHedger] = None,
+        mirror_health: Optional[MirrorHealth] = None,
     ):
         if plugin.scraping.mode != "scrapy":
             raise ValueError(
@@ -366,51 +861,173 @@ class ScrapyAdapter:
         self.plugin_name = str(getattr(plugin, "name", "unknown"))
 
         self.base_url = str(plugin.base_url)
-        self.delay = delay_seconds
         self.max_depth = max_depth
         self.max_retries = max_retries
         self.retry_backoff_base = retry_backoff_base
+        self.max_concurrency = max_concurrency or plugin.scraping.max_concurrency
 
-        # Build stage executors
-        self.stages: Dict[str, StageScraper] = {}
-        for stage_config in plugin.scraping.stages or []:
-            self.stages[stage_config.name] = StageScraper(stage_config, self.base_url)
-
-        self.start_stage_name = (
-            plugin.scraping.start_stage or list(self.stages.keys())[0]
-        )
+        # Compiled execution plan (stage graph + selectors), shared by all
+        # adapters/searches of this plugin
+        self.plan = get_plan(plugin)
+        self.stages = self.plan.stages
+        self.start_stage_name = self.plan.start_stage
 
         # HTTP client (injected from FastAPI)
         self.client = http_client
 
-        # Diskcache for visited URLs
-        self.cache = cache
+        # Mirrors (base_url first): each search uses the best-scoring one,
+        # fetches fail over to the others (scores are process-wide)
+        self.mirrors = plugin.mirror_urls()
+        self._mirror_bases = {host_of(m): m for m in reversed(self.mirrors)}
+        self.mirror_health = mirror_health or MirrorHealth()
+
+        # Rate limiting: process-wide limiter (shared with other adapters and
+        # the link validator), paced adaptively for each of this plugin's
+        # hosts between its configured rate and scraping.max_rate
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.pacer = pacer or AdaptivePacer(self.rate_limiter)
+        for host in self._mirror_bases:
+            self.pacer.configure(
+                host,
+                rate=plugin.scraping.requests_per_second(delay_seconds),
+                burst=plugin.scraping.burst,
+                max_rate=plugin.scraping.max_rate,
+            )
 
-        # FIX: Use Set for visited URLs (nicht dict.keys())
-        self.visited_urls: Set[str] = set()
+        # Failure tracking per host: process-wide, so every search sees that
+        # an indexer is down
+        self.circuit_breakers = circuit_breakers or HostCircuitBreakers()
+
+        # Latency percentiles per host for hedged requests
+        # (scraping.hedge_percentile); process-wide like the breakers
+        self.hedger = hedger or RequestHedger()
+
+        # Parse+extract runs in this pool (None: on the event loop)
+        self.parse_pool = parse_pool
+
+        # Request coalescing: process-wide (shared with other adapters), so
+        # concurrent searches loading the same page share one fetch
+        self.single_flight = single_flight or SingleFlight()
+
+        # Stage-output cache (extracted data per URL, TTL per stage)
+        self.cache = cache
+        self.stage_cache = (
+            StageCache(cache, self.plugin_name) if cache is not None else None
+        )
 
         logger.info(
             "scrapy_adapter_initialized",
             plugin=self.plugin_name,
             start_stage=self.start_stage_name,
             total_stages=len(self.stages),
+            max_concurrency=self.max_concurrency,
+            mirrors=len(self.mirrors),
         )
 
-    async def _fetch_page(self, url: str) -> Optional[BeautifulSoup]:
+    def select_mirror(self) -> str:
+        """Base URL of the mirror a new search should use (best score)."""
+        if len(self.mirrors) == 1:
+            return self.mirrors[0]
+        mirror = self.mirror_health.rank(self.mirrors)[0]
+        logger.debug("mirror_selected", plugin=self.plugin_name, mirror=mirror)
+        return mirror
+
+    def _mirror_base(self, url: str) -> Optional[str]:
+        """The plugin mirror serving `url` (None if it is on another host)."""
+        return self._mirror_bases.get(host_of(url))
+
+    def _mirror_candidates(self, url: str) -> List[str]:
+        """`url`, then the same page on the other mirrors (best first)."""
+        current = self._mirror_base(url)
+        if current is None or len(self.mirrors) == 1:
+            return [url]
+
+        candidates = [url]
+        for mirror in self.mirror_health.rank(self.mirrors):
+            if mirror == current:
+                continue
+            if url.startswith(current):
+                candidates.append(mirror + url[len(current) :])
+            else:
+                target = urlsplit(mirror)
+                candidates.append(
+                    urlsplit(url)
+                    ._replace(scheme=target.scheme, netloc=target.netloc)
+                    .geturl()
+                )
+        return candidates
+
+    def _record_mirror(
+        self, url: str, success: bool, latency: Optional[float] = None
+    ) -> None:
+        """Feed a request outcome to the mirror score (plugin hosts only)."""
+        if self._mirror_base(url) is not None:
+            self.mirror_health.record(url, success=success, latency=latency)
+
+    async def _fetch_response(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        stage: Optional[StageScraper] = None,
+    ) -> Optional[_FetchedPage]:
         """
-        Fetch page with rate limiting, retry logic, and loop detection.
-        Returns BeautifulSoup object or None on failure.
+        GET `url` with rate limiting and retry logic.
+
+        The body is streamed (see _read_body); with `stage`, reading may stop
+        as soon as the stage has everything it extracts.
+
+        Returns the page (2xx, or 304 for conditional requests) or None on
+        failure. 5xx, 429 and network errors are retried with exponential
+        backoff (at least the server's Retry-After). Every attempt's outcome
+        feeds the host's circuit breaker (5xx and network errors count as
+        failures) and adaptive pacing. Slow attempts may be hedged (see
+        _send_hedged).
+
+        For a page on one of the plugin's mirrors, a connection error or an
+        open circuit fails over to the same page on the next-best mirror
+        right away, without spending the retry budget; the last mirror gets
+        the full retries. The page's `url` tells which mirror served it.
+
+        Raises:
+            CircuitOpenError: The host's circuit is open (checked before
+                every attempt, so retries stop as soon as it opens) and no
+                other mirror is left.
         """
-        # Loop detection via Set
-        if url in self.visited_urls:
-            logger.debug("url_already_visited", url=url)
-            return None
+        candidates = self._mirror_candidates(url)
+        for index, candidate in enumerate(candidates[:-1]):
+            try:
+                return await self._fetch_with_retries(
+                    candidate, headers, stage, failover=True
+                )
+            except (httpx.ConnectError, httpx.ConnectTimeout, CircuitOpenError) as e:
+                logger.warning(
+                    "mirror_failover",
+                    url=candidate,
+                    next_mirror=self._mirror_base(candidates[index + 1]),
+                    error=str(e) or type(e).__name__,
+                )
 
+        return await self._fetch_with_retries(candidates[-1], headers, stage)
+
+    async def _fetch_with_retries(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        stage: Optional[StageScraper],
+        failover: bool = False,
+    ) -> Optional[_FetchedPage]:
+        """
+        GET `url` with retries (see _fetch_response).
+
+        With `failover`, connection errors are raised instead of retried.
+        """
         # Exponential backoff retry
         for attempt in range(self.max_retries):
             try:
-                # Rate limiting
-                await asyncio.sleep(self.delay)
+                self.circuit_breakers.before_request(url)
+
+                # Rate limiting (no wait if the host has been idle)
+                await self.pacer.acquire(url)
 
                 logger.debug(
                     "http_request_start",
@@ -419,41 +1036,23 @@ class ScrapyAdapter:
                     max_retries=self.max_retries,
                 )
 
-                response = await self.client.get(url)
-                response.raise_for_status()
-
-                # Mark URL as visited
-                self.visited_urls.add(url)
-
-                logger.info("page_fetched", url=url, status_code=response.status_code)
-
-                return BeautifulSoup(response.content, "html.parser")
+                return await self._send_hedged(url, headers, stage)
 
             except httpx.HTTPStatusError as e:
+                status = e.response.status_code
                 logger.warning(
                     "http_status_error",
                     url=url,
-                    status_code=e.response.status_code,
+                    status_code=status,
                     attempt=attempt + 1,
                 )
+                retry_after = await self._record_status_error(url, e.response)
 
-                # Don't retry on 4xx errors (client errors)
-                if 400 <= e.response.status_code < 500:
-                    logger.error(
-                        "client_error_no_retry", url=url, status=e.response.status_code
-                    )
-                    return None
-
-                # Retry on 5xx errors
-                if attempt < self.max_retries - 1:
-                    backoff = self.retry_backoff_base**attempt
-                    logger.info(
-                        "retrying_after_backoff", url=url, backoff_seconds=backoff
-                    )
-                    await asyncio.sleep(backoff)
-                else:
-                    logger.error("max_retries_exceeded", url=url)
+                # Don't retry on 4xx errors (client errors), except 429
+                if 400 <= status < 500 and status != 429:
+                    logger.error("client_error_no_retry", url=url, status=status)
                     return None
+                error = f"HTTP {status}"
 
             except httpx.RequestError as e:
                 logger.warning(
@@ -462,161 +1061,772 @@ class ScrapyAdapter:
                     error=str(e),
                     attempt=attempt + 1,
                 )
+                self.circuit_breakers.record(url, success=False)
+                self._record_mirror(url, success=False)
+                if failover and isinstance(
+                    e, (httpx.ConnectError, httpx.ConnectTimeout)
+                ):
+                    raise
+                retry_after = None
+                error = str(e)
+
+            if attempt == self.max_retries - 1:
+                logger.error("max_retries_exceeded", url=url, error=error)
+                return None
+
+            if retry_after is not None and retry_after > _MAX_RETRY_AFTER_SECONDS:
+                logger.error("retry_after_too_long", url=url, retry_after=retry_after)
+                return None
+
+            backoff = max(self.retry_backoff_base**attempt, retry_after or 0.0)
+            logger.info("retrying_after_backoff", url=url, backoff_seconds=backoff)
+            await asyncio.sleep(backoff)
+
+        return None
+
+    async def _send_hedged(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        stage: Optional[StageScraper],
+    ) -> _FetchedPage:
+        """
+        Send one GET, plus a duplicate if it is slow (scraping.hedge_percentile).
+
+        If the request has not finished after the host's latency percentile,
+        one duplicate is sent - only if the host's circuit is closed and its
+        rate limit has a token to spare right now, so hedging never exceeds
+        the budget or adds load to a failing host. The first
+        successful answer wins and the other request is cancelled; errors
+        are raised only when both fail.
+        """
+        percentile = self.plugin.scraping.hedge_percentile
+        delay = self.hedger.hedge_delay(url, percentile) if percentile else None
+        if delay is None:
+            return await self._send(url, headers, stage)
+
+        primary = asyncio.create_task(self._send(url, headers, stage))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return primary.result()
+
+            if self.circuit_breakers.breaker(url).state != "closed":
+                logger.debug("hedge_skipped_circuit", url=url)
+                return await primary
+
+            if not self.rate_limiter.try_acquire(url):
+                self.hedger.record_skipped(url)
+                return await primary
+
+            self.hedger.record_hedge(url)
+            logger.debug("request_hedged", url=url, after_ms=round(delay * 1000, 1))
+            hedge = asyncio.create_task(self._send(url, headers, stage))
+            tasks.add(hedge)
+
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.hedger.record_win(url)
+                        return task.result()
+            return primary.result()  # both failed
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _send(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        stage: Optional[StageScraper],
+    ) -> _FetchedPage:
+        """Send one GET (raises httpx errors; records a success)."""
+        started = time.monotonic()
+        async with self.client.stream("GET", url, headers=headers) as response:
+            latency = time.monotonic() - started
+            if response.status_code == 304:
+                logger.info("page_not_modified", url=url)
+                page = _FetchedPage(304, response.headers, url=url)
+            else:
+                response.raise_for_status()
+                page = await self._read_body(response, url, stage)
+                logger.info(
+                    "page_fetched",
+                    url=url,
+                    status_code=page.status_code,
+                    bytes_read=len(page.content),
+                )
 
-                if attempt < self.max_retries - 1:
-                    backoff = self.retry_backoff_base**attempt
-                    logger.info(
-                        "retrying_after_backoff", url=url, backoff_seconds=backoff
+        self.circuit_breakers.record(url, success=True)
+        self._record_mirror(url, success=True, latency=latency)
+        self.hedger.observe(url, time.monotonic() - started)
+        await self.pacer.record(url, page.status_code, latency=latency)
+        return page
+
+    async def _record_status_error(
+        self, url: str, response: httpx.Response
+    ) -> Optional[float]:
+        """Feed an error response to breaker and pacing; returns Retry-After."""
+        status = response.status_code
+        # A 4xx still means the host is up
+        self.circuit_breakers.record(url, success=status < 500)
+        self._record_mirror(url, success=status < 500)
+
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        await self.pacer.record(url, status, retry_after=retry_after)
+        return retry_after
+
+    async def _read_body(
+        self, response: httpx.Response, url: str, stage: Optional[StageScraper]
+    ) -> _FetchedPage:
+        """
+        Read a streamed response body, stopping as early as possible.
+
+        - After scraping.max_response_bytes the rest is not read; the page is
+          extracted from the bytes read (parsers tolerate a truncated page),
+          but not stored in the stage cache.
+        - For early_stop stages, the bytes read are checked in the parse pool
+          at doubling sizes (16 KiB, 32 KiB, ...; at most about two extra
+          scans of the page); once every selector has matched, the extraction
+          of the prefix is the page's extraction and reading stops.
+        """
+        limit = self.plugin.scraping.max_response_bytes
+        encoding = response.charset_encoding
+        check_at = (
+            _EARLY_STOP_FIRST_CHECK if stage is not None and stage.early_stop else None
+        )
+
+        body = bytearray()
+        truncated = False
+        async for chunk in response.aiter_bytes():
+            body += chunk
+            if limit is not None and len(body) > limit:
+                del body[limit:]
+                truncated = True
+                logger.warning("response_truncated", url=url, max_bytes=limit)
+                break
+
+            if check_at is not None and len(body) >= check_at:
+                check_at = 2 * len(body)
+                extraction = await self._run_stage_job(
+                    stage, "extract_prefix", bytes(body), encoding, url
+                )
+                if extraction is not None:
+                    logger.debug("response_early_stop", url=url, bytes_read=len(body))
+                    return _FetchedPage(
+                        response.status_code,
+                        response.headers,
+                        bytes(body),
+                        encoding,
+                        extraction,
+                        url,
                     )
-                    await asyncio.sleep(backoff)
-                else:
-                    logger.error("max_retries_exceeded", url=url, error=str(e))
-                    return None
 
-        return None
+        return _FetchedPage(
+            response.status_code,
+            response.headers,
+            bytes(body),
+            encoding,
+            url=url,
+            truncated=truncated,
+        )
 
     async def scrape_stage(
         self,
         stage_name: str,
         url: Optional[str] = None,
         depth: int = 0,
+        context: Optional[CrawlContext] = None,
         **url_params: Any,
     ) -> Dict[str, List[Dict[str, Any]]]:
         """
-        Execute single stage (recursively).
+        Execute a stage and crawl all stages reachable from it.
+
+        Links to next stages are expanded breadth-first by a bounded pool of
+        workers (scraping.max_concurrency), so sibling detail pages are fetched
+        in parallel instead of one after another.
 
         Returns Dict[stage_name, List[items]] for aggregation.
         """
+        if stage_name not in self.stages:
+            logger.error("stage_not_found", stage=stage_name)
+            return {}
+
+        context = context or CrawlContext()
+        context.url_params.update(url_params)
+        if context.base_url is None:
+            context.base_url = self.select_mirror()
+
+        # Build URL
+        if url is None:
+            url = self.stages[stage_name].build_url(
+                base_url=context.base_url, **url_params
+            )
+
+        start = _CrawlRequest(stage_name=stage_name, url=url, depth=depth, order=())
+        return await self._crawl(start, context)
+
+    async def _crawl(
+        self, start: _CrawlRequest, context: CrawlContext
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Run the crawl frontier starting at `start` and collect all items.
+
+        Items are merged in document order (parent items before child items,
+        links in page order), independent of which fetch finished first.
+        """
+        collected = [item async for item in self._iter_crawl(start, context)]
+
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        for item in sorted(collected, key=lambda c: (c.order, c.index)):
+            results.setdefault(item.stage_name, []).append(item.data)
+
+        return results
+
+    async def _iter_crawl(
+        self, start: _CrawlRequest, context: CrawlContext
+    ) -> AsyncIterator[_CrawledItem]:
+        """
+        Run the crawl frontier starting at `start`, yielding items as they come.
+
+        Workers pull requests from a FIFO queue (breadth-first) and push the
+        follow-up requests they discover. The items of a page are yielded as
+        soon as that page is extracted (completion order, not document order).
+        Closing the generator early cancels the outstanding fetches.
+        """
+        frontier: asyncio.Queue[_CrawlRequest] = asyncio.Queue()
+        frontier.put_nowait(start)
+
+        # Extracted items, one list per processed page
+        output: asyncio.Queue[List[_CrawledItem]] = asyncio.Queue()
+
+        workers = [
+            asyncio.create_task(self._crawl_worker(frontier, output, context))
+            for _ in range(self.max_concurrency)
+        ]
+        drained = asyncio.create_task(frontier.join())
+        next_page = asyncio.create_task(output.get())
+
+        try:
+            while True:
+                done, _ = await asyncio.wait(
+                    [next_page, drained, *workers], return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if next_page in done:
+                    page = next_page.result()
+                    next_page = asyncio.create_task(output.get())
+                    for item in page:
+                        yield item
+                    continue
+
+                next_page.cancel()
+
+                # Workers only finish by raising; surface the first error.
+                for task in done:
+                    if task is not drained:
+                        task.result()
+
+                # Frontier drained: every page has been put before task_done()
+                while not output.empty():
+                    for item in output.get_nowait():
+                        yield item
+                return
+        finally:
+            # Also reached when the consumer closes the stream early
+            pending = (next_page, drained, *workers)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _crawl_worker(
+        self,
+        frontier: asyncio.Queue[_CrawlRequest],
+        output: asyncio.Queue[List[_CrawledItem]],
+        context: CrawlContext,
+    ) -> None:
+        """Process frontier requests until cancelled (returns only by raising)."""
+        while True:
+            request = await frontier.get()
+            try:
+                items, children = await self._process_request(request, context)
+                if items:
+                    output.put_nowait(
+                        [
+                            _CrawledItem(
+                                stage_name=request.stage_name,
+                                data=item,
+                                order=request.order,
+                                index=index,
+                            )
+                            for index, item in enumerate(items)
+                        ]
+                    )
+                for child in children:
+                    frontier.put_nowait(child)
+            finally:
+                frontier.task_done()
+
+    async def _process_request(
+        self, request: _CrawlRequest, context: CrawlContext
+    ) -> tuple[List[Dict[str, Any]], List[_CrawlRequest]]:
+        """
+        Fetch and extract a single page of the crawl.
+
+        Returns the extracted items and the follow-up requests for the next stage.
+        """
+        stage_name = request.stage_name
+        url = request.url
+        depth = request.depth
+
         if depth > self.max_depth:
             logger.warning(
                 "max_depth_reached", stage=stage_name, depth=depth, max=self.max_depth
             )
-            return {}
+            return [], []
 
         if stage_name not in self.stages:
             logger.error("stage_not_found", stage=stage_name)
-            return {}
+            return [], []
 
         stage = self.stages[stage_name]
         stage_config = stage.stage
 
-        # Build URL
-        if url is None:
-            url = stage.build_url(**url_params)
+        # Enough results already: don't fetch further pages
+        if not context.wants_more():
+            logger.debug("crawl_budget_reached", stage=stage_name, url=url)
+            return [], []
+
+        # Loop detection (claimed before fetching, so concurrent workers
+        # never process the same URL twice)
+        if not context.claim(url):
+            return [], []
 
         logger.info("scrape_stage_start", stage=stage_name, depth=depth, url=url)
 
-        # Fetch page
-        soup = await self._fetch_page(url)
-        if not soup:
-            return {}
+        page = await self._load_page(stage, url, context)
+        if page is None:
+            return [], []
 
-        # Extract data
-        data = stage.extract_data(soup)
+        # Pagination runs per search (own budget and claims); every page is
+        # loaded and cached on its own
+        items, links = await self._paginate(stage, page, context)
 
-        # Add source URL to data
-        data["source_url"] = url
+        if not stage_config.next_stage:
+            context.record_items(len(items))
+            return items, []
 
-        # Check conditions
-        if not stage.should_process(data):
-            logger.debug("stage_conditions_not_met", stage=stage_name, data=data)
-            return {}
+        # Queue links for next stage (unless the budget is already met)
+        if not links or not context.wants_more():
+            return items, []
+
+        return items, self._child_requests(request, stage_config, links, context)
 
-        # Extract links to next stage
-        links = stage.extract_links(soup)
+    def _child_requests(
+        self,
+        request: _CrawlRequest,
+        stage_config: ScrapingStage,
+        links: List[str],
+        context: CrawlContext,
+    ) -> List[_CrawlRequest]:
+        """Build next-stage requests for the first `max_links` unvisited links."""
+        max_links = stage_config.link_limit(context.item_budget)
+        children = [
+            _CrawlRequest(
+                stage_name=stage_config.next_stage,
+                url=link,
+                depth=request.depth + 1,
+                order=request.order + (index,),
+            )
+            for index, link in enumerate(links[:max_links])
+            if link not in context.visited_urls
+        ]
 
-        # FIX: Return Dict[stage_name, List[items]]
-        results: Dict[str, List[Dict[str, Any]]] = {stage_name: [data]}
+        if len(links) > max_links:
+            logger.warning(
+                "links_truncated",
+                stage=request.stage_name,
+                total_links=len(links),
+                processed=max_links,
+            )
 
-        # Pagination (if enabled)
-        if stage_config.pagination and stage_config.pagination.enabled:
-            paginated = await self._handle_pagination(stage, soup, depth)
-            if stage_name in paginated:
-                results[stage_name].extend(paginated[stage_name])
+        return children
 
-        # Recurse to next stage
-        if stage_config.next_stage and links:
-            next_stage_name = stage_config.next_stage
+    async def _load_page(
+        self, stage: StageScraper, url: str, context: CrawlContext
+    ) -> Optional[CachedStagePage]:
+        """
+        Serve a page from the stage-output cache, revalidate it, or fetch it.
 
-            # Limit links to prevent memory overflow
-            max_links = 10
-            for link in links[:max_links]:
-                sub_results = await self.scrape_stage(
-                    next_stage_name, url=link, depth=depth + 1
-                )
+        An expired entry that carries validators is revalidated with a
+        conditional request (If-None-Match / If-Modified-Since); on 304 it is
+        extended without parsing. If the refetch fails (or the host's circuit is
+        open), the stale entry is served as-is.
 
-                # Merge sub_results
-                for sub_stage, sub_items in sub_results.items():
-                    if sub_stage not in results:
-                        results[sub_stage] = []
-                    results[sub_stage].extend(sub_items)
+        Concurrent loads of the same page (same URL, request headers and
+        stage, e.g. from parallel searches) share one request and its
+        extraction via the process-wide SingleFlight. The shared call does
+        only budget-independent work (fetch, extract and store this one page)
+        and never sees a caller's CrawlContext; pagination, URL claiming and
+        mirror failover are applied per caller (see _paginate).
 
-            if len(links) > max_links:
-                logger.warning(
-                    "links_truncated",
-                    stage=stage_name,
-                    total_links=len(links),
-                    processed=max_links,
-                )
+        An open circuit fails the search only while none of its pages has
+        been loaded yet (the start page); later pages are skipped and recorded
+        in context.skipped_urls, so the search keeps what it has.
 
-        return results
+        Returns None if the page could not be fetched.
 
-    async def _handle_pagination(
-        self, stage: StageScraper, soup: BeautifulSoup, depth: int
-    ) -> Dict[str, List[Dict[str, Any]]]:
+        Raises:
+            CircuitOpenError: The host's circuit is open and this is the
+                search's first page.
+        """
+        cached = await self._cached_page(stage.name, url)
+        if cached is not None and cached.is_fresh():
+            context.pages_loaded += 1
+            return cached
+
+        headers = cached.conditional_headers() if cached is not None else {}
+        key = (
+            "GET",
+            url,
+            tuple(sorted(headers.items())),
+            self.plan.fingerprint,
+            stage.name,
+        )
+        try:
+            page, served_from = await self.single_flight.run(
+                key, lambda: self._refresh_page(stage, url, cached, headers)
+            )
+        except CircuitOpenError as e:
+            if not context.pages_loaded:
+                raise
+            logger.warning(
+                "page_skipped_circuit_open",
+                stage=stage.name,
+                url=url,
+                host=e.host,
+                retry_in_seconds=round(e.retry_in, 1),
+            )
+            context.skipped_urls.append(url)
+            return None
+
+        if page is not None:
+            context.pages_loaded += 1
+
+        # After a mirror failover, the rest of the search uses the new mirror
+        mirror = self._mirror_base(served_from) if served_from else None
+        if mirror is not None and mirror != context.base_url:
+            context.base_url = mirror
+        return page
+
+    async def _refresh_page(
+        self,
+        stage: StageScraper,
+        url: str,
+        cached: Optional[CachedStagePage],
+        headers: Dict[str, str],
+    ) -> tuple[Optional[CachedStagePage], Optional[str]]:
+        """
+        (Conditionally) fetch, extract and store a page (see _load_page).
+
+        Returns the page and the URL it was fetched from (None if the cached
+        page was served without a response).
         """
-        Handle pagination for list stages.
-        Follows "next page" links up to max_pages.
+        try:
+            fetched = await self._fetch_response(
+                url, headers=headers or None, stage=stage
+            )
+        except CircuitOpenError:
+            if cached is None:
+                raise
+            fetched = None
+
+        if fetched is None:
+            if cached is not None:
+                logger.info("stage_cache_stale_served", stage=stage.name, url=url)
+            return cached, None
+
+        if fetched.status_code == 304 and cached is not None:
+            # A 304 may carry updated validators (RFC 7232 section 4.1)
+            cached.etag = fetched.headers.get("ETag", cached.etag)
+            cached.last_modified = fetched.headers.get(
+                "Last-Modified", cached.last_modified
+            )
+            await self._store_page(stage, url, cached)
+            return cached, fetched.url
+
+        page = await self._extract_page(stage, fetched, url)
+        if fetched.truncated:
+            # Extracted from part of the page only: don't serve it to others
+            logger.debug("stage_cache_skipped_truncated", stage=stage.name, url=url)
+        else:
+            await self._store_page(stage, url, page)
+        return page, fetched.url
+
+    async def _extract_page(
+        self,
+        stage: StageScraper,
+        fetched: _FetchedPage,
+        url: str,
+    ) -> CachedStagePage:
+        """
+        Parse a fetched page and run the stage's extraction on it.
+
+        A page that does not meet the stage conditions yields a CachedStagePage
+        without items and links (only its next-page link).
         """
-        results: Dict[str, List[Dict[str, Any]]] = {stage.name: []}
+        extraction = await self._run_extraction(stage, fetched, url)
+        if extraction.data is None:
+            return CachedStagePage(next_page=extraction.next_page)
+
+        return CachedStagePage(
+            items=[extraction.data],
+            links=extraction.links,
+            next_page=extraction.next_page,
+            etag=fetched.headers.get("ETag"),
+            last_modified=fetched.headers.get("Last-Modified"),
+        )
+
+    async def _run_extraction(
+        self, stage: StageScraper, fetched: _FetchedPage, url: str
+    ) -> PageExtraction:
+        """Extraction of a fetched page (unless done while reading it)."""
+        if fetched.extraction is not None:
+            return fetched.extraction
+        return await self._run_stage_job(
+            stage, "extract_page", fetched.content, fetched.encoding, fetched.url or url
+        )
+
+    async def _run_stage_job(
+        self,
+        stage: StageScraper,
+        job: str,
+        content: bytes,
+        encoding: Optional[str],
+        url: str,
+    ) -> Any:
+        """
+        Run StageScraper method `job` in the parse pool (inline without one).
+
+        Links resolve against the mirror `url` was fetched from.
+        """
+        base_url = self._mirror_base(url)
+        if self.parse_pool is None:
+            return getattr(stage, job)(content, encoding, url, base_url)
+
+        if self.parse_pool.requires_pickling:
+            return await self.parse_pool.run(
+                extract_in_worker,
+                self.plugin,
+                self.plan.fingerprint,
+                stage.name,
+                job,
+                content,
+                encoding,
+                url,
+                base_url,
+            )
+
+        return await self.parse_pool.run(
+            getattr(stage, job), content, encoding, url, base_url
+        )
+
+    async def _cached_page(
+        self, stage_name: str, url: str
+    ) -> Optional[CachedStagePage]:
+        """Look up the stage-output cache (only for stages with cache_ttl)."""
+        if self.stage_cache is None or not self.stages[stage_name].stage.cache_ttl:
+            return None
+        return await self.stage_cache.get(stage_name, url)
+
+    async def _store_page(
+        self, stage: StageScraper, url: str, page: CachedStagePage
+    ) -> None:
+        """
+        Store a (re)validated extraction in the stage-output cache.
+
+        Entries with validators are kept `cache_revalidate_ttl` seconds beyond
+        their freshness so they can be revalidated with a conditional request.
+        """
+        ttl = stage.stage.cache_ttl
+        if self.stage_cache is None or not ttl:
+            return
+
+        page.fresh_until = time.time() + ttl
+        if page.has_validators():
+            ttl += stage.stage.cache_revalidate_ttl or ttl
+
+        await self.stage_cache.set(stage.name, url, page, ttl=ttl)
+
+    async def _paginate(
+        self, stage: StageScraper, page: CachedStagePage, context: CrawlContext
+    ) -> tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Items and links of `page` plus those of its following pages.
+
+        Pagination stops at the search's item budget; pages already cached
+        by a search that stopped earlier (or went further) are reused as
+        they are, one entry per page.
+        """
+        items = list(page.items)
+        links = list(page.links)
         pagination = stage.stage.pagination
+        if not items or not pagination or not pagination.enabled:
+            return items, links
+
+        for paginated in await self._handle_pagination(
+            stage, page.next_page, context, pending=len(items)
+        ):
+            items.extend(paginated.items)
+            links.extend(paginated.links)
+        return items, list(dict.fromkeys(links))
 
+    async def _handle_pagination(
+        self,
+        stage: StageScraper,
+        next_url: Optional[str],
+        context: CrawlContext,
+        pending: int = 0,
+    ) -> List[CachedStagePage]:
+        """
+        Handle pagination for list stages (pages 2..max_pages).
+
+        With pagination.url_pattern, the page URLs are built up front and
+        loaded concurrently; otherwise "next page" links are followed one
+        page at a time, starting at `next_url`. `pending` items of page 1
+        count towards the budget (terminal stages).
+        """
+        pagination = stage.stage.pagination
         if not pagination or not pagination.enabled:
-            return results
+            return []
 
-        next_selector = pagination.selector
-        max_pages = pagination.max_pages or 1
+        if pagination.url_pattern:
+            return await self._fetch_page_range(stage, context, pending)
+        return await self._follow_next_pages(stage, next_url, context, pending)
 
-        for page_num in range(1, max_pages):
-            next_link_elem = soup.select_one(next_selector)
-            if not next_link_elem:
-                break
+    async def _follow_next_pages(
+        self,
+        stage: StageScraper,
+        next_url: Optional[str],
+        context: CrawlContext,
+        pending: int = 0,
+    ) -> List[CachedStagePage]:
+        """Follow "next page" links up to max_pages (serial)."""
+        pages: List[CachedStagePage] = []
+        max_pages = stage.stage.pagination.max_pages or 1
+        terminal = not stage.stage.next_stage
 
-            next_url = next_link_elem.get("href")
+        for page_num in range(1, max_pages):
             if not next_url:
                 break
 
-            next_url = urljoin(self.base_url, next_url)
+            # Items of a terminal stage count towards the crawl budget
+            extracted = pending + sum(len(p.items) for p in pages)
+            if not context.wants_more(extracted if terminal else 0):
+                break
 
             logger.debug(
                 "pagination_next", stage=stage.name, page=page_num + 1, url=next_url
             )
 
-            soup = await self._fetch_page(next_url)
-            if not soup:
+            if not context.claim(next_url):
                 break
 
-            # Extract data from paginated page
-            data = stage.extract_data(soup)
-            data["source_url"] = next_url
+            page = await self._load_page(stage, next_url, context)
+            if page is None:
+                break
 
-            if stage.should_process(data):
-                results[stage.name].append(data)
+            pages.append(page)
+            next_url = page.next_page
 
-        return results
+        return pages
 
-    async def scrape(
-        self, query: str, **params: Any
-    ) -> Dict[str, List[Dict[str, Any]]]:
+    async def _fetch_page_range(
+        self, stage: StageScraper, context: CrawlContext, pending: int = 0
+    ) -> List[CachedStagePage]:
         """
-        Start multi-stage scraping pipeline.
+        Load pages 2..max_pages of a url_pattern pagination concurrently.
+
+        Requests go through the host rate limiter like any other fetch.
+        Pages are consumed in page order; at the first empty (or failed)
+        page, it and all later pages are discarded and their outstanding
+        loads cancelled.
+        """
+        max_pages = stage.stage.pagination.max_pages or 1
+        terminal = not stage.stage.next_stage
+
+        try:
+            urls = [
+                stage.build_page_url(
+                    page, base_url=context.base_url, **context.url_params
+                )
+                for page in range(2, max_pages + 1)
+            ]
+        except ValueError as e:
+            logger.warning("pagination_url_failed", stage=stage.name, error=str(e))
+            return []
+
+        loads = [
+            asyncio.create_task(self._load_page(stage, url, context))
+            for url in urls
+            if context.claim(url)
+        ]
+        logger.debug("pagination_prefetch", stage=stage.name, pages=len(loads))
+
+        pages: List[CachedStagePage] = []
+        try:
+            for load in loads:
+                page = await load
+                if page is None or page.is_empty(not terminal):
+                    break
+                pages.append(page)
+
+                # Items of a terminal stage count towards the crawl budget
+                extracted = pending + sum(len(p.items) for p in pages)
+                if not context.wants_more(extracted if terminal else 0):
+                    break
+        finally:
+            for load in loads:
+                load.cancel()
+            await asyncio.gather(*loads, return_exceptions=True)
+
+        if len(pages) < len(loads):
+            logger.debug(
+                "pagination_pages_discarded",
+                stage=stage.name,
+                kept=len(pages),
+                discarded=len(loads) - len(pages),
+            )
+        return pages
+
+    async def iter_scrape(
+        self, query: str, max_results: Optional[int] = None, **params: Any
+    ) -> AsyncIterator[tuple[str, Dict[str, Any], tuple[int, ...]]]:
+        """
+        Run the multi-stage scraping pipeline as a stream.
+
+        Yields (stage_name, item, position) as soon as the page an item was
+        extracted from is done, so consumers can process results while later
+        pages are still being fetched. Items arrive in completion order;
+        sorting by `position` restores document order (as in scrape()).
 
         Args:
             query: Search query string
+            max_results: Stop expanding links/pages once this many
+                terminal-stage items have been extracted (None = no limit)
             **params: Additional URL parameters (e.g., category, page)
 
-        Returns:
-            Dict[stage_name, List[items]] - raw data from all stages
+        Raises:
+            CircuitOpenError: The start page's host circuit is open.
+            CrawlIncompleteError: After the last item, if pages were skipped
+                because their host's circuit opened during the crawl.
         """
         logger.info(
             "scrapy_scrape_start",
@@ -625,28 +1835,90 @@ class ScrapyAdapter:
             start_stage=self.start_stage_name,
         )
 
-        # Reset visited URLs for new scrape
-        self.visited_urls.clear()
+        if self.start_stage_name not in self.stages:
+            logger.error("stage_not_found", stage=self.start_stage_name)
+            return
 
         # Add query to params
         params["query"] = query
 
-        results = await self.scrape_stage(self.start_stage_name, **params)
-
-        logger.debug(
-            "scrape_results_detail",
-            plugin=self.plugin_name,
-            result_type=type(results).__name__,
-            stages=list(results.keys()),
-            stage_counts={k: len(v) for k, v in results.items()},
+        # Per-search state (the adapter itself is shared between searches)
+        context = CrawlContext(
+            item_budget=max_results, url_params=params, base_url=self.select_mirror()
+        )
+        start = _CrawlRequest(
+            stage_name=self.start_stage_name,
+            url=self.stages[self.start_stage_name].build_url(
+                base_url=context.base_url, **params
+            ),
+            depth=0,
+            order=(),
         )
 
+        total = 0
+        async with aclosing(self._iter_crawl(start, context)) as crawl:
+            async for item in crawl:
+                total += 1
+                yield item.stage_name, item.data, item.order + (item.index,)
+
         logger.info(
             "scrapy_scrape_complete",
             plugin=self.plugin_name,
-            total_results=sum(len(v) for v in results.values()),
+            total_results=total,
+            skipped_pages=len(context.skipped_urls),
         )
+        if context.skipped_urls:
+            raise CrawlIncompleteError(context.skipped_urls)
+
+    async def scrape(
+        self, query: str, max_results: Optional[int] = None, **params: Any
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Start multi-stage scraping pipeline.
+
+        Collects the iter_scrape() stream, with items merged back into
+        document order.
+
+        Args:
+            query: Search query string
+            max_results: Stop expanding links/pages once this many
+                terminal-stage items have been extracted (None = no limit)
+            **params: Additional URL parameters (e.g., category, page)
+
+        Returns:
+            Dict[stage_name, List[items]] - raw data from all stages
 
+        Raises:
+            CircuitOpenError: The start page's host circuit is open.
+            CrawlIncompleteError: If pages were skipped because their host's
+                circuit opened during the crawl; its `results` hold what was
+                collected.
+        """
+        collected: List[tuple[tuple[int, ...], str, Dict[str, Any]]] = []
+
+        def grouped() -> Dict[str, List[Dict[str, Any]]]:
+            results: Dict[str, List[Dict[str, Any]]] = {}
+            for _, stage_name, item in sorted(collected, key=lambda c: c[0]):
+                results.setdefault(stage_name, []).append(item)
+            return results
+
+        try:
+            async with aclosing(
+                self.iter_scrape(query, max_results=max_results, **params)
+            ) as items:
+                async for stage_name, item, position in items:
+                    collected.append((position, stage_name, item))
+        except CrawlIncompleteError as e:
+            e.results = grouped()
+            raise
+
+        results = grouped()
+        logger.debug(
+            "scrape_results_detail",
+            plugin=self.plugin_name,
+            stages=list(results.keys()),
+            stage_counts={k: len(v) for k, v in results.items()},
+        )
         return results
 
     def normalize_results(
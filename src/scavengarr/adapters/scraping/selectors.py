@@ -0,0 +1,222 @@
+"""
+Pluggable HTML parser backends for StageScraper.
+
+Selectors from the plugin YAML are compiled once (when the stage is built) and
+reused for every page. Two backends implement the same interface:
+
+- LxmlBackend (default): lxml HTML parser, CSS compiled to XPath via cssselect
+- SoupBackend (fallback): BeautifulSoup "html.parser", CSS compiled via soupsieve
+
+Both return equivalent results for the operations StageScraper uses:
+select/select_one (document order), get_text(strip=True)-style text and
+attribute lookup. Known exceptions, both on invalid markup: "html.parser" does
+not apply HTML's implied end tags (an unclosed <p>/<li> swallows its
+siblings) and keeps <![CDATA[...]]> text, which lxml drops.
+"""
+
+from __future__ import annotations
+
+import codecs
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Literal, Optional, Protocol
+
+import lxml.html
+import soupsieve
+from bs4 import BeautifulSoup
+from cssselect import HTMLTranslator
+from cssselect import SelectorError as CssSelectorError
+from lxml import etree
+
+ParserName = Literal["lxml", "bs4"]
+
+# Matches <meta charset="..."> and <meta http-equiv content="...; charset=...">
+_META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?([\w.:-]+)""", re.I)
+
+# Text inside these elements is not part of get_text() of an ancestor
+# (BeautifulSoup stores it as Script/Stylesheet/TemplateString).
+_NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+
+class SelectorError(ValueError):
+    """Raised when a CSS selector cannot be compiled by a backend."""
+
+
+@dataclass(frozen=True)
+class CompiledSelector:
+    """CSS selector compiled for a specific backend."""
+
+    css: str
+    compiled: Any
+
+
+class ParserBackend(Protocol):
+    """Parser + selector engine used by StageScraper."""
+
+    name: ParserName
+
+    def compile(self, css: str) -> CompiledSelector:
+        """Compile a CSS selector. Raises SelectorError if unsupported."""
+        ...
+
+    def parse(self, content: bytes, encoding: Optional[str] = None) -> Any:
+        """Parse an HTML document. `encoding` is the HTTP charset (if any)."""
+        ...
+
+    def select(self, node: Any, selector: CompiledSelector) -> List[Any]:
+        """All descendants of `node` matching `selector`, in document order."""
+        ...
+
+    def select_one(self, node: Any, selector: CompiledSelector) -> Optional[Any]:
+        """First descendant of `node` matching `selector` (or None)."""
+        ...
+
+    def text(self, node: Any) -> str:
+        """Concatenated, stripped text content (like get_text(strip=True))."""
+        ...
+
+    def html(self, node: Any) -> str:
+        """Serialized markup of `node` (for log previews)."""
+        ...
+
+
+def sniff_encoding(content: bytes, declared: Optional[str] = None) -> str:
+    """
+    Determine the document encoding.
+
+    Order: HTTP charset > <meta charset> > UTF-8 (if it decodes) > windows-1252.
+    """
+    encoding = declared_encoding(content, declared)
+    if encoding is not None:
+        return encoding
+
+    try:
+        content.decode("utf-8")
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "windows-1252"
+
+
+def declared_encoding(content: bytes, declared: Optional[str] = None) -> Optional[str]:
+    """Encoding declared by the HTTP charset or <meta charset> (None if unknown)."""
+    for candidate in (declared, _meta_charset(content)):
+        if candidate and _is_known_codec(candidate):
+            return candidate
+    return None
+
+
+def _meta_charset(content: bytes) -> Optional[str]:
+    match = _META_CHARSET_RE.search(content[:4096])
+    return match.group(1).decode("ascii", "ignore") if match else None
+
+
+def _is_known_codec(name: str) -> bool:
+    try:
+        codecs.lookup(name)
+        return True
+    except LookupError:
+        return False
+
+
+class LxmlBackend:
+    """lxml parser with CSS selectors compiled to XPath (via cssselect)."""
+
+    name: ParserName = "lxml"
+
+    def __init__(self) -> None:
+        self._translator = HTMLTranslator()
+
+    def compile(self, css: str) -> CompiledSelector:
+        try:
+            # "descendant::" = search below the context node (like soupsieve)
+            xpath = self._translator.css_to_xpath(css, prefix="descendant::")
+            return CompiledSelector(css=css, compiled=etree.XPath(xpath))
+        except (CssSelectorError, etree.XPathSyntaxError) as e:
+            raise SelectorError(f"Cannot compile selector {css!r}: {e}") from e
+
+    def parse(self, content: bytes, encoding: Optional[str] = None) -> Any:
+        parser = lxml.html.HTMLParser(encoding=sniff_encoding(content, encoding))
+        try:
+            root = lxml.html.document_fromstring(content, parser=parser)
+        except etree.ParserError:
+            # Empty document: behave like an empty soup
+            root = lxml.html.Element("html")
+        return root.getroottree()
+
+    def select(self, node: Any, selector: CompiledSelector) -> List[Any]:
+        return selector.compiled(node)
+
+    def select_one(self, node: Any, selector: CompiledSelector) -> Optional[Any]:
+        matches = selector.compiled(node)
+        return matches[0] if matches else None
+
+    def text(self, node: Any) -> str:
+        # Template content is inert: its elements have no text in BeautifulSoup
+        if next(node.iterancestors("template"), None) is not None:
+            return ""
+        include_raw = node.tag in _NON_TEXT_TAGS
+        return "".join(_iter_stripped_text(node, include_raw))
+
+    def html(self, node: Any) -> str:
+        return etree.tostring(node, encoding="unicode", with_tail=False)
+
+
+def _iter_stripped_text(node: Any, include_raw: bool):
+    """Yield non-empty stripped text pieces of `node` in document order."""
+    if node.text:
+        text = node.text.strip()
+        if text:
+            yield text
+
+    for child in node:
+        # Comments / processing instructions have a non-string tag
+        if isinstance(child.tag, str) and (
+            include_raw or child.tag not in _NON_TEXT_TAGS
+        ):
+            yield from _iter_stripped_text(child, include_raw)
+
+        if child.tail:
+            tail = child.tail.strip()
+            if tail:
+                yield tail
+
+
+class SoupBackend:
+    """BeautifulSoup ("html.parser") with soupsieve-compiled selectors."""
+
+    name: ParserName = "bs4"
+
+    def compile(self, css: str) -> CompiledSelector:
+        try:
+            return CompiledSelector(css=css, compiled=soupsieve.compile(css))
+        except soupsieve.SelectorSyntaxError as e:
+            raise SelectorError(f"Cannot compile selector {css!r}: {e}") from e
+
+    def parse(self, content: bytes, encoding: Optional[str] = None) -> Any:
+        return BeautifulSoup(content, "html.parser", from_encoding=encoding)
+
+    def select(self, node: Any, selector: CompiledSelector) -> List[Any]:
+        return selector.compiled.select(node)
+
+    def select_one(self, node: Any, selector: CompiledSelector) -> Optional[Any]:
+        return selector.compiled.select_one(node)
+
+    def text(self, node: Any) -> str:
+        return node.get_text(strip=True)
+
+    def html(self, node: Any) -> str:
+        return str(node)
+
+
+_BACKENDS: Dict[str, type] = {
+    "lxml": LxmlBackend,
+    "bs4": SoupBackend,
+}
+
+
+def get_backend(name: ParserName = "lxml") -> ParserBackend:
+    """Return a parser backend by name."""
+    try:
+        return _BACKENDS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown parser backend: {name!r}") from None
@@ -0,0 +1,129 @@
+"""
+Per-URL cache of extracted stage data.
+
+Stores what a stage extracted from a page (items + links to the next stage),
+not the raw HTML, so a cache hit skips both the HTTP request and parsing.
+Backed by CachePort (diskcache or Redis).
+
+Each entry covers exactly one page: the pages of a paginated stage are
+stored under their own URLs (with their own validators), so an entry never
+depends on how far a particular search paginated.
+
+HTTP validators (ETag / Last-Modified) are stored next to the extraction, so
+an expired entry can be revalidated with a conditional request instead of a
+full download and re-parse.
+"""
+
+from __future__ import annotations
+
+import pickle
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+from scavengarr.domain.ports import CachePort
+
+logger = structlog.get_logger(__name__)
+
+# Bumped when the entry layout changes. v2: one entry per page (v1 entries
+# merged a stage's pagination pages into page 1's entry; a 304 on page 1
+# would keep their later pages alive without revalidating them).
+_KEY_VERSION = 2
+
+
+@dataclass
+class CachedStagePage:
+    """Extraction result of one stage for one URL (a single page)."""
+
+    items: List[Dict[str, Any]] = field(default_factory=list)
+    links: List[str] = field(default_factory=list)
+
+    # "Next page" link of the page (link-following pagination)
+    next_page: Optional[str] = None
+
+    # HTTP validators from the response the extraction was made from
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    # Unix timestamp until which the entry is used without revalidation
+    fresh_until: float = 0.0
+
+    def is_empty(self, follows_links: bool) -> bool:
+        """
+        True if the page yielded nothing useful: no links for a stage that
+        follows links, else no extracted values.
+        """
+        if follows_links:
+            return not self.links
+        return not any(
+            v for item in self.items for k, v in item.items() if k != "source_url"
+        )
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.fresh_until
+
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers for revalidating this entry."""
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class StageCache:
+    """
+    Stage-output cache for a single plugin.
+
+    Cache errors never fail a scrape: they are logged and treated as misses.
+
+    Args:
+        cache: CachePort implementation (injected).
+        plugin_name: Plugin name (part of the cache key).
+    """
+
+    def __init__(self, cache: CachePort, plugin_name: str):
+        self.cache = cache
+        self.plugin_name = plugin_name
+
+    def _key(self, stage_name: str, url: str) -> str:
+        return f"scrapy:stage:v{_KEY_VERSION}:{self.plugin_name}:{stage_name}:{url}"
+
+    async def get(self, stage_name: str, url: str) -> Optional[CachedStagePage]:
+        """Load cached extraction for `url` (None on miss, may be expired)."""
+        try:
+            raw = await self.cache.get(self._key(stage_name, url))
+            if raw is None:
+                return None
+            page = pickle.loads(raw)
+        except Exception as e:
+            logger.warning(
+                "stage_cache_read_failed", stage=stage_name, url=url, error=str(e)
+            )
+            return None
+
+        if not isinstance(page, CachedStagePage):
+            return None
+
+        logger.debug("stage_cache_hit", stage=stage_name, url=url)
+        return page
+
+    async def set(
+        self, stage_name: str, url: str, page: CachedStagePage, ttl: int
+    ) -> None:
+        """Store extraction for `url` for `ttl` seconds."""
+        try:
+            await self.cache.set(
+                self._key(stage_name, url), pickle.dumps(page), ttl=ttl
+            )
+            logger.debug("stage_cache_stored", stage=stage_name, url=url, ttl=ttl)
+        except Exception as e:
+            logger.warning(
+                "stage_cache_write_failed", stage=stage_name, url=url, error=str(e)
+            )
@@ -44,12 +44,15 @@ class CrawlJobFactory:
         result: SearchResult,
         *,
         job_id: str | None = None,
+        validated: bool = True,
     ) -> CrawlJob:
         """Create CrawlJob from validated SearchResult.
 
         Args:
-            result: Validated search result (with reachable download_link).
+            result: Validated search result (with reachable download_links).
             job_id: Optional custom job ID (default: auto-generated UUID4).
+            validated: False if the links have not been validated yet
+                (deferred/on-download validation): they go to unchecked_urls.
 
         Returns:
             CrawlJob entity with JDownloader-compatible fields.
@@ -62,14 +65,17 @@ class CrawlJobFactory:
         comment = self._build_comment(result)
 
         # Build text field (newline-separated links)
-        # For now, single link per job. Future: support multi-part archives.
-        text = result.download_link
+        # All live alternatives (hoster mirrors of the same release) go into
+        # the job; JDownloader groups them as mirrors within the package.
+        urls = list(result.download_links or (result.download_link,))
+        text = "\n".join(urls)
 
         crawl_job = CrawlJob(
             text=text,
             package_name=package_name,
             comment=comment,
-            validated_urls=[result.download_link],
+            validated_urls=urls if validated else [],
+            unchecked_urls=[] if validated else urls,
             source_url=result.source_url,
             created_at=now,
             expires_at=expires_at,
@@ -82,7 +88,8 @@ class CrawlJobFactory:
             "crawljob_created",
             job_id=crawl_job.job_id,
             package_name=package_name,
-            link_count=len(crawl_job.validated_urls),
+            link_count=len(urls),
+            validated=validated,
             ttl_hours=self.default_ttl_hours,
         )
 
@@ -1,4 +1,5 @@
+from .crawljob_validation import CrawlJobValidationUseCase
 from .torznab_caps import TorznabCapsUseCase
 from .torznab_search import TorznabSearchUseCase
 
-__all__ = ["TorznabCapsUseCase", "TorznabSearchUseCase"]
+__all__ = ["CrawlJobValidationUseCase", "TorznabCapsUseCase", "TorznabSearchUseCase"]
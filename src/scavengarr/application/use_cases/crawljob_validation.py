@@ -0,0 +1,104 @@
+"""Link validation of stored CrawlJobs (deferred / on-download validation)."""
+
+from __future__ import annotations
+
+import asyncio
+
+import structlog
+
+from scavengarr.domain.entities.crawljob import CrawlJob
+from scavengarr.domain.ports import LinkValidatorPort
+from scavengarr.domain.ports.crawljob_repository import CrawlJobRepository
+
+log = structlog.get_logger(__name__)
+
+
+class CrawlJobValidationUseCase:
+    """Validates the links of CrawlJobs after they were stored.
+
+    Used when link validation is taken off the search path:
+        - deferred: the search schedules its CrawlJobs here and returns;
+          validation runs as a background task.
+        - on_download: the download endpoint validates the requested job
+          before serving it.
+
+    Only a job's unchecked_urls are validated (jobs without any are
+    skipped). Verdicts are written onto the CrawlJob (live links moved to
+    validated_urls, validated_at set) and the job is saved again; the
+    repository keeps its original expiry (expires_at), so validation never
+    extends a job's TTL.
+
+    Process-wide: background tasks are tracked so aclose() can cancel them
+    on shutdown.
+    """
+
+    def __init__(
+        self,
+        link_validator: LinkValidatorPort,
+        crawljob_repo: CrawlJobRepository,
+    ) -> None:
+        """Initialize use case with dependencies.
+
+        Args:
+            link_validator: Validator for download links.
+            crawljob_repo: Repository the validated CrawlJobs are saved to.
+        """
+        self.link_validator = link_validator
+        self.crawljob_repo = crawljob_repo
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def validate(self, job: CrawlJob) -> CrawlJob:
+        """Validate the links of one CrawlJob and save the verdicts.
+
+        Returns:
+            The updated CrawlJob.
+        """
+        await self.validate_many([job])
+        return job
+
+    async def validate_many(self, jobs: list[CrawlJob]) -> None:
+        """Validate the unchecked links of `jobs` in one batch, save the verdicts."""
+        jobs = [job for job in jobs if job.is_pending()]
+        urls = [url for job in jobs for url in job.unchecked_urls]
+        if not urls:
+            return
+
+        verdicts = await self.link_validator.validate_batch(urls)
+        dead = 0
+        for job in jobs:
+            job.apply_link_verdicts(verdicts)
+            dead += not job.has_live_links()
+            await self.crawljob_repo.save(job)
+
+        log.info(
+            "crawljob_links_validated",
+            jobs=len(jobs),
+            links=len(urls),
+            dead_jobs=dead,
+        )
+
+    def schedule(self, jobs: list[CrawlJob]) -> None:
+        """Validate `jobs` in a background task (returns immediately)."""
+        if not jobs:
+            return
+        task = asyncio.create_task(self._run(jobs))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, jobs: list[CrawlJob]) -> None:
+        try:
+            await self.validate_many(jobs)
+        except Exception as e:
+            log.warning("deferred_validation_failed", jobs=len(jobs), error=str(e))
+
+    @property
+    def pending(self) -> int:
+        """Number of background validations still running."""
+        return len(self._tasks)
+
+    async def aclose(self) -> None:
+        """Cancel background validations still running."""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
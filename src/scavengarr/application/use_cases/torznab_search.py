@@ -2,36 +2,59 @@
 
 from __future__ import annotations
 
+import asyncio
+from contextlib import aclosing
 from dataclasses import replace as dataclass_replace
 from typing import cast
 
 import structlog
 
 from scavengarr.application.factories import CrawlJobFactory
+from scavengarr.application.use_cases.crawljob_validation import (
+    CrawlJobValidationUseCase,
+)
 from scavengarr.domain.entities import (
     TorznabBadRequest,
     TorznabExternalError,
     TorznabItem,
+    TorznabPartialResults,
     TorznabPluginNotFound,
     TorznabQuery,
+    TorznabResultSet,
     TorznabUnsupportedPlugin,
 )
+from scavengarr.domain.entities.crawljob import CrawlJob
 from scavengarr.domain.ports import PluginRegistryPort
 from scavengarr.domain.ports.crawljob_repository import CrawlJobRepository
 from scavengarr.domain.ports.search_engine import SearchEnginePort
 
 log = structlog.get_logger(__name__)
 
+# A search result turned into a stored CrawlJob and its enriched item
+_Converted = tuple[TorznabItem, CrawlJob]
+
 
 class TorznabSearchUseCase:
     """Executes Torznab search queries with link validation and CrawlJob generation.
 
     Flow:
         1. Validate query and plugin
-        2. Execute search via SearchEngine (includes link validation)
-        3. Convert each SearchResult → CrawlJob (via Factory)
-        4. Store CrawlJobs in repository
-        5. Return enriched TorznabItems with job_id fields
+        2. Stream search results via SearchEngine (includes link validation)
+        3. Convert each SearchResult → CrawlJob (via Factory) as it arrives
+        4. Store CrawlJobs in repository (concurrently with the crawl)
+        5. Sort into document order, apply offset/limit and return the
+           enriched TorznabItems with job_id fields
+
+    With validation_mode "deferred" the engine does not validate (see
+    composition); the stored CrawlJobs are handed to the CrawlJob validation
+    use case, which checks their links in the background after the items
+    are returned. "on_download" leaves validation to the download endpoint.
+
+    The whole search runs under a deadline (per plugin, else global). When it
+    expires, outstanding fetches/validations are cancelled and the results
+    collected so far are returned, flagged as partial. Results of a search
+    whose indexer became unavailable mid-crawl (pages skipped) are flagged
+    the same way.
     """
 
     def __init__(
@@ -40,6 +63,10 @@ class TorznabSearchUseCase:
         engine: SearchEnginePort,
         crawljob_factory: CrawlJobFactory,  # CHANGED: Factory instead of Service
         crawljob_repo: CrawlJobRepository,
+        search_deadline_seconds: float | None = None,
+        max_search_results: int | None = None,
+        validation_mode: str = "inline",
+        crawljob_validation: CrawlJobValidationUseCase | None = None,
     ):
         """Initialize use case with dependencies.
 
@@ -48,20 +75,33 @@ class TorznabSearchUseCase:
             engine: Search engine (with link validation).
             crawljob_factory: Factory for creating CrawlJobs from SearchResults.
             crawljob_repo: Repository for storing CrawlJobs.
+            search_deadline_seconds: Default deadline per search (None: no
+                deadline); plugins may override it via
+                scraping.search_deadline_seconds.
+            max_search_results: Most results a paged search crawls for
+                (None: no cap); see _crawl_budget.
+            validation_mode: inline, deferred or on_download.
+            crawljob_validation: Background validation of stored CrawlJobs
+                (used with validation_mode "deferred").
         """
         self.plugins: PluginRegistryPort = plugins
         self.engine: SearchEnginePort = engine
         self.crawljob_factory: CrawlJobFactory = crawljob_factory  # CHANGED
         self.crawljob_repo: CrawlJobRepository = crawljob_repo
+        self.search_deadline_seconds = search_deadline_seconds
+        self.max_search_results = max_search_results
+        self.validation_mode = validation_mode
+        self.crawljob_validation = crawljob_validation
 
-    async def execute(self, q: TorznabQuery) -> list[TorznabItem]:
+    async def execute(self, q: TorznabQuery) -> TorznabResultSet:
         """Execute Torznab search with link validation and CrawlJob generation.
 
         Args:
             q: TorznabQuery with action, plugin_name, query, category, etc.
 
         Returns:
-            List of TorznabItems with enriched job_id fields.
+            TorznabItems with enriched job_id fields (partial=True if the
+            search deadline expired first).
 
         Raises:
             TorznabBadRequest: Invalid query parameters.
@@ -69,6 +109,166 @@ class TorznabSearchUseCase:
             TorznabUnsupportedPlugin: Plugin has unsupported scraping mode.
             TorznabExternalError: Search engine failure.
         """
+        # === 1+2) Validate Query, Plugin Discovery and Validation ===
+        plugin = self._resolve_plugin(q)
+
+        if self._beyond_cap(q):
+            log.info(
+                "torznab_search_offset_beyond_cap",
+                plugin=q.plugin_name,
+                query=q.query,
+                offset=q.offset,
+                max_results=self.max_search_results,
+            )
+            return TorznabResultSet(items=[])
+
+        # === 3) Execute Search (includes link validation) ===
+        # Results are streamed while the engine is still scraping/validating
+        # the rest; the requested page of them becomes CrawlJobs.
+        items, jobs, raw_count, partial = await self._collect(q, plugin)
+
+        # === Deferred link validation (runs after the items are returned) ===
+        if self.validation_mode == "deferred" and self.crawljob_validation:
+            self.crawljob_validation.schedule(jobs)
+
+        if not raw_count:
+            log.info(
+                "torznab_search_no_results",
+                plugin=q.plugin_name,
+                query=q.query,
+                partial=partial,
+            )
+            return TorznabResultSet(items=[], partial=partial)
+
+        log.info(
+            "torznab_search_completed",
+            plugin=q.plugin_name,
+            query=q.query,
+            raw_result_count=raw_count,
+            crawljob_count=len(items),
+            partial=partial,
+        )
+        return TorznabResultSet(items=items, partial=partial)
+
+    def _beyond_cap(self, q: TorznabQuery) -> bool:
+        """True if q's page starts past max_search_results (always empty)."""
+        cap = self.max_search_results
+        return cap is not None and (q.offset or 0) >= cap
+
+    def _deadline_for(self, plugin: object) -> float | None:
+        """Search deadline for `plugin` (plugin override, else global)."""
+        scraping = getattr(plugin, "scraping", None)
+        override = getattr(scraping, "search_deadline_seconds", None)
+        return override if override is not None else self.search_deadline_seconds
+
+    async def _collect(
+        self, q: TorznabQuery, plugin: object
+    ) -> tuple[list[TorznabItem], list[CrawlJob], int, bool]:
+        """Collect search results until done or the search deadline expires,
+        turning each into a stored CrawlJob as it arrives.
+
+        CrawlJobs are created and saved concurrently with the crawl, and
+        only within the deadline: on expiry, closing the engine's stream
+        cancels its in-flight fetches and validations, and CrawlJobs not yet
+        stored are dropped. The results converted up to that point are kept.
+        The same goes for a stream ending in TorznabPartialResults.
+
+        Results stream in completion order, so Torznab offset/limit are
+        applied only after sorting them into document order (see
+        _select_page): the same query pages through the same sequence. The
+        engine's crawl budget counts results before link validation, so it
+        is over-fetched (see _crawl_budget) to leave room for dead links.
+
+        Returns:
+            (items, their CrawlJobs, raw result count, partial flag).
+
+        Raises:
+            TorznabExternalError: Search engine failure.
+        """
+        deadline = self._deadline_for(plugin)
+        conversions: list[tuple[object, asyncio.Task[_Converted | None]]] = []
+        partial = False
+        try:
+            async with asyncio.timeout(deadline) as timeout:
+                partial = await self._stream_results(q, plugin, conversions)
+                await asyncio.gather(*(task for _, task in conversions))
+        except TorznabExternalError:
+            raise
+        except TimeoutError as e:
+            if not timeout.expired():
+                raise TorznabExternalError(f"Search engine error: {e!r}") from e
+            log.warning(
+                "torznab_search_deadline_exceeded",
+                plugin=q.plugin_name,
+                query=q.query,
+                deadline_seconds=deadline,
+                raw_result_count=len(conversions),
+                partial=True,
+            )
+            partial = True
+        except Exception as e:
+            raise TorznabExternalError(f"Search engine error: {str(e)}") from e
+        finally:
+            tasks = [task for _, task in conversions]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        converted = {
+            id(raw_result): task.result()
+            for raw_result, task in conversions
+            if not task.cancelled() and task.result() is not None
+        }
+        page = _select_page(q, [raw for raw, _ in conversions if id(raw) in converted])
+        items = [converted[id(raw_result)][0] for raw_result in page]
+        jobs = [converted[id(raw_result)][1] for raw_result in page]
+        return items, jobs, len(conversions), partial
+
+    async def _stream_results(
+        self,
+        q: TorznabQuery,
+        plugin: object,
+        conversions: list[tuple[object, asyncio.Task[_Converted | None]]],
+    ) -> bool:
+        """Consume the engine's stream, starting a CrawlJob task per result.
+
+        Appends (result, conversion task) to `conversions`.
+
+        Returns:
+            True if the stream ended in TorznabPartialResults.
+        """
+        try:
+            async with aclosing(
+                self.engine.iter_search(
+                    plugin,
+                    q.query,
+                    max_results=_crawl_budget(q, self.max_search_results),
+                    category=q.category,  # Pass category if available
+                )
+            ) as raw_results:
+                async for raw_result in raw_results:
+                    task = asyncio.create_task(self._to_item(q, raw_result))
+                    conversions.append((raw_result, task))
+        except TorznabPartialResults as e:
+            log.warning(
+                "torznab_search_incomplete",
+                plugin=q.plugin_name,
+                query=q.query,
+                error=str(e),
+                raw_result_count=len(conversions),
+                partial=True,
+            )
+            return True
+        return False
+
+    def _resolve_plugin(self, q: TorznabQuery) -> object:
+        """Validate the query and look up its (scrapy-mode) plugin.
+
+        Raises:
+            TorznabBadRequest: Invalid query parameters.
+            TorznabPluginNotFound: Plugin does not exist.
+            TorznabUnsupportedPlugin: Plugin has unsupported scraping mode.
+        """
         # === 1) Validate Query ===
         if q.action != "search":
             raise TorznabBadRequest("TorznabSearchUseCase only supports action=search")
@@ -76,6 +276,10 @@ class TorznabSearchUseCase:
             raise TorznabBadRequest("Missing query parameter 'q'")
         if not q.plugin_name:
             raise TorznabBadRequest("Missing plugin name")
+        if q.limit is not None and q.limit < 1:
+            raise TorznabBadRequest("Parameter 'limit' must be >= 1")
+        if q.offset is not None and q.offset < 0:
+            raise TorznabBadRequest("Parameter 'offset' must be >= 0")
 
         # === 2) Plugin Discovery and Validation ===
         self.plugins.discover()
@@ -94,85 +298,87 @@ class TorznabSearchUseCase:
         if mode != "scrapy":
             raise TorznabUnsupportedPlugin(f"Unsupported scraping.mode: {mode}")
 
-        # === 3) Execute Search (includes link validation) ===
+        return plugin
+
+    async def _to_item(self, q: TorznabQuery, raw_result: object) -> _Converted | None:
+        """Transform one SearchResult → CrawlJob → TorznabItem.
+
+        Returns:
+            (TorznabItem enriched with job_id, stored CrawlJob), or None if
+            CrawlJob generation fails.
+        """
         try:
-            # NOTE: SearchEngine.search() now returns validated SearchResult objects
-            raw_results: list = await self.engine.search(
-                plugin,
-                q.query,
-                category=q.category,  # Pass category if available
+            # === 4) Transform Result → CrawlJob → TorznabItem ===
+            # 4a) Build base TorznabItem from SearchResult
+            base_item = TorznabItem(
+                title=cast(str, getattr(raw_result, "title", "Unknown")),
+                download_url=cast(str, getattr(raw_result, "download_link", "")),
+                seeders=cast(int | None, getattr(raw_result, "seeders", None)),
+                peers=cast(int | None, getattr(raw_result, "leechers", None)),
+                size=cast(str | None, getattr(raw_result, "size", None)),
+                source_url=cast(str | None, getattr(raw_result, "source_url", None)),
+                release_name=cast(
+                    str | None, getattr(raw_result, "release_name", None)
+                ),
+                description=cast(str | None, getattr(raw_result, "description", None)),
+                category=cast(int, getattr(raw_result, "category", 2000)),
             )
-        except TorznabExternalError:
-            raise
-        except Exception as e:
-            raise TorznabExternalError(f"Search engine error: {str(e)}") from e
 
-        if not raw_results:
-            log.info(
-                "torznab_search_no_results",
+            # 4b) Generate CrawlJob from SearchResult (NEW: via Factory)
+            # (links only count as validated if the engine checked them)
+            crawljob = self.crawljob_factory.create_from_search_result(
+                raw_result, validated=self.validation_mode == "inline"
+            )
+
+            # 4c) Store CrawlJob in repository
+            await self.crawljob_repo.save(crawljob)
+
+            # 4d) Enrich TorznabItem with job_id
+            enriched_item = dataclass_replace(base_item, job_id=crawljob.job_id)
+
+            log.debug(
+                "crawljob_generated",
                 plugin=q.plugin_name,
                 query=q.query,
+                job_id=enriched_item.job_id,
+                title=enriched_item.title,
+                validated_url_count=len(crawljob.validated_urls),  # NEW
+                unchecked_url_count=len(crawljob.unchecked_urls),
             )
-            return []
-
-        # === 4) Transform Results → CrawlJobs → TorznabItems ===
-        items: list[TorznabItem] = []
-        for raw_result in raw_results:
-            try:
-                # 4a) Build base TorznabItem from SearchResult
-                base_item = TorznabItem(
-                    title=cast(str, getattr(raw_result, "title", "Unknown")),
-                    download_url=cast(str, getattr(raw_result, "download_link", "")),
-                    seeders=cast(int | None, getattr(raw_result, "seeders", None)),
-                    peers=cast(int | None, getattr(raw_result, "leechers", None)),
-                    size=cast(str | None, getattr(raw_result, "size", None)),
-                    source_url=cast(
-                        str | None, getattr(raw_result, "source_url", None)
-                    ),
-                    release_name=cast(
-                        str | None, getattr(raw_result, "release_name", None)
-                    ),
-                    description=cast(
-                        str | None, getattr(raw_result, "description", None)
-                    ),
-                    category=cast(int, getattr(raw_result, "category", 2000)),
-                )
+            return enriched_item, crawljob
 
-                # 4b) Generate CrawlJob from SearchResult (NEW: via Factory)
-                crawljob = self.crawljob_factory.create_from_search_result(raw_result)
+        except Exception as e:
+            # Skip result if CrawlJob generation fails (e.g., invalid data)
+            log.warning(
+                "crawljob_generation_failed",
+                plugin=q.plugin_name,
+                query=q.query,
+                result_title=getattr(raw_result, "title", "unknown"),
+                error=str(e),
+            )
+            return None
 
-                # 4c) Store CrawlJob in repository
-                await self.crawljob_repo.save(crawljob)
 
-                # 4d) Enrich TorznabItem with job_id
-                enriched_item = dataclass_replace(base_item, job_id=crawljob.job_id)
-                items.append(enriched_item)
+# The engine's crawl budget counts results before link validation; asking
+# for this many times the needed results leaves room for dead links
+_OVERFETCH_FACTOR = 2
 
-                log.debug(
-                    "crawljob_generated",
-                    plugin=q.plugin_name,
-                    query=q.query,
-                    job_id=enriched_item.job_id,
-                    title=enriched_item.title,
-                    validated_url_count=len(crawljob.validated_urls),  # NEW
-                )
 
-            except Exception as e:
-                # Skip result if CrawlJob generation fails (e.g., invalid data)
-                log.warning(
-                    "crawljob_generation_failed",
-                    plugin=q.plugin_name,
-                    query=q.query,
-                    result_title=getattr(raw_result, "title", "unknown"),
-                    error=str(e),
-                )
-                continue
+def _crawl_budget(q: TorznabQuery, cap: int | None = None) -> int | None:
+    """Crawl budget for q's offset/limit: over-fetched, at most `cap`.
 
-        log.info(
-            "torznab_search_completed",
-            plugin=q.plugin_name,
-            query=q.query,
-            raw_result_count=len(raw_results),
-            crawljob_count=len(items),
-        )
-        return items
+    Without a limit the crawl is bounded by the plugin only (max_links,
+    pagination.max_pages).
+    """
+    if q.limit is None:
+        return None
+    budget = _OVERFETCH_FACTOR * ((q.offset or 0) + q.limit)
+    return budget if cap is None else min(budget, cap)
+
+
+def _select_page(q: TorznabQuery, results: list[object]) -> list[object]:
+    """Results of q's offset/limit window, in document order."""
+    ordered = sorted(results, key=lambda r: getattr(r, "position", ()))
+    start = q.offset or 0
+    end = None if q.limit is None else start + q.limit
+    return ordered[start:end]
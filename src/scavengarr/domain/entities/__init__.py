@@ -7,8 +7,10 @@ from .torznab import (
     TorznabIndexInfo,
     TorznabItem,
     TorznabNoPluginsAvailable,
+    TorznabPartialResults,
     TorznabPluginNotFound,
     TorznabQuery,
+    TorznabResultSet,
     TorznabUnsupportedAction,
     TorznabUnsupportedPlugin,
 )
@@ -22,8 +24,10 @@ __all__ = [
     "TorznabIndexInfo",
     "TorznabItem",
     "TorznabNoPluginsAvailable",
+    "TorznabPartialResults",
     "TorznabPluginNotFound",
     "TorznabQuery",
+    "TorznabResultSet",
     "TorznabUnsupportedAction",
     "TorznabUnsupportedPlugin",
 ]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
@@ -46,6 +47,10 @@ class CrawlJob:
 
     Validation metadata:
         validated_urls: List of validated download links (from link validator).
+        unchecked_urls: Download links not validated yet (deferred/on-download
+            validation); they move to validated_urls once checked.
+        validated_at: When the links were last checked after the job was
+            stored (deferred/on-download validation; None = not checked).
         source_url: Original indexer page URL.
         created_at: Timestamp when job was created.
         expires_at: Expiration timestamp (default: 1 hour after creation).
@@ -73,6 +78,8 @@ class CrawlJob:
 
     # === Validation Metadata (Scavengarr-specific) ===
     validated_urls: list[str] = field(default_factory=list)
+    unchecked_urls: list[str] = field(default_factory=list)
+    validated_at: Optional[datetime] = None
     source_url: Optional[str] = None
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     expires_at: datetime = field(
@@ -109,6 +116,33 @@ class CrawlJob:
         """
         return datetime.now(timezone.utc) > self.expires_at
 
+    def apply_link_verdicts(self, verdicts: Mapping[str, bool]) -> None:
+        """Keep only the links a validator found reachable.
+
+        The unchecked links (else the validated ones) are judged; the live
+        ones become `validated_urls`. Links without a verdict are kept. If
+        none is reachable, `text` is left as is and `validated_urls` becomes
+        empty (see has_live_links).
+
+        Args:
+            verdicts: Mapping url -> is_valid.
+        """
+        checked = self.unchecked_urls or self.validated_urls
+        live = [url for url in checked if verdicts.get(url, True)]
+        self.validated_urls = live
+        self.unchecked_urls = []
+        if live:
+            self.text = "\n".join(live)
+        self.validated_at = datetime.now(timezone.utc)
+
+    def is_pending(self) -> bool:
+        """True while the job's links wait for validation."""
+        return bool(self.unchecked_urls)
+
+    def has_live_links(self) -> bool:
+        """False only if a validation found every link dead."""
+        return self.validated_at is None or bool(self.validated_urls)
+
     def to_crawljob_format(self) -> str:
         """Serialize to JDownloader .crawljob format.
 
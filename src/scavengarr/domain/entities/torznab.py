@@ -42,6 +42,14 @@ class TorznabItem:
     upload_volume_factor: float = 0.0
 
 
+@dataclass(frozen=True)
+class TorznabResultSet:
+    items: list[TorznabItem]
+    # True if the search deadline expired before the crawl/validation finished,
+    # or pages were skipped because the indexer became unavailable mid-crawl
+    partial: bool = False
+
+
 @dataclass(frozen=True)
 class TorznabCaps:
     server_title: str
@@ -83,3 +91,7 @@ class TorznabUnsupportedPlugin(TorznabError):
 
 class TorznabExternalError(TorznabError):
     """Network / parsing / upstream errors (plugin external dependency)."""
+
+
+class TorznabPartialResults(TorznabError):
+    """Raised by a search stream after its last result if pages were skipped."""
@@ -8,11 +8,18 @@ from pydantic import BaseModel, Field, HttpUrl, field_validator, model_validator
 PLUGIN_NAME_RE = r"^[a-z0-9-]+$"
 SEMVER_RE = r"^\d+\.\d+\.\d+$"
 
+# Links to next_stage followed per page when a stage sets no max_links
+DEFAULT_MAX_LINKS = 10
+
 
 class HttpOverrides(BaseModel):
     timeout_seconds: Optional[float] = None
     follow_redirects: Optional[bool] = None
     user_agent: Optional[str] = None
+    # Connection limit of the plugin's own pool (default: app-wide http limit)
+    max_connections: Optional[int] = None
+    # HTTP/2 for the plugin's own pool (default: app-wide http.http2)
+    http2: Optional[bool] = None
 
     @field_validator("timeout_seconds")
     @classmethod
@@ -23,21 +30,41 @@ class HttpOverrides(BaseModel):
             raise ValueError("http.timeout_seconds must be > 0")
         return v
 
+    @field_validator("max_connections")
+    @classmethod
+    def _validate_max_connections(cls, v: Optional[int]) -> Optional[int]:
+        if v is not None and v < 1:
+            raise ValueError("http.max_connections must be >= 1")
+        return v
+
 
 # === Multi-Stage Components ===
 
 
 class PaginationConfig(BaseModel):
-    """Pagination configuration for list stages"""
+    """
+    Pagination configuration for list stages.
+
+    Two modes:
+    - selector: follow the "next page" link, one page after another
+    - url_pattern: page URLs are predictable, e.g.
+      "/search/title/{query}/page/{page}"; pages 2..max_pages are fetched
+      concurrently (pages after the first empty one are discarded)
+    """
 
     enabled: bool = False
     selector: Optional[str] = None
+    url_pattern: Optional[str] = None
     max_pages: int = 1
 
     @model_validator(mode="after")
     def _validate_pagination(self) -> "PaginationConfig":
-        if self.enabled and not self.selector:
-            raise ValueError("pagination requires 'selector' when enabled")
+        if self.enabled and not (self.selector or self.url_pattern):
+            raise ValueError(
+                "pagination requires 'selector' or 'url_pattern' when enabled"
+            )
+        if self.url_pattern and "{page}" not in self.url_pattern:
+            raise ValueError("pagination url_pattern must contain '{page}'")
         if self.max_pages < 1:
             raise ValueError("max_pages must be >= 1")
         return self
@@ -180,10 +207,20 @@ class ScrapingStage(BaseModel):
     # Navigation
     next_stage: Optional[str] = None
     pagination: Optional[PaginationConfig] = None
+    # Follow at most this many links to next_stage per page (including the
+    # links of its pagination pages). None: DEFAULT_MAX_LINKS, or the
+    # search's result budget if larger (so a large Torznab limit can be met)
+    max_links: Optional[int] = None
 
     # Conditions for processing (optional)
     conditions: Optional[Dict[str, Any]] = None
 
+    # Cache extracted data per URL for this many seconds (None = no caching)
+    cache_ttl: Optional[int] = None
+    # Keep expired entries this much longer for conditional revalidation
+    # (ETag / Last-Modified). Defaults to cache_ttl.
+    cache_revalidate_ttl: Optional[int] = None
+
     @model_validator(mode="after")
     def _validate_stage(self) -> "ScrapingStage":
         # Must have either url or url_pattern
@@ -194,8 +231,22 @@ class ScrapingStage(BaseModel):
         if self.type == "list" and not self.selectors.link:
             raise ValueError("list stage should define 'link' selector")
 
+        if self.max_links is not None and self.max_links < 1:
+            raise ValueError("max_links must be >= 1")
+
+        if self.cache_ttl is not None and self.cache_ttl < 0:
+            raise ValueError("cache_ttl must be >= 0")
+        if self.cache_revalidate_ttl is not None and self.cache_revalidate_ttl < 0:
+            raise ValueError("cache_revalidate_ttl must be >= 0")
+
         return self
 
+    def link_limit(self, item_budget: Optional[int] = None) -> int:
+        """Links to next_stage followed per page (see max_links)."""
+        if self.max_links is not None:
+            return self.max_links
+        return max(DEFAULT_MAX_LINKS, item_budget or 0)
+
 
 # === Legacy Single-Stage Selectors (Backward Compatibility) ===
 
@@ -283,6 +334,41 @@ class ScrapingConfig(BaseModel):
     start_stage: Optional[str] = None  # Which stage to begin with
     max_depth: int = 5  # Recursion limit
     delay_seconds: float = 1.5  # Rate limiting
+    rate: Optional[float] = None  # Requests/second per host (default: 1/delay)
+    # Adaptive pacing may speed up to this rate (default: rate, only slow down)
+    max_rate: Optional[float] = Field(default=None, gt=0)
+    burst: int = 1  # Requests allowed back-to-back after idle time
+    max_concurrency: int = 4  # Parallel page fetches per search
+    parser: Literal["lxml", "bs4"] = "lxml"  # HTML parser backend
+    partial_parse: bool = True  # Parse only the regions the selectors can match
+    # Per-search deadline in seconds (overrides the global search deadline)
+    search_deadline_seconds: Optional[float] = Field(default=None, gt=0)
+    # Stop reading a response body after this many (decoded) bytes
+    max_response_bytes: Optional[int] = Field(default=8 * 1024 * 1024, gt=0)
+    # Hedge fetches slower than this latency percentile of the host (e.g. 0.9):
+    # send one duplicate, use the first answer (None = no hedging)
+    hedge_percentile: Optional[float] = Field(default=None, gt=0, lt=1)
+
+    @field_validator("rate")
+    @classmethod
+    def _validate_rate(cls, v: Optional[float]) -> Optional[float]:
+        if v is not None and v <= 0:
+            raise ValueError("rate must be > 0")
+        return v
+
+    @field_validator("burst")
+    @classmethod
+    def _validate_burst(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("burst must be >= 1")
+        return v
+
+    @field_validator("max_concurrency")
+    @classmethod
+    def _validate_max_concurrency(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        return v
 
     @model_validator(mode="after")
     def _validate_mode_requirements(self) -> "ScrapingConfig":
@@ -323,6 +409,20 @@ class ScrapingConfig(BaseModel):
 
         return self
 
+    def requests_per_second(
+        self, delay_seconds: Optional[float] = None
+    ) -> Optional[float]:
+        """
+        Effective per-host request rate.
+
+        Explicit `rate` wins; otherwise one request per `delay_seconds`.
+        Returns None when requests should not be limited (delay of 0).
+        """
+        if self.rate is not None:
+            return self.rate
+        delay = self.delay_seconds if delay_seconds is None else delay_seconds
+        return 1.0 / delay if delay > 0 else None
+
 
 # === Main Plugin Definition ===
 
@@ -331,7 +431,7 @@ class YamlPluginDefinition(BaseModel):
     """
     Declarative YAML plugin.
 
-    All plugin info lives in this file: name/version/base_url/scraping/auth.
+    All plugin info lives in this file: name/version/base_url/mirrors/scraping/auth.
 
     Supports both legacy single-stage and new multi-stage scraping.
     """
@@ -339,6 +439,9 @@ class YamlPluginDefinition(BaseModel):
     name: str = Field(pattern=PLUGIN_NAME_RE)
     version: str = Field(pattern=SEMVER_RE)
     base_url: HttpUrl
+    # Further base URLs serving the same site (mirror domains); searches go
+    # to the best-performing one, fetches fail over between them
+    mirrors: List[HttpUrl] = Field(default_factory=list)
 
     scraping: ScrapingConfig
     auth: Optional[AuthConfig] = None
@@ -351,6 +454,10 @@ class YamlPluginDefinition(BaseModel):
     def _validate_name(cls, v: str) -> str:
         return v.strip()
 
+    def mirror_urls(self) -> List[str]:
+        """All base URLs: base_url first, then the mirrors (no duplicates)."""
+        return list(dict.fromkeys([str(self.base_url), *map(str, self.mirrors)]))
+
     @model_validator(mode="after")
     def _default_auth(self) -> "YamlPluginDefinition":
         if self.auth is None:
@@ -22,6 +22,18 @@ class LinkValidatorPort(Protocol):
         """
         ...
 
+    async def validate_any(self, urls: list[str], *, fan_out: int = 3) -> list[str]:
+        """Race alternative links; stop once one is reachable.
+
+        Args:
+            urls: Alternative download links (e.g. mirrors), preferred first.
+            fan_out: Max links checked at the same time.
+
+        Returns:
+            Links found reachable (empty if all are dead).
+        """
+        ...
+
     async def validate_batch(self, urls: list[str]) -> dict[str, bool]:
         """Validate multiple URLs concurrently.
 
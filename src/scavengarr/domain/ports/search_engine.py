@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Protocol
+from collections.abc import AsyncIterator
+from typing import Any, Protocol
 
 from scavengarr.domain.plugins.base import SearchResult
 from scavengarr.domain.ports.plugin_registry import PluginRegistryPort
@@ -8,5 +9,17 @@ from scavengarr.domain.ports.plugin_registry import PluginRegistryPort
 
 class SearchEnginePort(Protocol):
     async def search(
-        self, plugin: PluginRegistryPort, query: str
+        self,
+        plugin: PluginRegistryPort,
+        query: str,
+        max_results: int | None = None,
+        **params: Any,
     ) -> list[SearchResult]: ...
+
+    def iter_search(
+        self,
+        plugin: PluginRegistryPort,
+        query: str,
+        max_results: int | None = None,
+        **params: Any,
+    ) -> AsyncIterator[SearchResult]: ...
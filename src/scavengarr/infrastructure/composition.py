@@ -6,11 +6,23 @@ from typing import AsyncIterator, cast
 import httpx
 import structlog
 from fastapi import FastAPI
+from scavengarr.infrastructure.cache.factory import create_cache
 
 # CHANGED: Import CrawlJobFactory instead of CrawlJobService
 from scavengarr.application.factories import CrawlJobFactory
+from scavengarr.application.use_cases import CrawlJobValidationUseCase
 from scavengarr.domain.entities.crawljob import Priority  # NEW: For factory config
-from scavengarr.infrastructure.cache.factory import create_cache
+from scavengarr.infrastructure.http import (
+    AdaptivePacer,
+    HostCircuitBreakers,
+    HostRateLimiter,
+    HttpClientRegistry,
+    MirrorHealth,
+    PooledTransport,
+    RequestHedger,
+    SingleFlight,
+)
+from scavengarr.infrastructure.parsing import ParsePool
 from scavengarr.infrastructure.persistence.crawljob_cache import (
     CacheCrawlJobRepository,
 )
@@ -18,6 +30,7 @@ from scavengarr.infrastructure.plugins import PluginRegistry
 from scavengarr.infrastructure.torznab.httpx_scrapy_engine import (
     HttpxScrapySearchEngine,
 )
+from scavengarr.infrastructure.validation import LinkProbe
 from scavengarr.interfaces.app_state import AppState
 
 log = structlog.get_logger(__name__)
@@ -29,9 +42,12 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     Order matters:
         1. Cache (required by other components)
-        2. HTTP Client (required by search engine)
+        2. HTTP Client + per-plugin client registry + rate limiter/pacer +
+           circuit breakers + request hedger + mirror scores + link probe +
+           single-flight + parse pool
+           (required by search engine)
         3. Plugin Registry
-        4. Search Engine (uses HTTP client + cache)
+        4. Search Engine (uses HTTP client + rate limiter + parse pool + cache)
         5. CrawlJob Repository (uses cache)
         6. CrawlJob Factory (stateless, no dependencies)
     """
@@ -57,26 +73,102 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         log.debug("cache_cleared", environment="dev")
 
     # ========== 2) HTTP Client (shared resource) ==========
+    # Explicitly sized pool (HTTP/2 if available), instrumented for /stats
+    state.http_pool = PooledTransport(
+        limits=httpx.Limits(
+            max_connections=config.http_max_connections,
+            max_keepalive_connections=config.http_max_keepalive,
+            keepalive_expiry=config.http_keepalive_expiry,
+        ),
+        http2=config.http_http2,
+    )
     state.http_client = httpx.AsyncClient(
+        transport=state.http_pool,
         timeout=httpx.Timeout(config.http_timeout_seconds),
         headers={"User-Agent": config.http_user_agent},
         follow_redirects=config.http_follow_redirects,
     )
-    log.info("http_client_initialized")
+    log.info(
+        "http_client_initialized",
+        http2=state.http_pool.http2,
+        max_connections=config.http_max_connections,
+        max_keepalive=config.http_max_keepalive,
+        accept_encoding=state.http_client.headers.get("Accept-Encoding"),
+    )
+
+    # Per-plugin clients for scraping (own pools, plugin http overrides),
+    # created on first use
+    state.http_clients = HttpClientRegistry(
+        timeout_seconds=config.http_timeout_seconds,
+        user_agent=config.http_user_agent,
+        follow_redirects=config.http_follow_redirects,
+        limits=state.http_pool.limits,
+        http2=config.http_http2,
+    )
+
+    # Process-wide per-host rate limiter (shared by scraping + link validation)
+    state.rate_limiter = HostRateLimiter()
+
+    # Adaptive pacing of indexer hosts (learned rates persisted in the cache)
+    state.pacer = AdaptivePacer(state.rate_limiter, cache=state.cache)
+
+    # Process-wide per-host circuit breakers (indexer fetches fail fast
+    # while a host is down)
+    state.circuit_breakers = HostCircuitBreakers(
+        failure_threshold=config.circuit_failure_threshold,
+        failure_rate=config.circuit_failure_rate,
+        open_seconds=config.circuit_open_seconds,
+    )
+
+    # Per-host latency percentiles for hedged fetches (scraping.hedge_percentile)
+    state.hedger = RequestHedger()
+
+    # Rolling latency/health per mirror host (searches go to the best mirror)
+    state.mirror_health = MirrorHealth()
+
+    # HEAD / ranged-GET probe with the working method learned per host
+    # (link validation + indexer health checks)
+    state.link_probe = LinkProbe(state.rate_limiter)
+
+    # Process-wide coalescing of identical in-flight page fetches
+    state.single_flight = SingleFlight()
+
+    # Worker pool for page parsing/extraction (keeps the event loop free)
+    state.parse_pool = ParsePool(
+        kind=config.parse_pool_kind,
+        max_workers=config.parse_pool_workers,
+    )
 
     # ========== 3) Plugin Registry ==========
     state.plugins = PluginRegistry(plugin_dir=config.plugin_dir)
     state.plugins.discover()
     log.info("plugins_discovered", count=len(state.plugins.list_names()))
 
-    # ========== 4) Search Engine (uses http_client + cache) ==========
-    state.search_engine = HttpxScrapySearchEngine(
+    # ========== 4) Search Engine (uses http_client + rate_limiter + cache) ==========
+    # Deferred/on-download modes take validation off the search path
+    validate_links = config.validate_download_links
+    search_engine = HttpxScrapySearchEngine(
         http_client=state.http_client,
         cache=state.cache,
-        validate_links=config.validate_download_links,
+        validate_links=validate_links and config.validation_mode == "inline",
         validation_timeout=config.validation_timeout_seconds,
         validation_concurrency=config.validation_max_concurrent,
+        validation_fan_out=config.validation_fan_out,
+        validation_max_per_host=config.validation_max_per_host,
+        validation_host_limits=config.validation_host_limits,
+        validation_positive_ttl=config.validation_positive_ttl_seconds,
+        validation_negative_ttl=config.validation_negative_ttl_seconds,
+        rate_limiter=state.rate_limiter,
+        parse_pool=state.parse_pool,
+        single_flight=state.single_flight,
+        client_registry=state.http_clients,
+        circuit_breakers=state.circuit_breakers,
+        pacer=state.pacer,
+        hedger=state.hedger,
+        mirror_health=state.mirror_health,
+        link_probe=state.link_probe,
     )
+    state.search_engine = search_engine
     log.info("search_engine_initialized")
 
     # ========== 5) CrawlJob Repository (uses cache) ==========
@@ -95,15 +187,32 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     )
     log.info("crawljob_factory_initialized")
 
+    # ========== 7) CrawlJob link validation (deferred / on_download) ==========
+    state.crawljob_validation = (
+        CrawlJobValidationUseCase(
+            link_validator=search_engine.link_validator,
+            crawljob_repo=state.crawljob_repo,
+        )
+        if validate_links and config.validation_mode != "inline"
+        else None
+    )
+    log.info("validation_mode_configured", mode=config.validation_mode)
+
     log.info("app_startup_complete")
 
     try:
         yield  # ✅ App runs here
     finally:
         # ========== Cleanup (reverse order) ==========
+        if state.crawljob_validation is not None:
+            await state.crawljob_validation.aclose()
+
+        await state.http_clients.aclose()
         await state.http_client.aclose()
         log.info("http_client_closed")
 
+        state.parse_pool.close()
+
         await state.cache.aclose()
         log.info("cache_closed")
 
@@ -14,6 +14,31 @@ DEFAULT_CONFIG: dict[str, Any] = {
         "timeout_seconds": 30.0,
         "follow_redirects": True,
         "user_agent": "Scavengarr/0.1.0 (+https://github.com/Strob0t/Scavengarr)",
+        "max_connections": 100,
+        "max_keepalive": 20,
+        "keepalive_expiry": 5.0,
+        "http2": True,
+    },
+    "circuit_breaker": {
+        "failure_threshold": 5,
+        "failure_rate": 0.5,
+        "open_seconds": 30.0,
+    },
+    "search": {
+        "deadline_seconds": None,
+        "max_results": 500,
+    },
+    "validation": {
+        "mode": "inline",
+        "fan_out": 3,
+        "max_per_host": 4,
+        "host_limits": {},
+        "positive_ttl_seconds": 6 * 3600,
+        "negative_ttl_seconds": 15 * 60,
+    },
+    "parsing": {
+        "pool": "thread",
+        "workers": 4,
     },
     "playwright": {
         "headless": True,
@@ -10,7 +10,17 @@ from dotenv import load_dotenv
 from .defaults import DEFAULT_CONFIG
 from .schema import AppConfig, EnvOverrides
 
-_SECTION_KEYS: set[str] = {"plugins", "http", "playwright", "logging", "cache"}
+_SECTION_KEYS: set[str] = {
+    "plugins",
+    "http",
+    "circuit_breaker",
+    "search",
+    "validation",
+    "parsing",
+    "playwright",
+    "logging",
+    "cache",
+}
 
 
 def _deep_merge(base: dict[str, Any], override: Mapping[str, Any]) -> dict[str, Any]:
@@ -37,6 +47,14 @@ def _normalize_layer(data: Mapping[str, Any]) -> dict[str, Any]:
     - app_name, environment
     - plugins.plugin_dir
     - http.timeout_seconds, http.follow_redirects, http.user_agent
+    - http.max_connections, http.max_keepalive, http.keepalive_expiry, http.http2
+    - circuit_breaker.failure_threshold, circuit_breaker.failure_rate,
+      circuit_breaker.open_seconds
+    - search.deadline_seconds, search.max_results
+    - validation.mode, validation.fan_out
+    - validation.max_per_host, validation.host_limits
+    - validation.positive_ttl_seconds, validation.negative_ttl_seconds
+    - parsing.pool, parsing.workers
     - playwright.headless, playwright.timeout_ms
     - logging.level, logging.format
     - cache.dir, cache.ttl_seconds
@@ -60,6 +78,23 @@ def _normalize_layer(data: Mapping[str, Any]) -> dict[str, Any]:
         "http_timeout_seconds": ("http", "timeout_seconds"),
         "http_follow_redirects": ("http", "follow_redirects"),
         "http_user_agent": ("http", "user_agent"),
+        "http_max_connections": ("http", "max_connections"),
+        "http_max_keepalive": ("http", "max_keepalive"),
+        "http_keepalive_expiry": ("http", "keepalive_expiry"),
+        "http_http2": ("http", "http2"),
+        "circuit_failure_threshold": ("circuit_breaker", "failure_threshold"),
+        "circuit_failure_rate": ("circuit_breaker", "failure_rate"),
+        "circuit_open_seconds": ("circuit_breaker", "open_seconds"),
+        "search_deadline_seconds": ("search", "deadline_seconds"),
+        "search_max_results": ("search", "max_results"),
+        "validation_mode": ("validation", "mode"),
+        "validation_fan_out": ("validation", "fan_out"),
+        "validation_max_per_host": ("validation", "max_per_host"),
+        "validation_host_limits": ("validation", "host_limits"),
+        "validation_positive_ttl_seconds": ("validation", "positive_ttl_seconds"),
+        "validation_negative_ttl_seconds": ("validation", "negative_ttl_seconds"),
+        "parse_pool_kind": ("parsing", "pool"),
+        "parse_pool_workers": ("parsing", "workers"),
         "playwright_headless": ("playwright", "headless"),
         "playwright_timeout_ms": ("playwright", "timeout_ms"),
         "log_level": ("logging", "level"),
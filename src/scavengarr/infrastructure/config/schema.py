@@ -13,9 +13,12 @@ from pydantic import (
 )
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from scavengarr.infrastructure.parsing.parse_pool import ParsePoolKind
+
 Environment = Literal["dev", "test", "prod"]
 LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR"]
 LogFormat = Literal["json", "console"]
+ValidationMode = Literal["inline", "deferred", "on_download"]
 
 
 def _normalize_path(value: Any) -> Path:
@@ -73,7 +76,9 @@ class AppConfig(BaseModel):
     Canonical application configuration (validated, final).
 
     Note:
-    - YAML is expected to be sectioned (plugins/http/playwright/logging/cache).
+    - YAML is expected to be sectioned
+      (plugins/http/circuit_breaker/search/validation/parsing/playwright/logging/
+      cache).
     - Environment variables are handled by EnvOverrides(BaseSettings) to allow strict
       precedence control (defaults < YAML < ENV < CLI) in load.py.
     """
@@ -120,6 +125,88 @@ class AppConfig(BaseModel):
         ),
         description="User-Agent for outgoing HTTP requests.",
     )
+    http_max_connections: int = Field(
+        default=100,
+        validation_alias=AliasChoices(
+            "http_max_connections",
+            AliasPath("http", "max_connections"),
+        ),
+        description="Max. open connections of the shared HTTP client pool.",
+    )
+    http_max_keepalive: int = Field(
+        default=20,
+        validation_alias=AliasChoices(
+            "http_max_keepalive",
+            AliasPath("http", "max_keepalive"),
+        ),
+        description="Max. idle keep-alive connections kept in the pool.",
+    )
+    http_keepalive_expiry: float = Field(
+        default=5.0,
+        validation_alias=AliasChoices(
+            "http_keepalive_expiry",
+            AliasPath("http", "keepalive_expiry"),
+        ),
+        description="Seconds an idle keep-alive connection is kept open.",
+    )
+    http_http2: bool = Field(
+        default=True,
+        validation_alias=AliasChoices(
+            "http_http2",
+            AliasPath("http", "http2"),
+        ),
+        description="Negotiate HTTP/2 (httpx[http2]; HTTP/1.1 without 'h2').",
+    )
+
+    # Circuit breaker per indexer host (YAML section: circuit_breaker.*)
+    circuit_failure_threshold: int = Field(
+        default=5,
+        validation_alias=AliasChoices(
+            "circuit_failure_threshold",
+            AliasPath("circuit_breaker", "failure_threshold"),
+        ),
+        description="Consecutive failures that open a host's circuit.",
+    )
+    circuit_failure_rate: float = Field(
+        default=0.5,
+        validation_alias=AliasChoices(
+            "circuit_failure_rate",
+            AliasPath("circuit_breaker", "failure_rate"),
+        ),
+        description="Failure share of a host's recent requests that opens it.",
+    )
+    circuit_open_seconds: float = Field(
+        default=30.0,
+        validation_alias=AliasChoices(
+            "circuit_open_seconds",
+            AliasPath("circuit_breaker", "open_seconds"),
+        ),
+        description="Seconds a circuit stays open before a trial request.",
+    )
+
+    # Search deadline (YAML section: search.*)
+    search_deadline_seconds: Optional[float] = Field(
+        default=None,
+        validation_alias=AliasChoices(
+            "search_deadline_seconds",
+            AliasPath("search", "deadline_seconds"),
+        ),
+        description=(
+            "Per-search deadline; partial results are returned when hit "
+            "(None = no deadline)."
+        ),
+    )
+    search_max_results: int = Field(
+        default=500,
+        validation_alias=AliasChoices(
+            "search_max_results",
+            AliasPath("search", "max_results"),
+        ),
+        description=(
+            "Most results a paged search crawls for (caps offset + limit; "
+            "pages beyond it are empty)."
+        ),
+    )
 
     # Link validation toggle
     validate_download_links: bool = Field(
@@ -135,6 +222,77 @@ class AppConfig(BaseModel):
         description="Max parallel link validations",
     )
 
+    # Link validation scheduling + verdict cache (YAML section: validation.*)
+    validation_mode: ValidationMode = Field(
+        default="inline",
+        validation_alias=AliasChoices(
+            "validation_mode",
+            AliasPath("validation", "mode"),
+        ),
+        description=(
+            "When links are validated: inline (before results are returned), "
+            "deferred (in the background after the search) or on_download."
+        ),
+    )
+    validation_fan_out: int = Field(
+        default=3,
+        validation_alias=AliasChoices(
+            "validation_fan_out",
+            AliasPath("validation", "fan_out"),
+        ),
+        description="Max alternative links of one result validated at once.",
+    )
+    validation_max_per_host: int = Field(
+        default=4,
+        validation_alias=AliasChoices(
+            "validation_max_per_host",
+            AliasPath("validation", "max_per_host"),
+        ),
+        description="Max parallel link validations per hoster.",
+    )
+    validation_host_limits: dict[str, int] = Field(
+        default_factory=dict,
+        validation_alias=AliasChoices(
+            "validation_host_limits",
+            AliasPath("validation", "host_limits"),
+        ),
+        description="Per-hoster overrides of max_per_host (domain -> limit).",
+    )
+    validation_positive_ttl_seconds: int = Field(
+        default=6 * 3600,
+        validation_alias=AliasChoices(
+            "validation_positive_ttl_seconds",
+            AliasPath("validation", "positive_ttl_seconds"),
+        ),
+        description="Seconds a 'link alive' verdict is cached (0 = not cached).",
+    )
+    validation_negative_ttl_seconds: int = Field(
+        default=15 * 60,
+        validation_alias=AliasChoices(
+            "validation_negative_ttl_seconds",
+            AliasPath("validation", "negative_ttl_seconds"),
+        ),
+        description="Seconds a 'link dead' verdict is cached (0 = not cached).",
+    )
+
+    # Parsing worker pool (YAML section: parsing.*)
+    parse_pool_kind: ParsePoolKind = Field(
+        default="thread",
+        validation_alias=AliasChoices(
+            "parse_pool_kind",
+            AliasPath("parsing", "pool"),
+        ),
+        description="Parse pool kind: thread, process or inline (event loop).",
+    )
+    parse_pool_workers: int = Field(
+        default=4,
+        validation_alias=AliasChoices(
+            "parse_pool_workers",
+            AliasPath("parsing", "workers"),
+        ),
+        description="Number of parse workers (ignored for inline).",
+    )
+
     # Playwright (YAML section: playwright.*)
     playwright_headless: bool = Field(
         default=True,
@@ -203,6 +361,99 @@ class AppConfig(BaseModel):
             raise ValueError("http_timeout_seconds must be > 0")
         return v
 
+    @field_validator("http_max_connections")
+    @classmethod
+    def _validate_http_max_connections(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("http_max_connections must be >= 1")
+        return v
+
+    @field_validator("http_max_keepalive")
+    @classmethod
+    def _validate_http_max_keepalive(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("http_max_keepalive must be >= 0")
+        return v
+
+    @field_validator("http_keepalive_expiry")
+    @classmethod
+    def _validate_http_keepalive_expiry(cls, v: float) -> float:
+        if v < 0:
+            raise ValueError("http_keepalive_expiry must be >= 0")
+        return v
+
+    @field_validator("circuit_failure_threshold")
+    @classmethod
+    def _validate_circuit_failure_threshold(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("circuit_failure_threshold must be >= 1")
+        return v
+
+    @field_validator("circuit_failure_rate")
+    @classmethod
+    def _validate_circuit_failure_rate(cls, v: float) -> float:
+        if not 0 < v <= 1:
+            raise ValueError("circuit_failure_rate must be in (0, 1]")
+        return v
+
+    @field_validator("circuit_open_seconds")
+    @classmethod
+    def _validate_circuit_open_seconds(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("circuit_open_seconds must be > 0")
+        return v
+
+    @field_validator("search_deadline_seconds")
+    @classmethod
+    def _validate_search_deadline(cls, v: Optional[float]) -> Optional[float]:
+        if v is not None and v <= 0:
+            raise ValueError("search_deadline_seconds must be > 0 (or null)")
+        return v
+
+    @field_validator("search_max_results")
+    @classmethod
+    def _validate_search_max_results(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("search_max_results must be >= 1")
+        return v
+
+    @field_validator("validation_fan_out")
+    @classmethod
+    def _validate_validation_fan_out(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("validation_fan_out must be >= 1")
+        return v
+
+    @field_validator("validation_max_per_host")
+    @classmethod
+    def _validate_validation_max_per_host(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("validation_max_per_host must be >= 1")
+        return v
+
+    @field_validator("validation_host_limits")
+    @classmethod
+    def _validate_validation_host_limits(cls, v: dict[str, int]) -> dict[str, int]:
+        if any(limit < 1 for limit in v.values()):
+            raise ValueError("validation_host_limits values must be >= 1")
+        return v
+
+    @field_validator(
+        "validation_positive_ttl_seconds", "validation_negative_ttl_seconds"
+    )
+    @classmethod
+    def _validate_validation_ttl(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("validation verdict TTLs must be >= 0")
+        return v
+
+    @field_validator("parse_pool_workers")
+    @classmethod
+    def _validate_parse_pool_workers(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("parse_pool_workers must be >= 1")
+        return v
+
     @field_validator("playwright_timeout_ms")
     @classmethod
     def _validate_playwright_timeout(cls, v: int) -> int:
@@ -236,6 +487,31 @@ class AppConfig(BaseModel):
                 "timeout_seconds": self.http_timeout_seconds,
                 "follow_redirects": self.http_follow_redirects,
                 "user_agent": self.http_user_agent,
+                "max_connections": self.http_max_connections,
+                "max_keepalive": self.http_max_keepalive,
+                "keepalive_expiry": self.http_keepalive_expiry,
+                "http2": self.http_http2,
+            },
+            "circuit_breaker": {
+                "failure_threshold": self.circuit_failure_threshold,
+                "failure_rate": self.circuit_failure_rate,
+                "open_seconds": self.circuit_open_seconds,
+            },
+            "search": {
+                "deadline_seconds": self.search_deadline_seconds,
+                "max_results": self.search_max_results,
+            },
+            "validation": {
+                "mode": self.validation_mode,
+                "fan_out": self.validation_fan_out,
+                "max_per_host": self.validation_max_per_host,
+                "host_limits": dict(self.validation_host_limits),
+                "positive_ttl_seconds": self.validation_positive_ttl_seconds,
+                "negative_ttl_seconds": self.validation_negative_ttl_seconds,
+            },
+            "parsing": {
+                "pool": self.parse_pool_kind,
+                "workers": self.parse_pool_workers,
             },
             "playwright": {
                 "headless": self.playwright_headless,
@@ -278,6 +554,27 @@ class EnvOverrides(BaseSettings):
     http_timeout_seconds: Optional[float] = None
     http_follow_redirects: Optional[bool] = None
     http_user_agent: Optional[str] = None
+    http_max_connections: Optional[int] = None
+    http_max_keepalive: Optional[int] = None
+    http_keepalive_expiry: Optional[float] = None
+    http_http2: Optional[bool] = None
+
+    circuit_failure_threshold: Optional[int] = None
+    circuit_failure_rate: Optional[float] = None
+    circuit_open_seconds: Optional[float] = None
+
+    search_deadline_seconds: Optional[float] = None
+    search_max_results: Optional[int] = None
+
+    validation_mode: Optional[ValidationMode] = None
+    validation_fan_out: Optional[int] = None
+    validation_max_per_host: Optional[int] = None
+    validation_host_limits: Optional[dict[str, int]] = None
+    validation_positive_ttl_seconds: Optional[int] = None
+    validation_negative_ttl_seconds: Optional[int] = None
+
+    parse_pool_kind: Optional[ParsePoolKind] = None
+    parse_pool_workers: Optional[int] = None
 
     playwright_headless: Optional[bool] = None
     playwright_timeout_ms: Optional[int] = None
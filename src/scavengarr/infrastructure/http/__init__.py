@@ -0,0 +1,34 @@
+"""Shared HTTP infrastructure (pools, rate limiting, breakers, hedging, coalescing)."""
+
+from .circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    HostCircuitBreakers,
+)
+from .client_registry import HttpClientRegistry
+from .hedging import RequestHedger
+from .mirrors import MirrorHealth
+from .pacing import AdaptivePacer, parse_retry_after
+from .pool import HttpPoolStats, PooledTransport, http2_available
+from .rate_limiter import HostRateLimiter, TokenBucket, host_of
+from .single_flight import SingleFlight
+
+__all__ = [
+    "AdaptivePacer",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
+    "HostCircuitBreakers",
+    "HostRateLimiter",
+    "HttpClientRegistry",
+    "HttpPoolStats",
+    "MirrorHealth",
+    "PooledTransport",
+    "RequestHedger",
+    "SingleFlight",
+    "TokenBucket",
+    "host_of",
+    "http2_available",
+    "parse_retry_after",
+]
@@ -0,0 +1,218 @@
+"""Per-host circuit breakers: fail fast instead of retrying a host that is down."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Any, Callable, Literal
+
+import structlog
+
+from .rate_limiter import host_of
+
+log = structlog.get_logger(__name__)
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+# Outcomes kept for the failure rate, and how many are needed to judge it
+_WINDOW = 20
+_MIN_CALLS = 10
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+    def __init__(self, host: str, retry_in: float) -> None:
+        super().__init__(f"circuit open for {host} (retry in {retry_in:.1f}s)")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Circuit breaker for one host.
+
+    States:
+        - closed: requests pass; outcomes are recorded
+        - open: requests are rejected (CircuitOpenError) for `open_seconds`
+        - half_open: after that, one trial request at a time is let through;
+          success closes the circuit, failure opens it again
+
+    The circuit opens after `failure_threshold` consecutive failures, or
+    when at least `failure_rate` of the last 20 requests (judged from 10 on)
+    failed.
+
+    Args:
+        host: Host name (for logging).
+        failure_threshold: Consecutive failures that open the circuit.
+        failure_rate: Failure share of recent requests that opens it.
+        open_seconds: How long the circuit stays open before a trial.
+        clock: Time source (monotonic seconds).
+    """
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = 5,
+        failure_rate: float = 0.5,
+        open_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.failure_rate = failure_rate
+        self.open_seconds = open_seconds
+        self._clock = clock
+
+        self._outcomes: deque[bool] = deque(maxlen=_WINDOW)
+        self._consecutive_failures = 0
+        self._opened_at: float | None = None
+        self._trial_at: float | None = None
+
+    @property
+    def state(self) -> CircuitState:
+        if self._opened_at is None:
+            return "closed"
+        if self._clock() - self._opened_at < self.open_seconds:
+            return "open"
+        return "half_open"
+
+    def retry_in(self) -> float:
+        """Seconds until the next request may be let through (0 if now)."""
+        if self._opened_at is None:
+            return 0.0
+        since = self._trial_at if self._trial_at is not None else self._opened_at
+        return max(0.0, since + self.open_seconds - self._clock())
+
+    def allow(self) -> bool:
+        """True if a request may be sent now (claims the half-open trial)."""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "open" or self.retry_in() > 0:
+            return False
+
+        # Half-open: one trial at a time (a trial that never reported back,
+        # e.g. cancelled, is replaced after open_seconds)
+        self._trial_at = self._clock()
+        log.info("circuit_half_open", host=self.host)
+        return True
+
+    def record_success(self) -> None:
+        self._outcomes.append(True)
+        self._consecutive_failures = 0
+        if self._opened_at is not None:
+            self._close()
+
+    def record_failure(self) -> None:
+        self._outcomes.append(False)
+        self._consecutive_failures += 1
+
+        if self._opened_at is not None:
+            if self._trial_at is not None:
+                self._open()  # trial failed
+            return
+
+        if (
+            self._consecutive_failures >= self.failure_threshold
+            or self._recent_failure_rate() >= self.failure_rate
+        ):
+            self._open()
+
+    def _recent_failure_rate(self) -> float:
+        if len(self._outcomes) < _MIN_CALLS:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def _open(self) -> None:
+        self._opened_at = self._clock()
+        self._trial_at = None
+        log.warning(
+            "circuit_opened",
+            host=self.host,
+            consecutive_failures=self._consecutive_failures,
+            failure_rate=round(self._recent_failure_rate(), 2),
+            open_seconds=self.open_seconds,
+        )
+
+    def _close(self) -> None:
+        self._opened_at = None
+        self._trial_at = None
+        self._outcomes.clear()
+        log.info("circuit_closed", host=self.host)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._consecutive_failures,
+            "failure_rate": round(self._recent_failure_rate(), 2),
+            "retry_in_seconds": round(self.retry_in(), 1),
+        }
+
+
+class HostCircuitBreakers:
+    """Process-wide circuit breakers, one per host (created on first use).
+
+    Args:
+        failure_threshold: Consecutive failures that open a circuit.
+        failure_rate: Failure share of recent requests that opens a circuit.
+        open_seconds: How long a circuit stays open before a trial request.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        failure_rate: float = 0.5,
+        open_seconds: float = 30.0,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.failure_rate = failure_rate
+        self.open_seconds = open_seconds
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def breaker(self, url: str) -> CircuitBreaker:
+        """Breaker of the host of `url` (a bare host name works too)."""
+        host = host_of(url) or url
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                host,
+                failure_threshold=self.failure_threshold,
+                failure_rate=self.failure_rate,
+                open_seconds=self.open_seconds,
+            )
+            self._breakers[host] = breaker
+        return breaker
+
+    def before_request(self, url: str) -> None:
+        """Raise CircuitOpenError if requests to the host of `url` are blocked."""
+        breaker = self.breaker(url)
+        if not breaker.allow():
+            log.debug("circuit_open_rejected", host=breaker.host, url=url)
+            raise CircuitOpenError(breaker.host, breaker.retry_in())
+
+    def record(self, url: str, success: bool) -> None:
+        """Record the outcome of a request to the host of `url`."""
+        breaker = self.breaker(url)
+        if success:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+
+    def snapshot(self, url: str) -> dict[str, Any]:
+        """State of the host's circuit (closed if it has not been used yet).
+
+        Read-only: an unused host gets no breaker registered.
+        """
+        breaker = self._breakers.get(host_of(url) or url)
+        if breaker is None:
+            return {
+                "state": "closed",
+                "consecutive_failures": 0,
+                "failure_rate": 0.0,
+                "retry_in_seconds": 0.0,
+            }
+        return breaker.snapshot()
+
+    def stats(self) -> dict[str, Any]:
+        """State per host."""
+        return {host: b.snapshot() for host, b in self._breakers.items()}
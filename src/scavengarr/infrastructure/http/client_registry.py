@@ -0,0 +1,145 @@
+"""Per-plugin HTTP clients, each with its own connection pool."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+import structlog
+
+from .pool import PooledTransport
+
+log = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class _ClientSettings:
+    """Effective HTTP settings of one plugin (app defaults + overrides)."""
+
+    timeout_seconds: float
+    user_agent: str
+    follow_redirects: bool
+    max_connections: int
+    http2: bool
+
+
+@dataclass(frozen=True)
+class _PluginClient:
+    settings: _ClientSettings
+    client: httpx.AsyncClient
+    transport: PooledTransport
+
+
+class HttpClientRegistry:
+    """Hands out one httpx.AsyncClient per plugin, created on first use.
+
+    Every plugin gets its own connection pool, so an indexer that hangs only
+    ties up its own connections instead of the ones other plugins need.
+    The client is built from the app-wide HTTP settings with the plugin's
+    `http:` block (HttpOverrides) applied: timeout_seconds, user_agent,
+    follow_redirects, max_connections and http2.
+
+    A reloaded plugin with changed overrides gets a new client; the old one
+    stays usable for requests still running and is closed by aclose().
+
+    Args:
+        timeout_seconds: Default request timeout.
+        user_agent: Default User-Agent header.
+        follow_redirects: Default redirect behaviour.
+        limits: Default pool limits (max_connections may be overridden).
+        http2: Default for negotiating HTTP/2 (if available).
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout_seconds: float,
+        user_agent: str,
+        follow_redirects: bool,
+        limits: httpx.Limits,
+        http2: bool = False,
+    ) -> None:
+        self._defaults = _ClientSettings(
+            timeout_seconds=timeout_seconds,
+            user_agent=user_agent,
+            follow_redirects=follow_redirects,
+            max_connections=limits.max_connections or 100,
+            http2=http2,
+        )
+        self._limits = limits
+        self._clients: dict[str, _PluginClient] = {}
+        self._retired: list[_PluginClient] = []
+
+    def client_for(self, plugin: Any) -> httpx.AsyncClient:
+        """Return the client of `plugin` (created on first use)."""
+        name = str(getattr(plugin, "name", "unknown"))
+        settings = self._settings_for(getattr(plugin, "http", None))
+
+        entry = self._clients.get(name)
+        if entry is not None and entry.settings == settings:
+            return entry.client
+        if entry is not None:
+            self._retired.append(entry)
+
+        entry = self._create(settings)
+        self._clients[name] = entry
+        log.info(
+            "plugin_http_client_created",
+            plugin=name,
+            timeout_seconds=settings.timeout_seconds,
+            follow_redirects=settings.follow_redirects,
+            max_connections=settings.max_connections,
+            http2=entry.transport.http2,
+        )
+        return entry.client
+
+    def _settings_for(self, overrides: Any) -> _ClientSettings:
+        defaults = self._defaults
+        if overrides is None:
+            return defaults
+
+        def pick(name: str) -> Any:
+            value = getattr(overrides, name, None)
+            return getattr(defaults, name) if value is None else value
+
+        return _ClientSettings(
+            timeout_seconds=pick("timeout_seconds"),
+            user_agent=pick("user_agent"),
+            follow_redirects=pick("follow_redirects"),
+            max_connections=pick("max_connections"),
+            http2=pick("http2"),
+        )
+
+    def _create(self, settings: _ClientSettings) -> _PluginClient:
+        limits = self._limits
+        transport = PooledTransport(
+            limits=httpx.Limits(
+                max_connections=settings.max_connections,
+                max_keepalive_connections=min(
+                    limits.max_keepalive_connections or 0, settings.max_connections
+                ),
+                keepalive_expiry=limits.keepalive_expiry,
+            ),
+            http2=settings.http2,
+        )
+        client = httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(settings.timeout_seconds),
+            headers={"User-Agent": settings.user_agent},
+            follow_redirects=settings.follow_redirects,
+        )
+        return _PluginClient(settings=settings, client=client, transport=transport)
+
+    def stats(self) -> dict[str, Any]:
+        """Pool counters per plugin (see PooledTransport.stats)."""
+        return {name: entry.transport.stats() for name, entry in self._clients.items()}
+
+    async def aclose(self) -> None:
+        """Close all clients (current and retired)."""
+        entries = [*self._clients.values(), *self._retired]
+        self._clients.clear()
+        self._retired.clear()
+        for entry in entries:
+            await entry.client.aclose()
+        log.info("http_client_registry_closed", clients=len(entries))
@@ -0,0 +1,92 @@
+"""Hedged requests: per-host latency percentiles and hedging counters."""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from .rate_limiter import host_of
+
+# Latency samples kept per host, and how many are needed before hedging
+_WINDOW = 100
+_MIN_SAMPLES = 20
+
+
+def _percentile(ordered: list[float], p: float) -> float | None:
+    """Nearest-rank percentile of sorted samples (None if empty)."""
+    if not ordered:
+        return None
+    index = min(len(ordered) - 1, math.ceil(p * len(ordered)) - 1)
+    return ordered[max(0, index)]
+
+
+@dataclass
+class _HostLatency:
+    """Recent fetch durations and hedging counters of one host."""
+
+    samples: deque[float] = field(default_factory=lambda: deque(maxlen=_WINDOW))
+    hedged: int = 0
+    hedge_wins: int = 0
+    budget_skipped: int = 0
+
+
+class RequestHedger:
+    """Decides when a slow fetch gets a duplicate request, and counts hedges.
+
+    Keeps the durations of recent successful fetches per host. A fetch that
+    has not finished after the host's latency percentile (e.g. p90) may be
+    hedged: the caller sends one duplicate, takes whichever answers first
+    and cancels the other. Hosts with fewer than 20 samples are not hedged.
+    """
+
+    def __init__(self) -> None:
+        self._hosts: dict[str, _HostLatency] = {}
+
+    def _host(self, url: str) -> _HostLatency:
+        host = host_of(url)
+        entry = self._hosts.get(host)
+        if entry is None:
+            entry = self._hosts[host] = _HostLatency()
+        return entry
+
+    def observe(self, url: str, seconds: float) -> None:
+        """Record the duration of a successful fetch from the host of `url`."""
+        self._host(url).samples.append(seconds)
+
+    def hedge_delay(self, url: str, percentile: float) -> float | None:
+        """Seconds after which a fetch should be hedged (None = not yet)."""
+        samples = self._host(url).samples
+        if len(samples) < _MIN_SAMPLES:
+            return None
+        return _percentile(sorted(samples), percentile)
+
+    def record_hedge(self, url: str) -> None:
+        """A duplicate request was sent."""
+        self._host(url).hedged += 1
+
+    def record_win(self, url: str) -> None:
+        """The duplicate answered first."""
+        self._host(url).hedge_wins += 1
+
+    def record_skipped(self, url: str) -> None:
+        """A hedge was due but the host's rate limit had no token to spare."""
+        self._host(url).budget_skipped += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Latency percentiles and hedging counters per host."""
+        out: dict[str, Any] = {}
+        for host, entry in self._hosts.items():
+            ordered = sorted(entry.samples)
+            p50 = _percentile(ordered, 0.5)
+            p90 = _percentile(ordered, 0.9)
+            out[host] = {
+                "samples": len(ordered),
+                "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+                "p90_ms": round(p90 * 1000, 1) if p90 is not None else None,
+                "hedged": entry.hedged,
+                "hedge_wins": entry.hedge_wins,
+                "budget_skipped": entry.budget_skipped,
+            }
+        return out
@@ -0,0 +1,122 @@
+"""Rolling latency/health scores of indexer mirrors, for choosing one."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+
+from .rate_limiter import host_of
+
+log = structlog.get_logger(__name__)
+
+# Weight of the newest sample in the rolling averages
+_SMOOTHING = 0.3
+
+# A failure rate of 100% costs as much as this much extra latency
+_FAILURE_PENALTY_SECONDS = 10.0
+
+# Mirrors are not chosen for this long after a failure
+_FAILURE_COOLDOWN_SECONDS = 60.0
+
+
+@dataclass
+class _MirrorScore:
+    """Rolling averages of one mirror host."""
+
+    latency: float | None = None
+    health: float = 1.0
+    last_failure: float | None = None
+    successes: int = 0
+    failures: int = 0
+
+    @property
+    def measured(self) -> bool:
+        return self.successes + self.failures > 0
+
+    def cooling_down(self, now: float) -> bool:
+        return (
+            self.last_failure is not None
+            and now - self.last_failure < _FAILURE_COOLDOWN_SECONDS
+        )
+
+    def cost(self) -> float:
+        """Expected seconds per request: latency plus a failure penalty."""
+        return (self.latency or 0.0) + (1.0 - self.health) * _FAILURE_PENALTY_SECONDS
+
+
+class MirrorHealth:
+    """Process-wide latency and health scores of mirror hosts.
+
+    Each mirror host keeps a rolling average of its response latency (time
+    to headers) and of its success rate (connection errors and 5xx count
+    as failures). rank() orders a plugin's mirrors best first: mirrors that
+    failed within the last minute go last, the rest by latency plus a
+    penalty for their failure rate. Mirrors without samples rank after the
+    measured ones and after the first (primary) mirror, so searches leave
+    base_url only for a mirror known to do better; unmeasured mirrors get
+    their samples when fetches fail over to them.
+    """
+
+    def __init__(self) -> None:
+        self._scores: dict[str, _MirrorScore] = {}
+
+    def _score(self, url: str) -> _MirrorScore:
+        host = host_of(url)
+        score = self._scores.get(host)
+        if score is None:
+            score = self._scores[host] = _MirrorScore()
+        return score
+
+    def record(self, url: str, *, success: bool, latency: float | None = None) -> None:
+        """Record the outcome of a request to the mirror serving `url`."""
+        score = self._score(url)
+        score.health += _SMOOTHING * ((1.0 if success else 0.0) - score.health)
+        if success:
+            score.successes += 1
+            if latency is not None:
+                score.latency = (
+                    latency
+                    if score.latency is None
+                    else score.latency + _SMOOTHING * (latency - score.latency)
+                )
+        else:
+            score.failures += 1
+            score.last_failure = time.monotonic()
+
+    def rank(self, mirrors: Sequence[str]) -> list[str]:
+        """`mirrors` (base URLs, primary first) ordered best first.
+
+        Stable for equal scores.
+        """
+        now = time.monotonic()
+        scores = [self._score(m) for m in mirrors]
+        order = sorted(
+            range(len(mirrors)),
+            key=lambda i: (
+                scores[i].cooling_down(now),
+                i > 0 and not scores[i].measured,
+                scores[i].cost(),
+                i,
+            ),
+        )
+        return [mirrors[i] for i in order]
+
+    def stats(self) -> dict[str, Any]:
+        """Score per mirror host."""
+        now = time.monotonic()
+        return {
+            host: {
+                "latency_ms": round(s.latency * 1000, 1)
+                if s.latency is not None
+                else None,
+                "health": round(s.health, 3),
+                "cooling_down": s.cooling_down(now),
+                "successes": s.successes,
+                "failures": s.failures,
+            }
+            for host, s in self._scores.items()
+        }
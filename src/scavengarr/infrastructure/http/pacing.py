@@ -0,0 +1,243 @@
+"""Adaptive per-host request pacing (AIMD) on top of HostRateLimiter."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import structlog
+
+from scavengarr.domain.ports import CachePort
+
+from .rate_limiter import HostRateLimiter, host_of
+
+log = structlog.get_logger(__name__)
+
+# Responses that mean "slow down"
+_THROTTLE_STATUSES = frozenset({429, 503})
+
+# Multiplicative decrease on throttling; additive increase per successful
+# response, as a share of the host's max rate (full recovery in ~20 requests)
+_DECREASE_FACTOR = 0.5
+_INCREASE_SHARE = 0.05
+
+# Never pace a host slower than this (requests per second)
+_MIN_RATE = 0.05
+
+# Throttle responses of requests sent before the last decrease took effect
+# are not counted again
+_DECREASE_COOLDOWN_SECONDS = 2.0
+
+# A response this much slower than the host's usual latency holds the rate
+_SLOW_RESPONSE_FACTOR = 2.0
+_LATENCY_SMOOTHING = 0.2
+
+# Learned rates: stored at most this often (increases), kept this long
+_SAVE_INTERVAL_SECONDS = 30.0
+_SAVED_RATE_TTL = 7 * 24 * 3600
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class _HostPace:
+    """Pacing state of one host."""
+
+    rate: float
+    max_rate: float
+    burst: int
+    latency: float | None = None
+    last_decrease: float = 0.0
+    last_saved: float = 0.0
+    loaded: bool = False
+
+
+class AdaptivePacer:
+    """Finds the fastest request rate each indexer host tolerates (AIMD).
+
+    - Throttling (429/503, or any error with Retry-After) halves the host's
+      rate and pauses it for Retry-After seconds.
+    - Every successful response raises the rate by a fixed step, up to the
+      host's max rate, unless it was much slower than the host's usual
+      latency (a sign of an overloaded server).
+
+    The learned rate is applied to the host's token bucket in the shared
+    HostRateLimiter and stored in the cache, so a restart continues at the
+    rate the site tolerated instead of starting over.
+
+    Args:
+        rate_limiter: Limiter whose buckets are paced.
+        cache: Where learned rates are stored (None = not persisted).
+    """
+
+    def __init__(
+        self, rate_limiter: HostRateLimiter, cache: CachePort | None = None
+    ) -> None:
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self._hosts: dict[str, _HostPace] = {}
+
+    def configure(
+        self,
+        host: str,
+        *,
+        rate: float | None,
+        burst: int = 1,
+        max_rate: float | None = None,
+    ) -> None:
+        """Set the pacing bounds of `host`.
+
+        Pacing starts at `rate` and may go up to `max_rate` (default: `rate`,
+        i.e. only slow down and recover). Without both the host is not
+        limited. A learned rate is kept (clamped to the new bounds).
+        """
+        host = host.lower()
+        ceiling = max_rate or rate
+        if ceiling is None:
+            self._hosts.pop(host, None)
+            self.rate_limiter.configure(host, rate=None)
+            return
+
+        pace = self._hosts.get(host)
+        if pace is None:
+            pace = _HostPace(
+                rate=min(rate or ceiling, ceiling), max_rate=ceiling, burst=burst
+            )
+            self._hosts[host] = pace
+        else:
+            pace.max_rate = ceiling
+            pace.burst = burst
+            pace.rate = min(pace.rate, ceiling)
+
+        self.rate_limiter.configure(host, rate=pace.rate, burst=burst)
+
+    async def acquire(self, url: str) -> float:
+        """Wait for the host's rate limit (restores a stored rate first)."""
+        pace = self._hosts.get(host_of(url))
+        if pace is not None and not pace.loaded:
+            pace.loaded = True
+            await self._load(host_of(url), pace)
+        return await self.rate_limiter.acquire(url)
+
+    async def record(
+        self,
+        url: str,
+        status_code: int,
+        *,
+        retry_after: float | None = None,
+        latency: float | None = None,
+    ) -> None:
+        """Adapt the host's rate to a response."""
+        host = host_of(url)
+        pace = self._hosts.get(host)
+        if pace is not None:
+            if status_code in _THROTTLE_STATUSES or (
+                retry_after is not None and status_code >= 400
+            ):
+                await self._decrease(host, pace, status_code)
+            elif status_code < 400:
+                await self._increase(host, pace, latency)
+
+        # After the decrease, so the pause is not scaled by the rate change
+        if retry_after is not None and status_code >= 400:
+            self.rate_limiter.pause(host, retry_after)
+
+    async def _decrease(self, host: str, pace: _HostPace, status_code: int) -> None:
+        now = time.monotonic()
+        if now - pace.last_decrease < _DECREASE_COOLDOWN_SECONDS:
+            return
+        pace.last_decrease = now
+
+        previous = pace.rate
+        self._set_rate(host, pace, max(_MIN_RATE, pace.rate * _DECREASE_FACTOR))
+        log.warning(
+            "pacing_slowdown",
+            host=host,
+            status_code=status_code,
+            rate=round(pace.rate, 3),
+            previous_rate=round(previous, 3),
+        )
+        await self._save(host, pace)
+
+    async def _increase(
+        self, host: str, pace: _HostPace, latency: float | None
+    ) -> None:
+        if latency is not None:
+            usual = pace.latency
+            pace.latency = (
+                latency
+                if usual is None
+                else usual + _LATENCY_SMOOTHING * (latency - usual)
+            )
+            if usual is not None and latency > _SLOW_RESPONSE_FACTOR * usual:
+                return  # server is struggling: hold the rate
+
+        if pace.rate >= pace.max_rate:
+            return
+
+        self._set_rate(
+            host, pace, min(pace.max_rate, pace.rate + _INCREASE_SHARE * pace.max_rate)
+        )
+        if time.monotonic() - pace.last_saved >= _SAVE_INTERVAL_SECONDS:
+            await self._save(host, pace)
+
+    def _set_rate(self, host: str, pace: _HostPace, rate: float) -> None:
+        pace.rate = rate
+        self.rate_limiter.configure(host, rate=rate, burst=pace.burst)
+
+    def _key(self, host: str) -> str:
+        return f"pacing:rate:{host}"
+
+    async def _load(self, host: str, pace: _HostPace) -> None:
+        if self.cache is None:
+            return
+        try:
+            stored = await self.cache.get(self._key(host))
+        except Exception as e:
+            log.warning("pacing_load_failed", host=host, error=str(e))
+            return
+
+        if not isinstance(stored, dict) or not stored.get("rate"):
+            return
+        rate = min(pace.max_rate, max(_MIN_RATE, float(stored["rate"])))
+        self._set_rate(host, pace, rate)
+        log.info("pacing_restored", host=host, rate=round(rate, 3))
+
+    async def _save(self, host: str, pace: _HostPace) -> None:
+        pace.last_saved = time.monotonic()
+        if self.cache is None:
+            return
+        try:
+            await self.cache.set(
+                self._key(host),
+                {"rate": pace.rate, "updated_at": time.time()},
+                ttl=_SAVED_RATE_TTL,
+            )
+        except Exception as e:
+            log.warning("pacing_save_failed", host=host, error=str(e))
+
+    def stats(self) -> dict[str, Any]:
+        """Current rate per paced host."""
+        return {
+            host: {
+                "rate": round(pace.rate, 3),
+                "max_rate": pace.max_rate,
+                "latency_ms": round(pace.latency * 1000, 1)
+                if pace.latency is not None
+                else None,
+            }
+            for host, pace in self._hosts.items()
+        }
@@ -0,0 +1,140 @@
+"""Connection pool of the shared HTTP client, with wait/utilisation counters."""
+
+from __future__ import annotations
+
+import importlib.util
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+import structlog
+
+log = structlog.get_logger(__name__)
+
+# Pool waits above this are logged as a hint that the pool is undersized
+_POOL_WAIT_WARN_SECONDS = 0.5
+
+
+def http2_available() -> bool:
+    """True if the 'h2' package (httpx[http2]) is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+@dataclass
+class HttpPoolStats:
+    """Counters of a PooledTransport (for sizing: pool wait vs. load)."""
+
+    requests: int = 0
+    in_flight: int = 0
+    # Requests waiting for a connection right now
+    waiting: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        done = max(1, self.requests - self.waiting)
+        return {
+            "requests": self.requests,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "pool_wait_avg_ms": round(self.wait_total / done * 1000, 2),
+            "pool_wait_max_ms": round(self.wait_max * 1000, 2),
+        }
+
+
+class PooledTransport(httpx.AsyncBaseTransport):
+    """httpx transport (connection pool) that reports pool wait and utilisation.
+
+    Wraps httpx.AsyncHTTPTransport with explicit Limits and optional HTTP/2
+    (via the httpx[http2] extra; falls back to HTTP/1.1 if 'h2' is missing
+    from the environment). Response compression needs no setup: httpx offers
+    gzip/deflate, plus br via the httpx[brotli] extra (and zstd when the
+    'zstandard' package is installed).
+
+    Pool wait is the time from handing a request to the pool until it gets a
+    connection, measured via httpcore's trace extension (the first trace
+    event is either the connect of a new connection or sending the request
+    on a reused one). Utilisation is the share of max_connections that is
+    busy.
+
+    Args:
+        limits: Pool limits (max connections, keep-alive).
+        http2: Negotiate HTTP/2 via ALPN (if available).
+    """
+
+    def __init__(self, limits: httpx.Limits, http2: bool = False) -> None:
+        if http2 and not http2_available():
+            log.warning("http2_unavailable", fallback="http/1.1")
+            http2 = False
+
+        self.limits = limits
+        self.http2 = http2
+        self._transport = httpx.AsyncHTTPTransport(limits=limits, http2=http2)
+        self._stats = HttpPoolStats()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        stats = self._stats
+        stats.requests += 1
+        stats.in_flight += 1
+        stats.waiting += 1
+        submitted = time.monotonic()
+        connected = False
+        outer_trace = request.extensions.get("trace")
+
+        def got_connection() -> None:
+            nonlocal connected
+            connected = True
+            stats.waiting -= 1
+            self._record_wait(time.monotonic() - submitted)
+
+        async def trace(event: str, info: dict[str, Any]) -> None:
+            if not connected:
+                got_connection()
+            if outer_trace is not None:
+                await outer_trace(event, info)
+
+        request.extensions = {**request.extensions, "trace": trace}
+        try:
+            return await self._transport.handle_async_request(request)
+        finally:
+            stats.in_flight -= 1
+            if not connected:
+                got_connection()  # failed before (e.g. pool timeout)
+
+    def _record_wait(self, wait: float) -> None:
+        stats = self._stats
+        stats.wait_total += wait
+        stats.wait_max = max(stats.wait_max, wait)
+        if wait > _POOL_WAIT_WARN_SECONDS:
+            log.warning(
+                "http_pool_wait",
+                wait_ms=round(wait * 1000, 2),
+                waiting=stats.waiting,
+                max_connections=self.limits.max_connections,
+            )
+
+    def _connections(self) -> tuple[int, int]:
+        """(open, busy) connections of the underlying httpcore pool."""
+        pool = getattr(self._transport, "_pool", None)
+        connections = list(getattr(pool, "connections", []))
+        busy = sum(1 for c in connections if not c.is_idle())
+        return len(connections), busy
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of pool limits, connection usage and pool wait."""
+        open_connections, busy = self._connections()
+        max_connections = self.limits.max_connections
+        return {
+            "http2": self.http2,
+            "max_connections": max_connections,
+            "max_keepalive": self.limits.max_keepalive_connections,
+            "connections": open_connections,
+            "busy_connections": busy,
+            "utilisation": round(busy / max_connections, 3)
+            if max_connections
+            else None,
+        } | self._stats.as_dict()
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -0,0 +1,159 @@
+"""Process-wide per-host rate limiting (token bucket with burst allowance)."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+import structlog
+
+log = structlog.get_logger(__name__)
+
+
+def host_of(url: str) -> str:
+    """Return the lower-cased host of `url` (empty string if none)."""
+    return (urlsplit(url).hostname or "").lower()
+
+
+class TokenBucket:
+    """Token bucket: `rate` tokens per second, holding at most `burst` tokens.
+
+    A full bucket lets up to `burst` requests through without delay. Callers
+    that find the bucket empty reserve the next free token and sleep until it
+    is due, so concurrent waiters are spaced out at `rate` instead of
+    stampeding together.
+
+    Args:
+        rate: Refill rate in requests per second (must be > 0).
+        burst: Bucket capacity (must be >= 1).
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def reconfigure(self, rate: float, burst: int) -> None:
+        """Change rate/burst while keeping the current fill level."""
+        self._refill()
+        self.rate = rate
+        self.burst = burst
+        self._tokens = min(self._tokens, float(burst))
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no token for the next `seconds` (e.g. server Retry-After)."""
+        self._refill()
+        self._tokens = min(self._tokens, -seconds * self.rate)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+
+    def _reserve(self) -> float:
+        """Take one token and return how long the caller must wait for it."""
+        self._refill()
+        self._tokens -= 1.0
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.rate
+
+    def try_acquire(self) -> bool:
+        """Take a token only if one is available right now (never waits)."""
+        self._refill()
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        return True
+
+    async def acquire(self) -> float:
+        """Wait until a token is available.
+
+        Returns:
+            Seconds spent waiting (0.0 if a token was available immediately).
+        """
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class HostRateLimiter:
+    """Token buckets keyed by host, shared by every component that makes requests.
+
+    Hosts are configured by whoever knows their limits (e.g. ScrapyAdapter from
+    the plugin's `scraping.rate`/`burst`/`delay_seconds`). Unconfigured hosts
+    use the default rate, or are not limited at all if no default is set.
+
+    Args:
+        default_rate: Requests per second for unconfigured hosts (None = no limit).
+        default_burst: Burst size for unconfigured hosts.
+    """
+
+    def __init__(
+        self,
+        default_rate: float | None = None,
+        default_burst: int = 1,
+    ) -> None:
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def configure(self, host: str, *, rate: float | None, burst: int = 1) -> None:
+        """Set the limit for `host`. `rate=None` removes the limit."""
+        host = host.lower()
+        if rate is None or rate <= 0:
+            self._buckets.pop(host, None)
+            return
+
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            self._buckets[host] = TokenBucket(rate, burst)
+            log.debug("rate_limit_configured", host=host, rate=rate, burst=burst)
+        elif bucket.rate != rate or bucket.burst != burst:
+            bucket.reconfigure(rate, burst)
+            log.debug("rate_limit_reconfigured", host=host, rate=rate, burst=burst)
+
+    def bucket_for(self, host: str) -> TokenBucket | None:
+        """Return the bucket for `host`, creating a default one if configured."""
+        host = host.lower()
+        bucket = self._buckets.get(host)
+        if bucket is None and self.default_rate:
+            bucket = TokenBucket(self.default_rate, self.default_burst)
+            self._buckets[host] = bucket
+        return bucket
+
+    def pause(self, host: str, seconds: float) -> None:
+        """Stop requests to `host` for `seconds` (only if it has a bucket)."""
+        bucket = self.bucket_for(host)
+        if bucket is not None and seconds > 0:
+            bucket.pause(seconds)
+            log.info("rate_limit_paused", host=host, seconds=round(seconds, 3))
+
+    def try_acquire(self, url: str) -> bool:
+        """Take a token for the host of `url` without waiting.
+
+        Returns:
+            False if the host's bucket is empty (unlimited hosts: always True).
+        """
+        bucket = self.bucket_for(host_of(url))
+        return bucket is None or bucket.try_acquire()
+
+    async def acquire(self, url: str) -> float:
+        """Wait for the rate limit of the host of `url`.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        host = host_of(url)
+        bucket = self.bucket_for(host)
+        if bucket is None:
+            return 0.0
+
+        waited = await bucket.acquire()
+        if waited > 0:
+            log.debug("rate_limit_wait", host=host, wait_seconds=round(waited, 3))
+        return waited
@@ -0,0 +1,76 @@
+"""Process-wide single-flight: coalesce identical in-flight requests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+import structlog
+
+log = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Flight:
+    """One running call and the number of callers waiting for it."""
+
+    task: asyncio.Task[Any]
+    waiters: int = 0
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time; concurrent callers share it.
+
+    The first caller for a key starts the call as its own task; callers that
+    arrive while it is running await the same task and get the same result
+    (or exception). A caller being cancelled (e.g. its search hit a deadline)
+    does not cancel the shared call as long as other callers still wait for
+    it; the last one leaving cancels it.
+
+    Nothing is cached: once the call finishes, the next caller starts a new
+    one.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[Hashable, _Flight] = {}
+        self._calls = 0
+        self._coalesced = 0
+
+    async def run(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Return the result of `fn()`, shared with concurrent callers of `key`."""
+        self._calls += 1
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(task=asyncio.ensure_future(fn()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+        else:
+            self._coalesced += 1
+            log.debug("single_flight_coalesced", key=str(key), waiters=flight.waiters)
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.task.done():
+                # Nobody is interested any more: stop the upstream request
+                self._forget(key, flight)
+                flight.task.cancel()
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def stats(self) -> dict[str, Any]:
+        """Coalescing counters (calls, calls served by another's request)."""
+        return {
+            "calls": self._calls,
+            "coalesced": self._coalesced,
+            "upstream": self._calls - self._coalesced,
+            "in_flight": len(self._flights),
+        }
@@ -0,0 +1,5 @@
+"""Worker pool for HTML parsing/extraction."""
+
+from .parse_pool import ParsePool, ParsePoolKind, ParsePoolStats
+
+__all__ = ["ParsePool", "ParsePoolKind", "ParsePoolStats"]
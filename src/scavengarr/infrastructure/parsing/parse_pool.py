@@ -0,0 +1,148 @@
+"""Worker pool for CPU-bound HTML parsing and extraction (off the event loop)."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Literal, TypeVar
+
+import structlog
+
+log = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+ParsePoolKind = Literal["thread", "process", "inline"]
+
+# Queue waits above this are logged as a hint that the pool is undersized
+_BACKLOG_WARN_SECONDS = 0.25
+
+
+def _timed_call(fn: Callable[..., T], *args: Any) -> tuple[T, float, float]:
+    """Run `fn` in a worker, returning its result with start/end timestamps.
+
+    Uses time.monotonic(), which is system-wide on Linux/macOS/Windows, so the
+    timestamps are comparable with the submitting process.
+    """
+    started = time.monotonic()
+    result = fn(*args)
+    return result, started, time.monotonic()
+
+
+@dataclass
+class ParsePoolStats:
+    """Counters of a ParsePool (for sizing: queue wait vs. run time)."""
+
+    tasks: int = 0
+    pending: int = 0
+    queue_wait_total: float = 0.0
+    queue_wait_max: float = 0.0
+    run_time_total: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        done = max(1, self.tasks - self.pending)
+        return {
+            "tasks": self.tasks,
+            "pending": self.pending,
+            "queue_wait_avg_ms": round(self.queue_wait_total / done * 1000, 2),
+            "queue_wait_max_ms": round(self.queue_wait_max * 1000, 2),
+            "run_time_avg_ms": round(self.run_time_total / done * 1000, 2),
+        }
+
+
+class ParsePool:
+    """Runs parse+extract jobs in a thread or process pool.
+
+    The event loop only awaits the job; callers get back the (plain) extracted
+    data. Every job reports how long it waited for a free worker (queue wait)
+    and how long it ran, so the pool can be sized: a queue wait that is large
+    compared to the run time means too few workers.
+
+    Kinds:
+        - "thread": ThreadPoolExecutor (lxml parses without holding the GIL;
+          extraction still shares the interpreter)
+        - "process": ProcessPoolExecutor (full parallelism; jobs and results
+          must be picklable)
+        - "inline": no pool, jobs run on the event loop (workers ignored)
+
+    Args:
+        kind: Pool kind (see above).
+        max_workers: Number of workers (ignored for "inline").
+    """
+
+    def __init__(self, kind: ParsePoolKind = "thread", max_workers: int = 4) -> None:
+        if kind != "inline" and max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+
+        self.kind = kind
+        self.max_workers = max_workers if kind != "inline" else 0
+        self._executor: Executor | None = None
+        if kind == "thread":
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="scavengarr-parse"
+            )
+        elif kind == "process":
+            self._executor = ProcessPoolExecutor(max_workers=max_workers)
+
+        self._stats = ParsePoolStats()
+
+        log.info("parse_pool_initialized", kind=kind, max_workers=self.max_workers)
+
+    @property
+    def requires_pickling(self) -> bool:
+        """True if jobs cross a process boundary (callables must be importable)."""
+        return self.kind == "process"
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run `fn(*args)` in the pool and return its result."""
+        if self._executor is None:
+            return fn(*args)
+
+        stats = self._stats
+        stats.tasks += 1
+        stats.pending += 1
+        loop = asyncio.get_running_loop()
+        submitted = time.monotonic()
+        try:
+            result, started, finished = await loop.run_in_executor(
+                self._executor, functools.partial(_timed_call, fn, *args)
+            )
+        finally:
+            stats.pending -= 1
+
+        queue_wait = max(0.0, started - submitted)
+        stats.queue_wait_total += queue_wait
+        stats.queue_wait_max = max(stats.queue_wait_max, queue_wait)
+        stats.run_time_total += finished - started
+
+        if queue_wait > _BACKLOG_WARN_SECONDS:
+            log.warning(
+                "parse_pool_backlog",
+                kind=self.kind,
+                max_workers=self.max_workers,
+                queue_wait_ms=round(queue_wait * 1000, 2),
+                pending=stats.pending,
+            )
+        else:
+            log.debug(
+                "parse_job_completed",
+                queue_wait_ms=round(queue_wait * 1000, 2),
+                run_ms=round((finished - started) * 1000, 2),
+            )
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of the pool counters (tasks, queue wait, run time)."""
+        return {"kind": self.kind, "max_workers": self.max_workers} | (
+            self._stats.as_dict()
+        )
+
+    def close(self) -> None:
+        """Shut the workers down (pending jobs are cancelled)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        log.info("parse_pool_closed", **self._stats.as_dict())
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import math
 import pickle
+from datetime import datetime, timezone
 from typing import Optional
 
 import structlog
@@ -25,11 +27,21 @@ class CacheCrawlJobRepository(CrawlJobRepository):
         self.ttl = ttl_seconds
 
     async def save(self, job: CrawlJob) -> None:
-        """Speichere CrawlJob im Cache mit TTL."""
+        """Speichere CrawlJob im Cache mit TTL.
+
+        Die TTL endet spätestens bei job.expires_at: erneutes Speichern
+        (z. B. nach deferred validation) verlängert die Lebensdauer nicht.
+        """
         key = f"crawljob:{job.job_id}"
+        remaining = (job.expires_at - datetime.now(timezone.utc)).total_seconds()
+        ttl = min(self.ttl, math.ceil(remaining))
+        if ttl <= 0:
+            log.debug("crawljob_expired_not_saved", job_id=job.job_id)
+            return
+
         # CachePort akzeptiert Any → pickle direkt speichern
-        await self.cache.set(key, pickle.dumps(job), ttl=self.ttl)
-        log.debug("crawljob_saved", job_id=job.job_id, ttl=self.ttl)
+        await self.cache.set(key, pickle.dumps(job), ttl=ttl)
+        log.debug("crawljob_saved", job_id=job.job_id, ttl=ttl)
 
     async def get(self, job_id: str) -> Optional[CrawlJob]:
         """Lade CrawlJob aus Cache."""
@@ -2,16 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator, Mapping
+from contextlib import aclosing
 from dataclasses import dataclass
+from dataclasses import replace as dataclass_replace
 from typing import Any
 
 import httpx
 import structlog
 
-from scavengarr.adapters.scraping import ScrapyAdapter
-from scavengarr.domain.entities import TorznabExternalError
+from scavengarr.adapters.scraping import CrawlIncompleteError, ScrapyAdapter
+from scavengarr.domain.entities import TorznabExternalError, TorznabPartialResults
 from scavengarr.domain.ports import CachePort
-from scavengarr.infrastructure.validation import HttpLinkValidator
+from scavengarr.infrastructure.http import (
+    AdaptivePacer,
+    CircuitOpenError,
+    HostCircuitBreakers,
+    HostRateLimiter,
+    HttpClientRegistry,
+    MirrorHealth,
+    RequestHedger,
+    SingleFlight,
+)
+from scavengarr.infrastructure.parsing import ParsePool
+from scavengarr.infrastructure.validation import HttpLinkValidator, LinkProbe
 
 log = structlog.get_logger(__name__)
 
@@ -28,23 +43,68 @@ class SearchResult:
     release_name: str | None = None
     description: str | None = None
     source_url: str | None = None
+    # All alternative links (hoster mirrors) of the result, download_link first
+    download_links: tuple[str, ...] = ()
+    # Position in the crawl's document order (sort key; results are
+    # streamed in completion order)
+    position: tuple[int, ...] = ()
+
+
+@dataclass
+class _PipelineCounts:
+    """Result counters of one search pipeline (for logging)."""
+
+    raw: int = 0
+    valid: int = 0
+    # Pages the crawl skipped (circuit opened mid-crawl)
+    skipped_pages: int = 0
 
 
 class HttpxScrapySearchEngine:
     """Scrapy-based multi-stage search engine with link validation.
 
     Features:
-        - Multi-stage scraping via ScrapyAdapter
-        - Optional download link validation (HEAD requests)
-        - Result filtering based on link availability
+        - Multi-stage scraping via ScrapyAdapter (streamed, one adapter per plugin)
+        - Scraping, conversion and validation run as an overlapping pipeline
+        - Optional download link validation (HEAD, ranged GET where HEAD is rejected)
+        - Result filtering based on link availability (alternative hoster
+          links of a result are raced; the result is kept if any is live)
         - Configurable validation timeout and concurrency
 
     Args:
-        http_client: Shared httpx.AsyncClient for HTTP requests.
+        http_client: Shared httpx.AsyncClient (link validation; scraping if no
+            client registry is given).
         cache: Cache port for storing scraped data.
         validate_links: Enable download link validation (default: True).
         validation_timeout: Timeout per link validation in seconds (default: 5.0).
         validation_concurrency: Max parallel link validations (default: 20).
+        validation_fan_out: Max alternative links of one result validated
+            at the same time (default: 3).
+        validation_max_per_host: Max parallel link validations per hoster
+            (default: 4).
+        validation_host_limits: Per-hoster overrides of validation_max_per_host.
+        validation_positive_ttl: Seconds a "valid" link verdict is cached.
+        validation_negative_ttl: Seconds an "invalid" link verdict is cached.
+        link_probe: Probe strategy of link validation (HEAD / ranged GET,
+            learned per host; default: a new probe using rate_limiter).
+        rate_limiter: Process-wide per-host rate limiter shared by scraping and
+            link validation (default: a new limiter owned by this engine).
+        parse_pool: Worker pool for page parsing/extraction (default: None,
+            parse on the event loop).
+        single_flight: Process-wide coalescing of identical in-flight page
+            loads (default: a new instance shared by this engine's adapters).
+        client_registry: Per-plugin clients for scraping (own pool, plugin's
+            HTTP overrides applied; default: None, scrape with http_client).
+        circuit_breakers: Process-wide per-host circuit breakers for indexer
+            fetches (default: a new instance shared by this engine's adapters).
+        pacer: Adaptive pacing of indexer hosts on top of rate_limiter
+            (default: a new, non-persistent pacer shared by this engine's
+            adapters).
+        hedger: Latency percentiles and counters for hedged indexer fetches
+            (default: a new instance shared by this engine's adapters).
+        mirror_health: Latency/health scores of plugin mirrors, used to pick
+            the mirror of each search (default: a new instance shared by this
+            engine's adapters).
     """
 
     def __init__(
@@ -55,16 +115,49 @@ class HttpxScrapySearchEngine:
         validate_links: bool = True,
         validation_timeout: float = 5.0,
         validation_concurrency: int = 20,
+        validation_fan_out: int = 3,
+        validation_max_per_host: int = 4,
+        validation_host_limits: Mapping[str, int] | None = None,
+        validation_positive_ttl: int = 6 * 3600,
+        validation_negative_ttl: int = 15 * 60,
+        rate_limiter: HostRateLimiter | None = None,
+        parse_pool: ParsePool | None = None,
+        single_flight: SingleFlight | None = None,
+        client_registry: HttpClientRegistry | None = None,
+        circuit_breakers: HostCircuitBreakers | None = None,
+        pacer: AdaptivePacer | None = None,
+        hedger: RequestHedger | None = None,
+        mirror_health: MirrorHealth | None = None,
+        link_probe: LinkProbe | None = None,
     ) -> None:
         self._http = http_client
+        self._client_registry = client_registry
         self._cache = cache
         self._validate_links = validate_links
+        self._validation_fan_out = validation_fan_out
+        self._rate_limiter = rate_limiter or HostRateLimiter()
+        self._parse_pool = parse_pool
+        self._single_flight = single_flight or SingleFlight()
+        self._circuit_breakers = circuit_breakers or HostCircuitBreakers()
+        self._pacer = pacer or AdaptivePacer(self._rate_limiter)
+        self._hedger = hedger or RequestHedger()
+        self._mirror_health = mirror_health or MirrorHealth()
+
+        # One adapter per plugin, reused by all searches (stateless per search)
+        self._adapters: dict[str, ScrapyAdapter] = {}
 
         # Initialize link validator
         self._link_validator = HttpLinkValidator(
             http_client=http_client,
             timeout_seconds=validation_timeout,
             max_concurrent=validation_concurrency,
+            max_per_host=validation_max_per_host,
+            host_limits=validation_host_limits,
+            rate_limiter=self._rate_limiter,
+            cache=cache,
+            positive_ttl=validation_positive_ttl,
+            negative_ttl=validation_negative_ttl,
+            probe=link_probe,
         )
 
         log.info(
@@ -72,26 +165,31 @@ class HttpxScrapySearchEngine:
             validate_links=validate_links,
             validation_timeout=validation_timeout,
             validation_concurrency=validation_concurrency,
+            validation_fan_out=validation_fan_out,
+            validation_max_per_host=validation_max_per_host,
         )
 
+    @property
+    def link_validator(self) -> HttpLinkValidator:
+        """The engine's link validator (shared with deferred validation)."""
+        return self._link_validator
+
     async def search(
         self,
         plugin: Any,
         query: str,
+        max_results: int | None = None,
         **params,
     ) -> list[SearchResult]:
         """Execute multi-stage search with optional link validation.
 
-        Flow:
-            1. Scrape indexer using ScrapyAdapter (multi-stage)
-            2. Convert scraped items to SearchResult objects
-            3. Validate download links (if enabled)
-            4. Filter out results with dead links
-            5. Return validated results
+        Collects iter_search(); results of a search that skipped pages are
+        returned as well (see TorznabPartialResults).
 
         Args:
             plugin: Plugin configuration object.
             query: Search query string.
+            max_results: Crawl budget (see iter_search).
             **params: Additional parameters (e.g., category, filters).
 
         Returns:
@@ -100,139 +198,272 @@ class HttpxScrapySearchEngine:
         Raises:
             TorznabExternalError: If scraping fails.
         """
-        adapter = ScrapyAdapter(
-            plugin=plugin,
-            http_client=self._http,
-            cache=self._cache,
-        )
+        collected: list[SearchResult] = []
+        async with aclosing(
+            self.iter_search(plugin, query, max_results=max_results, **params)
+        ) as results:
+            try:
+                async for result in results:
+                    collected.append(result)
+            except TorznabPartialResults:
+                pass
+        return collected
+
+    async def iter_search(
+        self,
+        plugin: Any,
+        query: str,
+        max_results: int | None = None,
+        **params,
+    ) -> AsyncIterator[SearchResult]:
+        """Execute multi-stage search as a pipeline, yielding validated results.
 
-        try:
-            # 1) Execute multi-stage scrape
-            stage_results = await adapter.scrape(query=query, **params)
+        Flow (all steps overlap with ongoing page fetches):
+            1. Stream scraped items from ScrapyAdapter.iter_scrape()
+            2. Convert each item to a SearchResult
+            3. Validate its download links (if enabled; alternatives raced)
+            4. Yield results with a reachable link as soon as they are validated
 
-            # 2) Convert to SearchResult format
-            raw_results = self._convert_stage_results(stage_results)
+        Results are yielded in completion order; SearchResult.position gives
+        their document order.
 
-            if not raw_results:
-                log.info(
-                    "search_no_results",
-                    plugin=getattr(plugin, "name", "unknown"),
-                    query=query,
-                )
-                return []
+        Args:
+            plugin: Plugin configuration object.
+            query: Search query string.
+            max_results: Stop crawling further links/pages once this many
+                items have been scraped (counted before link validation;
+                None = crawl everything).
+            **params: Additional parameters (e.g., category, filters).
 
-            log.info(
-                "search_scraped",
-                plugin=getattr(plugin, "name", "unknown"),
-                query=query,
-                raw_count=len(raw_results),
+        Yields:
+            Search results with validated download links.
+
+        Raises:
+            TorznabExternalError: If scraping fails (immediately if the
+                indexer host's circuit breaker is open).
+            TorznabPartialResults: After the last result, if pages were
+                skipped because the host's circuit opened during the crawl
+                (every result found up to then has been yielded).
+        """
+        plugin_name = getattr(plugin, "name", "unknown")
+        adapter = self._adapter_for(plugin)
+        counts = _PipelineCounts()
+
+        try:
+            # 1+2) Scrape and convert
+            results = self._iter_converted(
+                adapter, query, params, counts, max_results=max_results
             )
 
             # 3) Validate links (if enabled)
             if self._validate_links:
-                validated_results = await self._filter_valid_links(raw_results)
-            else:
-                validated_results = raw_results
-
-            log.info(
-                "search_completed",
-                plugin=getattr(plugin, "name", "unknown"),
-                query=query,
-                raw_count=len(raw_results),
-                valid_count=len(validated_results),
-                filtered_count=len(raw_results) - len(validated_results),
+                results = self._iter_valid_links(results)
+
+            # 4) Yield as soon as a result is through the pipeline
+            async with aclosing(results) as stream:
+                async for result in stream:
+                    counts.valid += 1
+                    yield result
+
+        except CircuitOpenError as e:
+            log.warning(
+                "search_circuit_open",
+                plugin=plugin_name,
+                host=e.host,
+                retry_in_seconds=round(e.retry_in, 1),
             )
-
-            return validated_results
+            raise TorznabExternalError(f"indexer unavailable: {e!s}") from e
 
         except Exception as e:
             log.error(
                 "search_failed",
-                plugin=getattr(plugin, "name", "unknown"),
+                plugin=plugin_name,
                 query=query,
                 error=str(e),
             )
             raise TorznabExternalError(f"scrapy search failed: {e!s}") from e
 
-    def _convert_stage_results(
-        self,
-        stage_results: dict[str, list[dict]],
-    ) -> list[SearchResult]:
-        """Convert multi-stage scraped items to SearchResult objects.
+        if counts.skipped_pages:
+            log.warning(
+                "search_incomplete",
+                plugin=plugin_name,
+                query=query,
+                skipped_pages=counts.skipped_pages,
+                valid_count=counts.valid,
+            )
+            raise TorznabPartialResults(
+                f"{counts.skipped_pages} page(s) skipped: indexer unavailable"
+            )
 
-        Args:
-            stage_results: Dict mapping stage_name -> list of scraped items.
+        if not counts.raw:
+            log.info("search_no_results", plugin=plugin_name, query=query)
+            return
 
-        Returns:
-            Flat list of SearchResult objects.
-        """
-        results: list[SearchResult] = []
+        log.info(
+            "search_completed",
+            plugin=plugin_name,
+            query=query,
+            raw_count=counts.raw,
+            valid_count=counts.valid,
+            filtered_count=counts.raw - counts.valid,
+        )
 
-        for stage_name, items in stage_results.items():
-            for item in items:
-                result = self._convert_to_result(item, stage_name)
-                if result:
-                    results.append(result)
-                else:
-                    log.debug(
-                        "item_conversion_skipped",
-                        stage=stage_name,
-                        reason="missing title or download_link",
-                        item=item,
-                    )
+    def _adapter_for(self, plugin: Any) -> ScrapyAdapter:
+        """Return the cached ScrapyAdapter for `plugin` (built on first use).
+
+        A reloaded plugin definition (different object) gets a new adapter.
+        """
+        name = getattr(plugin, "name", "unknown")
+        adapter = self._adapters.get(name)
+        if adapter is None or adapter.plugin is not plugin:
+            adapter = ScrapyAdapter(
+                plugin=plugin,
+                http_client=self._client_for(plugin),
+                cache=self._cache,
+                rate_limiter=self._rate_limiter,
+                parse_pool=self._parse_pool,
+                single_flight=self._single_flight,
+                circuit_breakers=self._circuit_breakers,
+                pacer=self._pacer,
+                hedger=self._hedger,
+                mirror_health=self._mirror_health,
+            )
+            self._adapters[name] = adapter
+        return adapter
 
-        return results
+    def _client_for(self, plugin: Any) -> httpx.AsyncClient:
+        """HTTP client for scraping `plugin` (its own, if there is a registry)."""
+        if self._client_registry is None:
+            return self._http
+        return self._client_registry.client_for(plugin)
 
-    async def _filter_valid_links(
+    async def _iter_converted(
         self,
-        results: list[SearchResult],
-    ) -> list[SearchResult]:
-        """Validate download links and filter out dead links.
+        adapter: ScrapyAdapter,
+        query: str,
+        params: dict[str, Any],
+        counts: _PipelineCounts,
+        max_results: int | None = None,
+    ) -> AsyncIterator[SearchResult]:
+        """Convert streamed scraped items to SearchResult objects.
 
         Args:
-            results: Raw search results from scraper.
+            adapter: Scrapy adapter for this search.
+            query: Search query string.
+            params: Additional URL parameters.
+            counts: Pipeline counters (raw results are counted here).
+            max_results: Crawl budget passed to the adapter.
 
-        Returns:
-            Only results with reachable download links.
+        Yields:
+            SearchResult objects (items without title/link are skipped).
+
+        Pages the crawl skipped are counted in `counts` instead of ending the
+        stream with an error, so results still being validated are kept.
         """
-        # Extract all download links
-        urls = [r.download_link for r in results if r.download_link]
+        async with aclosing(
+            adapter.iter_scrape(query=query, max_results=max_results, **params)
+        ) as items:
+            try:
+                async for stage_name, item, position in items:
+                    result = self._convert_to_result(item, stage_name, position)
+                    if result is None:
+                        log.debug(
+                            "item_conversion_skipped",
+                            stage=stage_name,
+                            reason="missing title or download_link",
+                            item=item,
+                        )
+                        continue
+
+                    counts.raw += 1
+                    yield result
+            except CrawlIncompleteError as e:
+                counts.skipped_pages = len(e.skipped_urls)
+
+    async def _iter_valid_links(
+        self,
+        results: AsyncIterator[SearchResult],
+    ) -> AsyncIterator[SearchResult]:
+        """Validate download links while results are still being scraped.
 
-        if not urls:
-            log.warning("no_download_links_to_validate")
-            return results  # No links to validate
+        Every incoming result starts its validation immediately (bounded by the
+        validator's semaphores); results are yielded as their validation
+        completes. A result's alternative links are raced (validate_any): it
+        is kept if any of them is live, with its live links as download_links
+        and the first live one as download_link. Each distinct set of links
+        is validated once per search.
 
-        # Batch validation (parallel HEAD requests)
-        validation_map = await self._link_validator.validate_batch(urls)
+        Args:
+            results: Converted search results (stream).
 
-        # Filter results: keep only valid links
-        valid_results = [
-            r
-            for r in results
-            if r.download_link and validation_map.get(r.download_link, False)
-        ]
+        Yields:
+            Only results with a reachable download link.
+        """
+        # (result, live links) per validated result; None once the stream ended
+        validated: asyncio.Queue[tuple[SearchResult, list[str]] | None] = (
+            asyncio.Queue()
+        )
+        checks: dict[tuple[str, ...], asyncio.Task[list[str]]] = {}
+        deliveries: list[asyncio.Task[None]] = []
+
+        async def deliver(result: SearchResult, check: asyncio.Task[list[str]]) -> None:
+            validated.put_nowait((result, await check))
+
+        async def submit() -> None:
+            try:
+                async with aclosing(results) as stream:
+                    async for result in stream:
+                        links = result.download_links or (result.download_link,)
+                        if links not in checks:
+                            checks[links] = asyncio.create_task(
+                                self._link_validator.validate_any(
+                                    list(links), fan_out=self._validation_fan_out
+                                )
+                            )
+                        deliveries.append(
+                            asyncio.create_task(deliver(result, checks[links]))
+                        )
+                await asyncio.gather(*deliveries)
+            finally:
+                validated.put_nowait(None)
+
+        feeder = asyncio.create_task(submit())
+        received = 0
+        invalid_links: list[str] = []
+
+        try:
+            while (entry := await validated.get()) is not None:
+                received += 1
+                result, live = entry
+                if live:
+                    yield dataclass_replace(
+                        result, download_link=live[0], download_links=tuple(live)
+                    )
+                else:
+                    invalid_links.append(result.download_link)
+
+            await feeder  # surface scrape errors
+        finally:
+            pending = [feeder, *deliveries, *checks.values()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
         # Log filtered results
-        if len(valid_results) < len(results):
-            invalid_links = [
-                r.download_link
-                for r in results
-                if r.download_link and not validation_map.get(r.download_link, False)
-            ]
+        if invalid_links:
             log.info(
                 "links_filtered",
-                total=len(results),
-                valid=len(valid_results),
-                invalid=len(results) - len(valid_results),
+                total=received,
+                valid=received - len(invalid_links),
+                invalid=len(invalid_links),
                 sample_invalid=invalid_links[:3],  # Log first 3 dead links
             )
 
-        return valid_results
-
     def _convert_to_result(
         self,
         item: dict,
         stage_name: str,
+        position: tuple[int, ...] = (),
     ) -> SearchResult | None:
         """Convert scraped item to SearchResult.
 
@@ -241,6 +472,7 @@ class HttpxScrapySearchEngine:
         Args:
             item: Scraped item dict.
             stage_name: Name of scraping stage (for debugging).
+            position: Position of the item in the crawl's document order.
 
         Returns:
             SearchResult object or None if missing required fields.
@@ -252,11 +484,11 @@ class HttpxScrapySearchEngine:
         # Prefer release_name as the final title if present
         title = (release_name or human_title or "").strip()
 
-        # Extract download link
-        link = self._extract_download_link(item)
+        # Extract download links (all alternatives, preferred first)
+        links = self._extract_download_links(item)
 
         # Skip if missing required fields
-        if not title or not link:
+        if not title or not links:
             return None
 
         # Extract optional metadata
@@ -268,52 +500,53 @@ class HttpxScrapySearchEngine:
 
         return SearchResult(
             title=title,
-            download_link=link,
+            download_link=links[0],
+            download_links=tuple(links),
             seeders=seeders,
             leechers=leechers,
             size=size,
             release_name=release_name,
             description=description,
             source_url=source_url,
+            position=position,
         )
 
-    def _extract_download_link(self, item: dict) -> str | None:
-        """Extract download link from item (handles various formats).
+    def _extract_download_links(self, item: dict) -> list[str]:
+        """Extract download links from item (handles various formats).
 
         Supports:
             - Direct link field: {"download_link": "https://..."}
             - Link field: {"link": "https://..."}
             - Nested links: {"download_links": [{"link": "https://..."}, ...]}
+              (all entries are alternatives, e.g. one per hoster)
 
         Args:
             item: Scraped item dict.
 
         Returns:
-            Download link URL or None if not found.
+            Download link URLs in scraped order, without duplicates (empty
+            if none found).
         """
         # Try direct fields
-        if "download_link" in item:
-            return item["download_link"]
-
-        if "link" in item:
-            return item["link"]
-
-        # Try nested download_links (take first)
-        if "download_links" in item:
-            links = item["download_links"]
-
-            if isinstance(links, list) and links:
-                first = links[0]
-
-                # List of dicts: [{"hoster": "Veev", "link": "..."}]
-                if isinstance(first, dict):
-                    return first.get("link")
-
-                # List of strings: ["https://...", ...]
-                if isinstance(first, str):
-                    return first
-
-        return None
+        if item.get("download_link"):
+            return [item["download_link"]]
+
+        if item.get("link"):
+            return [item["link"]]
+
+        # Try nested download_links
+        links = item.get("download_links")
+        if not isinstance(links, list):
+            return []
+
+        found: list[str] = []
+        for entry in links:
+            # List of dicts: [{"hoster": "Veev", "link": "..."}]
+            # List of strings: ["https://...", ...]
+            link = entry.get("link") if isinstance(entry, dict) else entry
+            if isinstance(link, str) and link and link not in found:
+                found.append(link)
+        return found
 
 
 def _to_int(raw: str | int | None) -> int | None:
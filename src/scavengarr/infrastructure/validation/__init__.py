@@ -1,5 +1,6 @@
 """Link validation infrastructure."""
 
 from .http_link_validator import HttpLinkValidator
+from .probe import LinkProbe, ProbeMethod, ProbeResult
 
-__all__ = ["HttpLinkValidator"]
+__all__ = ["HttpLinkValidator", "LinkProbe", "ProbeMethod", "ProbeResult"]
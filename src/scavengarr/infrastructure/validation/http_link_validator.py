@@ -1,30 +1,89 @@
-"""HTTP-based link validator using HEAD requests."""
+"""HTTP-based link validator using HEAD (or ranged GET) requests."""
 
 from __future__ import annotations
 
 import asyncio
+import time
+from collections.abc import Mapping
+from itertools import chain, islice, zip_longest
 from typing import TYPE_CHECKING
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import structlog
 from httpx import AsyncClient, HTTPError, TimeoutException
 
+from scavengarr.domain.ports import CachePort
+from scavengarr.infrastructure.http.rate_limiter import HostRateLimiter, host_of
+
+from .probe import LinkProbe
+
 if TYPE_CHECKING:
     from httpx import AsyncClient
 
 log = structlog.get_logger(__name__)
 
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Answers that say more about us than about the link: rate limited, or
+# blocked (a 403 to both HEAD and ranged GET is mostly bot/geo blocking)
+_UNCACHED_STATUSES = frozenset({403, 429})
+
+
+def _normalize_url(url: str) -> str:
+    """Canonical form of `url` for the verdict cache.
+
+    Lower-cases scheme and host, drops the default port and the fragment,
+    and sorts the query parameters.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port is not None and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+
+def _interleave_by_host(urls: list[str]) -> list[str]:
+    """Reorder `urls` round-robin across hosts (order within a host is kept)."""
+    by_host: dict[str, list[str]] = {}
+    for url in urls:
+        by_host.setdefault(host_of(url), []).append(url)
+    rounds = zip_longest(*by_host.values())
+    return [url for url in chain.from_iterable(rounds) if url is not None]
+
 
 class HttpLinkValidator:
     """Validates download links via HTTP HEAD requests.
 
-    - Sends HEAD request (no body download) to check availability.
+    - Checks availability without downloading the body (LinkProbe: HEAD, or
+      a `Range: bytes=0-0` GET for hosts that reject HEAD; the working
+      method is remembered per host).
     - Considers 2xx/3xx as valid, 4xx/5xx/timeout as invalid.
-    - Uses semaphore to limit concurrent requests (avoid rate-limits).
+    - Limits concurrent requests globally and per host, so a batch of links
+      to one hoster does not trip its rate limiting (false "dead" verdicts).
+      A request waits for its host's slot before taking a global one, so
+      free global slots go to other hosts; batches are interleaved by host.
+    - Respects the shared per-host rate limiter.
+    - Stores verdicts in the cache (keyed by normalized URL), valid and
+      invalid ones with separate TTLs; only cache misses are requested.
+      Only verdicts from an HTTP status are stored: a 403, a 429, a timeout
+      or a network error says nothing about the link.
+    - Races alternative links of one result (validate_any): a few probes at
+      a time, the rest cancelled once one link is live.
 
     Args:
         http_client: Shared httpx.AsyncClient (injected).
         timeout_seconds: Max time per validation (default: 5s).
         max_concurrent: Max parallel validations (default: 20).
+        max_per_host: Max parallel validations per host (default: 4).
+        host_limits: Per-host overrides of max_per_host; a domain also
+            applies to its subdomains (e.g. {"rapidgator.net": 2}).
+        rate_limiter: Process-wide per-host rate limiter (optional).
+        cache: Cache for verdicts (None = every link is requested).
+        positive_ttl: Seconds a "valid" verdict is kept (0 = not stored).
+        negative_ttl: Seconds an "invalid" verdict is kept (0 = not stored).
+        probe: Probe strategy (default: a LinkProbe using rate_limiter).
     """
 
     def __init__(
@@ -32,51 +91,193 @@ class HttpLinkValidator:
         http_client: AsyncClient,
         timeout_seconds: float = 5.0,
         max_concurrent: int = 20,
+        max_per_host: int = 4,
+        host_limits: Mapping[str, int] | None = None,
+        rate_limiter: HostRateLimiter | None = None,
+        cache: CachePort | None = None,
+        positive_ttl: int = 6 * 3600,
+        negative_ttl: int = 15 * 60,
+        probe: LinkProbe | None = None,
     ) -> None:
         self.http_client = http_client
         self.timeout = timeout_seconds
         self._semaphore = asyncio.Semaphore(max_concurrent)
+        self.max_per_host = max_per_host
+        self.host_limits = {h.lower(): n for h, n in (host_limits or {}).items()}
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.cache = cache
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        self.probe = probe or LinkProbe(self.rate_limiter)
 
     async def validate(self, url: str) -> bool:
-        """Validate single URL.
+        """Validate single URL (cached verdict if there is one).
 
         Returns:
             True if reachable (2xx/3xx), False otherwise.
         """
-        async with self._semaphore:
+        cached = await self._cached_verdict(url)
+        if cached is not None:
+            return cached
+        return await self._validate_uncached(url)
+
+    async def _validate_uncached(self, url: str) -> bool:
+        """Request `url` and store the verdict (if the link answered)."""
+        is_valid, status_code = await self._check(url)
+        if status_code is not None and status_code not in _UNCACHED_STATUSES:
+            await self._store_verdict(url, is_valid)
+        return is_valid
+
+    async def _check(self, url: str) -> tuple[bool, int | None]:
+        """Probe `url`; returns (valid, status code or None)."""
+        async with self._host_semaphore(url), self._semaphore:
             try:
-                # HEAD request (no body, fast)
-                response = await self.http_client.head(
-                    url,
-                    timeout=self.timeout,
-                    follow_redirects=True,  # Follow redirects to final destination
+                # HEAD or ranged GET (no body, fast; rate-limited per request)
+                result = await self.probe.probe(
+                    self.http_client, url, timeout=self.timeout
                 )
-                is_valid = response.status_code < 400
 
                 log.debug(
                     "link_validated",
                     url=url,
-                    status_code=response.status_code,
-                    valid=is_valid,
+                    status_code=result.status_code,
+                    method=result.method,
+                    valid=result.ok,
                 )
-                return is_valid
+                return result.ok, result.status_code
 
             except TimeoutException:
                 log.warning("link_validation_timeout", url=url, timeout=self.timeout)
-                return False
+                return False, None
 
             except HTTPError as e:
                 log.warning("link_validation_error", url=url, error=str(e))
-                return False
+                return False, None
 
             except Exception as e:
                 # Catch-all for DNS errors, connection refused, etc.
                 log.error("link_validation_unexpected_error", url=url, error=str(e))
-                return False
+                return False, None
+
+    def _host_limit(self, host: str) -> int:
+        """Concurrency limit of `host` (most specific host_limits entry)."""
+        labels = host.split(".")
+        for i in range(len(labels) - 1):
+            limit = self.host_limits.get(".".join(labels[i:]))
+            if limit is not None:
+                return limit
+        return self.max_per_host
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = host_of(url)
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._host_limit(host))
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    def _key(self, url: str) -> str:
+        return f"linkcheck:{_normalize_url(url)}"
+
+    async def _cached_verdict(self, url: str) -> bool | None:
+        """Stored verdict for `url` (None on miss or cache error)."""
+        if self.cache is None:
+            return None
+        try:
+            stored = await self.cache.get(self._key(url))
+        except Exception as e:
+            log.warning("link_verdict_cache_read_failed", url=url, error=str(e))
+            return None
+
+        if not isinstance(stored, dict) or "valid" not in stored:
+            return None
+        log.debug("link_verdict_cache_hit", url=url, valid=stored["valid"])
+        return bool(stored["valid"])
+
+    async def _store_verdict(self, url: str, is_valid: bool) -> None:
+        ttl = self.positive_ttl if is_valid else self.negative_ttl
+        if self.cache is None or ttl <= 0:
+            return
+        try:
+            await self.cache.set(
+                self._key(url),
+                {"valid": is_valid, "checked_at": time.time()},
+                ttl=ttl,
+            )
+        except Exception as e:
+            log.warning("link_verdict_cache_write_failed", url=url, error=str(e))
+
+    async def validate_any(self, urls: list[str], *, fan_out: int = 3) -> list[str]:
+        """Find live links among alternatives (e.g. hoster mirrors of one file).
+
+        Cached verdicts are used first; if one of them is live, nothing is
+        requested. Otherwise the remaining links are probed in order, at most
+        `fan_out` at a time, and the probes still running are cancelled as
+        soon as one link is live.
+
+        Args:
+            urls: Alternative download links, preferred first.
+            fan_out: Max links probed at the same time.
+
+        Returns:
+            The links known to be live (input order; empty if all are dead).
+        """
+        unique = list(dict.fromkeys(urls))
+        cached = await asyncio.gather(*(self._cached_verdict(url) for url in unique))
+        live = {url for url, verdict in zip(unique, cached, strict=True) if verdict}
+        if not live:
+            misses = [
+                url
+                for url, verdict in zip(unique, cached, strict=True)
+                if verdict is None
+            ]
+            live = await self._race(misses, max(1, fan_out))
+            log.debug(
+                "link_race_completed",
+                alternatives=len(unique),
+                requested=len(misses),
+                live=len(live),
+            )
+        return [url for url in unique if url in live]
+
+    async def _race(self, urls: list[str], fan_out: int) -> set[str]:
+        """Probe `urls` (at most fan_out at once) until one is live.
+
+        Returns:
+            Live links among the probes finished when the race was decided.
+        """
+        queue = iter(urls)
+        running: dict[asyncio.Task[bool], str] = {}
+        live: set[str] = set()
+
+        def refill() -> None:
+            for url in islice(queue, fan_out - len(running)):
+                running[asyncio.create_task(self._validate_uncached(url))] = url
+
+        refill()
+        try:
+            while running and not live:
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                live.update(running[task] for task in done if task.result())
+                for task in done:
+                    del running[task]
+                if not live:
+                    refill()
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+        return live
 
     async def validate_batch(self, urls: list[str]) -> dict[str, bool]:
         """Validate multiple URLs concurrently.
 
+        Cached verdicts are used as-is; only the remaining URLs are requested
+        (each normalized URL once), interleaved by host.
+
         Args:
             urls: List of download links.
 
@@ -88,12 +289,34 @@ class HttpLinkValidator:
 
         log.info("batch_validation_started", count=len(urls))
 
-        # Parallel validation (semaphore limits concurrency)
-        tasks = [self.validate(url) for url in urls]
-        results = await asyncio.gather(*tasks)
+        # One representative URL per normalized URL
+        unique: dict[str, str] = {}
+        for url in urls:
+            unique.setdefault(_normalize_url(url), url)
+
+        cached = await asyncio.gather(
+            *(self._cached_verdict(url) for url in unique.values())
+        )
+        verdicts = {
+            key: verdict
+            for key, verdict in zip(unique, cached, strict=True)
+            if verdict is not None
+        }
+        misses = _interleave_by_host(
+            [url for key, url in unique.items() if key not in verdicts]
+        )
+
+        # Parallel validation of cache misses (global + per-host limits)
+        results = await asyncio.gather(
+            *(self._validate_uncached(url) for url in misses)
+        )
+        verdicts.update(
+            (_normalize_url(url), valid)
+            for url, valid in zip(misses, results, strict=True)
+        )
 
         # Build result dict
-        validation_map = dict(zip(urls, results))
+        validation_map = {url: verdicts[_normalize_url(url)] for url in urls}
 
         valid_count = sum(validation_map.values())
         log.info(
@@ -101,6 +324,8 @@ class HttpLinkValidator:
             total=len(urls),
             valid=valid_count,
             invalid=len(urls) - valid_count,
+            cached=len(unique) - len(misses),
+            requested=len(misses),
         )
 
         return validation_map
@@ -0,0 +1,110 @@
+"""Cheap HTTP reachability probe: HEAD, with a ranged GET fallback per host."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any, Literal
+
+import httpx
+import structlog
+
+from scavengarr.infrastructure.http.rate_limiter import HostRateLimiter, host_of
+
+log = structlog.get_logger(__name__)
+
+ProbeMethod = Literal["HEAD", "GET"]
+
+# HEAD answers that often mean "HEAD not supported" rather than "not there"
+_HEAD_UNSUPPORTED = frozenset({403, 405, 501})
+
+# A host's remembered method is re-checked with HEAD after this long
+_REMEMBER_SECONDS = 6 * 3600
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    """Outcome of a probe that got an HTTP response."""
+
+    status_code: int
+    method: ProbeMethod
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+
+class LinkProbe:
+    """Checks a URL with as little traffic as possible.
+
+    - HEAD first (no body).
+    - If HEAD answers 403/405/501 (many one-click hosters reject HEAD but
+      serve GET), a GET with `Range: bytes=0-0` is sent and closed without
+      reading the body.
+    - Hosts where HEAD failed but the ranged GET worked are remembered, so
+      their later probes skip the HEAD round trip (re-checked after 6h).
+
+    Network errors (httpx.RequestError) are raised to the caller.
+
+    Args:
+        rate_limiter: Per-host rate limiter every probe request waits for
+            (None = not limited).
+    """
+
+    def __init__(self, rate_limiter: HostRateLimiter | None = None) -> None:
+        self.rate_limiter = rate_limiter
+        # host -> (method, remembered at)
+        self._methods: dict[str, tuple[ProbeMethod, float]] = {}
+
+    def method_for(self, url: str) -> ProbeMethod:
+        """Method to probe the host of `url` with first."""
+        entry = self._methods.get(host_of(url))
+        if entry is None or time.monotonic() - entry[1] > _REMEMBER_SECONDS:
+            return "HEAD"
+        return entry[0]
+
+    async def probe(
+        self, client: httpx.AsyncClient, url: str, *, timeout: float
+    ) -> ProbeResult:
+        """Probe `url` (follows redirects)."""
+        if self.method_for(url) == "HEAD":
+            status_code = await self._head(client, url, timeout)
+            if status_code not in _HEAD_UNSUPPORTED:
+                return ProbeResult(status_code, "HEAD")
+            log.debug("probe_head_unsupported", url=url, status_code=status_code)
+
+        result = ProbeResult(await self._ranged_get(client, url, timeout), "GET")
+        if result.ok:
+            self._remember(url, "GET")
+        return result
+
+    def _remember(self, url: str, method: ProbeMethod) -> None:
+        host = host_of(url)
+        if self._methods.get(host, (None,))[0] != method:
+            log.info("probe_method_learned", host=host, method=method)
+        self._methods[host] = (method, time.monotonic())
+
+    async def _wait(self, url: str) -> None:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(url)
+
+    async def _head(self, client: httpx.AsyncClient, url: str, timeout: float) -> int:
+        await self._wait(url)
+        response = await client.head(url, timeout=timeout, follow_redirects=True)
+        return response.status_code
+
+    async def _ranged_get(
+        self, client: httpx.AsyncClient, url: str, timeout: float
+    ) -> int:
+        """GET the first byte only; the body is never read."""
+        await self._wait(url)
+        request = client.build_request(
+            "GET", url, headers={"Range": "bytes=0-0"}, timeout=timeout
+        )
+        response = await client.send(request, stream=True, follow_redirects=True)
+        await response.aclose()
+        return response.status_code
+
+    def stats(self) -> dict[str, Any]:
+        """Remembered probe method per host."""
+        return {host: method for host, (method, _) in self._methods.items()}
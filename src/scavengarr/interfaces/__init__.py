@@ -1,5 +1,17 @@
-from .cli import start
+from __future__ import annotations
+
+from typing import Any
 
 __all__ = [
     "start",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy: importing the API routers must not import the CLI, which builds
+    # the app and its composition root
+    if name == "start":
+        from .cli import start
+
+        return start
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
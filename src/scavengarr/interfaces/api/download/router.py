@@ -31,8 +31,10 @@ async def download_crawljob(
         2. They make GET request to this endpoint
         3. We lookup CrawlJob from repository (cache)
         4. Check if expired
-        5. Generate .crawljob file content
-        6. Return as downloadable file
+        5. Validate its links now if they are still unchecked
+           (validation_mode "on_download"); the verdict is saved to the job
+        6. Generate .crawljob file content
+        7. Return as downloadable file
 
     Args:
         job_id: Unique CrawlJob identifier (UUID4).
@@ -43,6 +45,7 @@ async def download_crawljob(
 
     Raises:
         HTTPException(404): CrawlJob not found or expired.
+        HTTPException(410): Validation found all download links dead.
         HTTPException(500): Internal error (e.g., repository failure).
     """
     state = cast(AppState, request.app.state)
@@ -83,7 +86,29 @@ async def download_crawljob(
             detail=f"CrawlJob expired: {job_id}",
         )
 
-    # === 4) Generate .crawljob File Content ===
+    # === 4) Validate Links (on_download mode; deferred mode does it in the
+    # background, so its jobs may still be pending here) ===
+    validation = state.crawljob_validation
+    if (
+        crawl_job.is_pending()
+        and validation is not None
+        and state.config.validation_mode == "on_download"
+    ):
+        try:
+            # Saves the verdict to the stored job: later downloads reuse it
+            crawl_job = await validation.validate(crawl_job)
+        except Exception as e:
+            # Serve the unvalidated job rather than failing the download
+            log.warning("crawljob_validation_failed", job_id=job_id, error=str(e))
+
+    if not crawl_job.has_live_links():
+        log.warning("crawljob_links_dead", job_id=job_id)
+        raise HTTPException(
+            status_code=410,
+            detail=f"All download links are dead: {job_id}",
+        )
+
+    # === 5) Generate .crawljob File Content ===
     try:
         crawljob_content = crawl_job.to_crawljob_format()
     except Exception as e:
@@ -97,7 +122,7 @@ async def download_crawljob(
             detail="Failed to generate .crawljob file",
         ) from e
 
-    # === 5) Build Filename ===
+    # === 6) Build Filename ===
     # Sanitize package_name for filename (remove special chars)
     safe_filename = "".join(
         c if c.isalnum() or c in (" ", "-", "_") else "_"
@@ -105,16 +130,19 @@ async def download_crawljob(
     )
     filename = f"{safe_filename}_{job_id[:8]}.crawljob"
 
+    links = crawl_job.validated_urls or crawl_job.unchecked_urls
+    validation_status = "pending" if crawl_job.is_pending() else "validated"
     log.info(
         "crawljob_downloaded",
         job_id=job_id,
         filename=filename,
         package_name=crawl_job.package_name,
-        link_count=len(crawl_job.validated_urls),
+        link_count=len(links),
+        validation=validation_status,
         size_bytes=len(crawljob_content),
     )
 
-    # === 6) Return as Downloadable File ===
+    # === 7) Return as Downloadable File ===
     return Response(
         content=crawljob_content,
         media_type="application/x-crawljob",
@@ -123,7 +151,8 @@ async def download_crawljob(
             "Content-Type": "application/x-crawljob",
             "X-CrawlJob-ID": job_id,
             "X-CrawlJob-Package": crawl_job.package_name,
-            "X-CrawlJob-Links": str(len(crawl_job.validated_urls)),
+            "X-CrawlJob-Links": str(len(links)),
+            "X-CrawlJob-Validation": validation_status,
         },
     )
 
@@ -165,6 +194,10 @@ async def get_crawljob_info(
         "expires_at": crawl_job.expires_at.isoformat(),
         "is_expired": crawl_job.is_expired(),
         "validated_urls": crawl_job.validated_urls,
+        "unchecked_urls": crawl_job.unchecked_urls,
+        "validated_at": crawl_job.validated_at.isoformat()
+        if crawl_job.validated_at
+        else None,
         "source_url": crawl_job.source_url,
         "comment": crawl_job.comment,
         "auto_start": crawl_job.auto_start.value,
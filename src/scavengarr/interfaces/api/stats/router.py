@@ -0,0 +1,39 @@
+"""Runtime statistics of shared infrastructure (for sizing and tuning)."""
+
+from __future__ import annotations
+
+from typing import cast
+
+from fastapi import APIRouter, Request
+
+from scavengarr.interfaces.app_state import AppState
+
+router = APIRouter(tags=["stats"])
+
+
+@router.get("/api/v1/stats")
+async def runtime_stats(request: Request) -> dict:
+    """Counters of the shared worker pools and request coalescing.
+
+    - http_pool: connection usage and pool wait of the shared HTTP client
+    - plugin_http_pools: the same per plugin client (scraping)
+    - circuit_breakers: circuit state per indexer host
+    - pacing: current (learned) request rate per indexer host
+    - hedging: latency percentiles and hedged/won requests per indexer host
+    - mirrors: latency/health score per mirror host
+    - probe_methods: hosts probed with a ranged GET because HEAD failed
+    - parse_pool: queue wait vs. run time of parse jobs
+    - single_flight: page loads served by another caller's in-flight request
+    """
+    state = cast(AppState, request.app.state)
+    return {
+        "http_pool": state.http_pool.stats(),
+        "plugin_http_pools": state.http_clients.stats(),
+        "circuit_breakers": state.circuit_breakers.stats(),
+        "pacing": state.pacer.stats(),
+        "hedging": state.hedger.stats(),
+        "mirrors": state.mirror_health.stats(),
+        "probe_methods": state.link_probe.stats(),
+        "parse_pool": state.parse_pool.stats(),
+        "single_flight": state.single_flight.stats(),
+    }
@@ -21,6 +21,8 @@ from scavengarr.domain.entities import (
     TorznabUnsupportedPlugin,
 )
 from scavengarr.domain.entities.torznab import TorznabItem
+from scavengarr.infrastructure.http import host_of
+from scavengarr.infrastructure.validation import LinkProbe
 from scavengarr.interfaces.app_state import AppState
 
 from .presenter import render_caps_xml, render_rss_xml
@@ -29,6 +31,10 @@ log = structlog.get_logger(__name__)
 
 router = APIRouter(tags=["torznab"])
 
+# Set on search responses cut short by the search deadline or by pages skipped
+# because the indexer became unavailable mid-search
+PARTIAL_RESULTS_HEADER = "X-Scavengarr-Partial"
+
 
 def _xml(payload: bytes, *, status_code: int) -> Response:
     return Response(
@@ -54,40 +60,20 @@ def _origin_url(base_url: str) -> str:
 
 async def _lightweight_http_probe(
     client: httpx.AsyncClient,
+    probe: LinkProbe,
     *,
     base_url: str,
     timeout_seconds: float = 5.0,
 ) -> tuple[bool, int | None, str | None, str]:
     """
-    Lightweight reachability probe:
-    - Prefer HEAD (no body)
-    - Fallback to GET with Range + stream=True (dont read body) when HEAD is unsupported
+    Lightweight reachability probe of the plugin's origin (see LinkProbe:
+    HEAD, or a ranged streamed GET where HEAD is unsupported).
     """
     checked_url = _origin_url(base_url)
 
     try:
-        # 1) HEAD is cheapest
-        resp = await client.request(
-            "HEAD",
-            checked_url,
-            timeout=timeout_seconds,
-            follow_redirects=True,
-        )
-        if resp.status_code in (405, 501):
-            # 2) Some sites do not support HEAD; do a minimal GET
-            req = client.build_request(
-                "GET",
-                checked_url,
-                headers={"Range": "bytes=0-0"},
-            )
-            r = await client.send(
-                req, stream=True, timeout=timeout_seconds, follow_redirects=True
-            )
-            status_code = r.status_code
-            await r.aclose()
-            return True, status_code, None, checked_url
-
-        return True, resp.status_code, None, checked_url
+        result = await probe.probe(client, checked_url, timeout=timeout_seconds)
+        return True, result.status_code, None, checked_url
 
     except httpx.RequestError as e:
         # DNS/TCP/TLS/timeout etc.
@@ -111,6 +97,8 @@ async def torznab_plugin_api(
     q: str | None = Query(None, description="Search query"),
     cat: str = Query("", description="Category filter"),
     extended: int | None = Query(None, description="Prowlarr extended search flag"),
+    limit: int | None = Query(None, description="Max number of results"),
+    offset: int | None = Query(None, description="Number of results to skip"),
 ) -> Response:
     state = cast(AppState, request.app.state)
 
@@ -154,7 +142,10 @@ async def torznab_plugin_api(
                     error,
                     _checked_url,
                 ) = await _lightweight_http_probe(
-                    state.http_client, base_url=base_url, timeout_seconds=5.0
+                    state.http_clients.client_for(plugin),
+                    state.link_probe,
+                    base_url=base_url,
+                    timeout_seconds=5.0,
                 )
 
                 if reachable:
@@ -205,16 +196,30 @@ async def torznab_plugin_api(
             engine=state.search_engine,
             crawljob_factory=state.crawljob_factory,
             crawljob_repo=state.crawljob_repo,
+            search_deadline_seconds=state.config.search_deadline_seconds,
+            max_search_results=state.config.search_max_results,
+            validation_mode=state.config.validation_mode,
+            crawljob_validation=state.crawljob_validation,
         )
-        items = await search_uc.execute(
-            TorznabQuery(action="search", query=q, plugin_name=plugin_name)
+        result = await search_uc.execute(
+            TorznabQuery(
+                action="search",
+                query=q,
+                plugin_name=plugin_name,
+                limit=limit,
+                offset=offset,
+            )
         )
         rendered = render_rss_xml(
             title=f"{state.config.app_name} ({plugin_name})",
-            items=items,
+            items=result.items,
             scavengarr_base_url=str(request.base_url),
         )
-        return _xml(rendered.payload, status_code=200)
+        response = _xml(rendered.payload, status_code=200)
+        if result.partial:
+            # Deadline expired or pages skipped: feed holds the results so far
+            response.headers[PARTIAL_RESULTS_HEADER] = "true"
+        return response
 
     except TorznabBadRequest as e:
         rendered = render_rss_xml(
@@ -288,6 +293,9 @@ async def torznab_plugin_health(request: Request, plugin_name: str) -> JSONRespo
     """
     Lightweight reachability check for the plugin's domain/base_url.
     Uses the plugin registry directly because TorznabIndexersUseCase does not expose base_url.
+    Also reports the circuit breaker state of each of the plugin's hosts
+    (base_url and mirrors, which searches fail over to; a search fails fast
+    while the circuit of the host it uses is "open").
     """
     state = cast(AppState, request.app.state)
 
@@ -325,8 +333,13 @@ async def torznab_plugin_health(request: Request, plugin_name: str) -> JSONRespo
             },
         )
 
+    mirrors = getattr(plugin, "mirror_urls", lambda: [base_url])()
+
     reachable, status_code, error, checked_url = await _lightweight_http_probe(
-        state.http_client, base_url=base_url, timeout_seconds=5.0
+        state.http_clients.client_for(plugin),
+        state.link_probe,
+        base_url=base_url,
+        timeout_seconds=5.0,
     )
 
     return JSONResponse(
@@ -338,5 +351,9 @@ async def torznab_plugin_health(request: Request, plugin_name: str) -> JSONRespo
             "reachable": reachable,
             "status_code": status_code,
             "error": error,
+            "circuits": {
+                host_of(mirror) or mirror: state.circuit_breakers.snapshot(mirror)
+                for mirror in mirrors
+            },
         },
     )
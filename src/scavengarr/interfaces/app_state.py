@@ -8,7 +8,20 @@ import httpx
 from starlette.datastructures import State
 
 from scavengarr.application.factories import CrawlJobFactory  # CHANGED
+from scavengarr.application.use_cases import CrawlJobValidationUseCase
 from scavengarr.infrastructure.config import AppConfig
+from scavengarr.infrastructure.http import (
+    AdaptivePacer,
+    HostCircuitBreakers,
+    HostRateLimiter,
+    HttpClientRegistry,
+    MirrorHealth,
+    PooledTransport,
+    RequestHedger,
+    SingleFlight,
+)
+from scavengarr.infrastructure.parsing import ParsePool
+from scavengarr.infrastructure.validation import LinkProbe
 
 if TYPE_CHECKING:
     from scavengarr.domain.ports import (
@@ -31,6 +44,16 @@ class AppState(State):
     # Infrastructure
     cache: CachePort
     http_client: httpx.AsyncClient
+    http_pool: PooledTransport
+    http_clients: HttpClientRegistry
+    rate_limiter: HostRateLimiter
+    pacer: AdaptivePacer
+    circuit_breakers: HostCircuitBreakers
+    hedger: RequestHedger
+    mirror_health: MirrorHealth
+    link_probe: LinkProbe
+    single_flight: SingleFlight
+    parse_pool: ParsePool
 
     # Domain Ports
     plugins: PluginRegistryPort
@@ -39,3 +62,4 @@ class AppState(State):
 
     # Application Services
     crawljob_factory: CrawlJobFactory  # CHANGED: From crawljob_service
+    crawljob_validation: CrawlJobValidationUseCase | None
@@ -30,10 +30,12 @@ def build_app(config: AppConfig) -> FastAPI:
 
     # ✅ Routers registrieren (keine Dependencies nötig)
     from scavengarr.interfaces.api.download.router import router as download_router
+    from scavengarr.interfaces.api.stats import router as stats_router
     from scavengarr.interfaces.api.torznab import router as torznab_router
 
     app.include_router(download_router)
     app.include_router(torznab_router, prefix="")
+    app.include_router(stats_router)
 
     # ✅ Health-Check (stateless)
     @app.get("/healthz")
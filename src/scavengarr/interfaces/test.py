@@ -2,7 +2,6 @@ import asyncio
 
 import httpx
 import yaml
-from diskcache import Cache
 from scavengarr.domain.plugins.schema import YamlPluginDefinition
 
 from scavengarr.adapters.scraping.scrapy_adapter import ScrapyAdapter
@@ -24,14 +23,11 @@ async def example_fastapi_usage():
         follow_redirects=True,
         headers={"User-Agent": "Scavengarr/1.0"},
     ) as http_client:
-        # Shared diskcache (created on FastAPI startup)
-        cache = Cache("./cache/scrapy")
-        cache.clear()
-        # Create scraper
+        # Create scraper (no stage-output cache outside the app)
         scraper = ScrapyAdapter(
             plugin=plugin,
             http_client=http_client,
-            cache=cache,
+            cache=None,
             delay_seconds=1.0,
             max_depth=3,
             max_retries=3,
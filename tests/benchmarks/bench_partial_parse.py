@@ -0,0 +1,126 @@
+"""Benchmark: full vs. region-limited (partial) parsing of a scraping stage.
+
+Runs the filmpalast movie_detail stage (StageScraper.parse + extract_data)
+over the pages in tests/fixtures/pages, once parsing whole pages and once
+parsing only the regions its selectors can match (scraping.partial_parse),
+for both parser backends. Both runs must extract the same data.
+
+Reports the mean time per page and the tracemalloc peak of one pass over
+the corpus. tracemalloc only sees allocations made through Python's
+allocator: BeautifulSoup's tree, but not libxml2's (lxml shows the bytes
+copied around the parser, e.g. the scoped document).
+
+Corpora:
+    - detail: filmpalast_detail.html (hand-written), its comment section
+      repeated until the page reaches --detail-kb: a large page with the
+      few regions the stage reads near the top
+    - no match: a page of the same size without any region the stage
+      reads (it is parsed in full after the scan: shows the scan's cost)
+
+Usage:
+    python tests/benchmarks/bench_partial_parse.py [--repeat N] [--detail-kb KB]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from scavengarr.adapters.scraping.scrapy_adapter import StageScraper
+from scavengarr.adapters.scraping.selectors import LxmlBackend, SoupBackend
+from scavengarr.infrastructure.plugins.loader import load_yaml_plugin
+
+ROOT = Path(__file__).resolve().parents[2]
+PAGES_DIR = ROOT / "tests" / "fixtures" / "pages"
+PLUGIN_PATH = ROOT / "plugins" / "filmpalast.to.yaml"
+
+_COMMENT = (
+    '<div class="comment"><p>Kommentar <b>Text</b> <span>s</span> '
+    '<a href="/user/x">@x</a></p></div>\n'
+)
+
+
+def _detail_page(target_kb: int) -> bytes:
+    page = (PAGES_DIR / "filmpalast_detail.html").read_text(encoding="utf-8")
+    head, marker, tail = page.partition("<h3>Kommentare</h3>")
+    missing = max(0, target_kb * 1024 - len(page))
+    filler = _COMMENT * (missing // len(_COMMENT) + 1)
+    return (head + marker + "\n" + filler + tail).encode("utf-8")
+
+
+def _unmatched_page(target_kb: int) -> bytes:
+    filler = _COMMENT * (target_kb * 1024 // len(_COMMENT) + 1)
+    return f"<!DOCTYPE html><html><body>{filler}</body></html>".encode("utf-8")
+
+
+def _run(scraper: StageScraper, pages: list[bytes], repeat: int) -> tuple[float, Any]:
+    """Mean milliseconds per page, and the data extracted from each page."""
+    results = []
+    start = time.perf_counter()
+    for _ in range(repeat):
+        results = [scraper.extract_data(scraper.parse(page)) for page in pages]
+    elapsed = time.perf_counter() - start
+    return elapsed / repeat / len(pages) * 1000, results
+
+
+def _peak_kb(scraper: StageScraper, pages: list[bytes]) -> float:
+    """tracemalloc peak (KB) of parsing and extracting every page once."""
+    tracemalloc.start()
+    try:
+        for page in pages:
+            scraper.extract_data(scraper.parse(page))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--detail-kb", type=int, default=236)
+    args = parser.parse_args()
+
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR)
+    )
+
+    plugin = load_yaml_plugin(PLUGIN_PATH)
+    stage = next(s for s in plugin.scraping.stages if s.name == "movie_detail")
+
+    detail = _detail_page(args.detail_kb)
+    unmatched = _unmatched_page(args.detail_kb)
+    corpora = {
+        f"detail ({len(detail) // 1024}KB)": [detail],
+        f"no match ({len(unmatched) // 1024}KB)": [unmatched],
+    }
+
+    for backend_cls in (LxmlBackend, SoupBackend):
+        for label, pages in corpora.items():
+            timings = {}
+            peaks = {}
+            extracted = {}
+            for partial in (False, True):
+                scraper = StageScraper(
+                    stage, str(plugin.base_url), backend_cls(), partial_parse=partial
+                )
+                timings[partial], extracted[partial] = _run(scraper, pages, args.repeat)
+                peaks[partial] = _peak_kb(scraper, pages)
+            if extracted[False] != extracted[True]:
+                raise SystemExit(f"{backend_cls.__name__} {label}: results differ")
+            print(
+                f"{backend_cls.__name__:12} {label:16} "
+                f"full {timings[False]:8.2f}ms  partial {timings[True]:8.2f}ms  "
+                f"x{timings[False] / timings[True]:.1f}  "
+                f"peak {peaks[False]:8.0f}KB / {peaks[True]:8.0f}KB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Record trimmed captures of an indexer's search and detail pages.
+
+Fetches the start stage's page for a query and the first page its links
+lead to, drops <script>/<style>/<noscript> elements and HTML comments (the
+raw-text cases are covered by raw_text_elements.html), and writes the
+pages to tests/fixtures/pages/<plugin>_search.html / <plugin>_detail.html.
+
+Usage:
+    python tests/fixtures/record_pages.py [--plugin filmpalast.to] [--query matrix]
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+import httpx
+import lxml.html
+from lxml import etree
+
+from scavengarr.adapters.scraping.scrapy_adapter import StageScraper
+from scavengarr.adapters.scraping.selectors import LxmlBackend
+from scavengarr.infrastructure.plugins.loader import load_yaml_plugin
+
+ROOT = Path(__file__).resolve().parents[2]
+PAGES_DIR = ROOT / "tests" / "fixtures" / "pages"
+
+
+def _trim(content: bytes) -> bytes:
+    doc = lxml.html.document_fromstring(content)
+    for node in doc.xpath("//script | //style | //noscript | //comment()"):
+        node.drop_tree()
+    return etree.tostring(
+        doc, method="html", encoding="utf-8", doctype="<!DOCTYPE html>"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--plugin", default="filmpalast.to")
+    parser.add_argument("--query", default="matrix")
+    args = parser.parse_args()
+
+    plugin = load_yaml_plugin(ROOT / "plugins" / f"{args.plugin}.yaml")
+    stages = {s.name: s for s in plugin.scraping.stages}
+    start = stages[plugin.scraping.start_stage]
+    base_url = str(plugin.base_url)
+    search = StageScraper(start, base_url, LxmlBackend())
+
+    http = plugin.http
+    with httpx.Client(
+        follow_redirects=True,
+        timeout=(http and http.timeout_seconds) or 15.0,
+        headers={"User-Agent": (http and http.user_agent) or "Scavengarr/1.0"},
+    ) as client:
+        search_url = search.build_url(base_url=base_url, query=args.query)
+        search_page = client.get(search_url).raise_for_status().content
+        links = search.extract_links(search.parse(search_page), base_url)
+        if not links:
+            raise SystemExit(f"no {start.next_stage} links on {search_url}")
+        detail_page = client.get(links[0]).raise_for_status().content
+
+    name = plugin.name
+    for suffix, content in (("search", search_page), ("detail", detail_page)):
+        path = PAGES_DIR / f"{name}_{suffix}.html"
+        path.write_bytes(_trim(content))
+        print(f"{path.relative_to(ROOT)}: {path.stat().st_size // 1024} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Download endpoint: unchecked links of deferred/on-download validation."""
+
+from __future__ import annotations
+
+import pickle
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from scavengarr.application.use_cases.crawljob_validation import (
+    CrawlJobValidationUseCase,
+)
+from scavengarr.domain.entities.crawljob import CrawlJob
+from scavengarr.infrastructure.persistence.crawljob_cache import (
+    CacheCrawlJobRepository,
+)
+from scavengarr.interfaces.api.download import router as download_router
+
+pytestmark = pytest.mark.asyncio
+
+LIVE = "https://hoster.example/live"
+DEAD = "https://hoster.example/dead"
+
+
+class _Cache:
+    """In-memory CachePort."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+
+    async def get(self, key: str) -> Any:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: Any, *, ttl: int | None = None) -> None:
+        self.data[key] = value
+
+
+class _Validator:
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    async def validate_batch(self, urls: list[str]) -> dict[str, bool]:
+        self.batches.append(urls)
+        return {url: url == LIVE for url in urls}
+
+
+class _Setup:
+    """App with a stored, not yet validated CrawlJob linking `urls`."""
+
+    def __init__(self, validation_mode: str, *urls: str) -> None:
+        self.cache = _Cache()
+        self.validator = _Validator()
+        repo = CacheCrawlJobRepository(self.cache, ttl_seconds=3600)
+        self.app = FastAPI()
+        self.app.include_router(download_router)
+        self.app.state.config = SimpleNamespace(validation_mode=validation_mode)
+        self.app.state.crawljob_repo = repo
+        self.app.state.crawljob_validation = CrawlJobValidationUseCase(
+            self.validator, repo
+        )
+        self.job = CrawlJob(text="\n".join(urls), unchecked_urls=list(urls))
+        self.cache.data[f"crawljob:{self.job.job_id}"] = pickle.dumps(self.job)
+
+    async def download(self) -> httpx.Response:
+        transport = httpx.ASGITransport(app=self.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            return await c.get(f"/api/v1/download/{self.job.job_id}")
+
+    def stored(self) -> CrawlJob:
+        return pickle.loads(self.cache.data[f"crawljob:{self.job.job_id}"])
+
+
+async def test_on_download_validates_once_and_saves_the_verdict() -> None:
+    setup = _Setup("on_download", LIVE, DEAD)
+
+    first = await setup.download()
+    second = await setup.download()
+
+    assert setup.validator.batches == [[LIVE, DEAD]]
+    for response in (first, second):
+        assert response.status_code == 200
+        assert response.headers["X-CrawlJob-Validation"] == "validated"
+        assert response.headers["X-CrawlJob-Links"] == "1"
+        assert f"text={LIVE}\n" in response.text
+    stored = setup.stored()
+    assert (stored.validated_urls, stored.unchecked_urls) == ([LIVE], [])
+
+
+async def test_on_download_dead_links_stay_gone() -> None:
+    setup = _Setup("on_download", DEAD)
+
+    assert (await setup.download()).status_code == 410
+    assert (await setup.download()).status_code == 410
+    assert setup.validator.batches == [[DEAD]]
+
+
+async def test_deferred_jobs_are_served_as_pending_until_checked() -> None:
+    setup = _Setup("deferred", LIVE, DEAD)
+
+    response = await setup.download()
+
+    assert response.status_code == 200
+    assert response.headers["X-CrawlJob-Validation"] == "pending"
+    assert response.headers["X-CrawlJob-Links"] == "2"
+    assert setup.validator.batches == []  # left to the background validation
@@ -0,0 +1,79 @@
+"""Torznab search endpoint: partial results are flagged with a response header."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from scavengarr.application.factories import CrawlJobFactory
+from scavengarr.domain.entities.crawljob import CrawlJob
+from scavengarr.infrastructure.torznab.httpx_scrapy_engine import SearchResult
+from scavengarr.interfaces.api.torznab import router as torznab_router
+from scavengarr.interfaces.api.torznab.router import PARTIAL_RESULTS_HEADER
+
+pytestmark = pytest.mark.asyncio
+
+_PLUGIN = SimpleNamespace(
+    name="filmpalast",
+    base_url="https://filmpalast.to",
+    scraping=SimpleNamespace(mode="scrapy", search_deadline_seconds=None),
+)
+
+
+class _Plugins:
+    def discover(self) -> None:
+        pass
+
+    def get(self, name: str) -> Any:
+        return _PLUGIN
+
+
+class _Repo:
+    async def save(self, job: CrawlJob) -> None:
+        pass
+
+
+class _SlowEngine:
+    """Yields one result at once, then hangs until cancelled."""
+
+    async def iter_search(
+        self, plugin: Any, query: str, max_results: int | None = None, **params: Any
+    ) -> AsyncIterator[SearchResult]:
+        yield SearchResult(title=f"{query} 0", download_link="https://hoster.example/0")
+        await asyncio.sleep(3600)
+
+
+def _app(deadline: float | None) -> FastAPI:
+    app = FastAPI()
+    app.include_router(torznab_router)
+    app.state.config = SimpleNamespace(
+        app_name="scavengarr",
+        environment="dev",
+        search_deadline_seconds=deadline,
+        search_max_results=500,
+        validation_mode="inline",
+    )
+    app.state.plugins = _Plugins()
+    app.state.search_engine = _SlowEngine()
+    app.state.crawljob_factory = CrawlJobFactory()
+    app.state.crawljob_repo = _Repo()
+    app.state.crawljob_validation = None
+    return app
+
+
+async def test_search_cut_short_by_the_deadline_sets_the_header() -> None:
+    transport = httpx.ASGITransport(app=_app(deadline=0.05))
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+        response = await client.get(
+            "/api/v1/torznab/filmpalast", params={"t": "search", "q": "matrix"}
+        )
+
+    assert response.status_code == 200
+    assert response.headers[PARTIAL_RESULTS_HEADER] == "true"
+    assert "matrix 0" in response.text
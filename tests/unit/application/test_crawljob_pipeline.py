@@ -0,0 +1,137 @@
+"""TorznabSearchUseCase: CrawlJobs are created while the crawl is running."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from scavengarr.application.factories import CrawlJobFactory
+from scavengarr.application.use_cases.torznab_search import TorznabSearchUseCase
+from scavengarr.domain.entities import TorznabQuery
+from scavengarr.domain.entities.crawljob import CrawlJob
+from scavengarr.infrastructure.torznab.httpx_scrapy_engine import SearchResult
+
+pytestmark = pytest.mark.asyncio
+
+_PLUGIN = SimpleNamespace(
+    name="filmpalast",
+    base_url="https://filmpalast.to",
+    scraping=SimpleNamespace(mode="scrapy", search_deadline_seconds=None),
+)
+
+
+class _Plugins:
+    def discover(self) -> None:
+        pass
+
+    def get(self, name: str) -> Any:
+        return _PLUGIN
+
+
+class _Repo:
+    """Records saves; saves of titles in `hang` never finish."""
+
+    def __init__(self, hang: tuple[str, ...] = ()) -> None:
+        self.hang = hang
+        self.saved: list[CrawlJob] = []
+        self.cancelled = 0
+        self.first_save = asyncio.Event()
+
+    async def save(self, job: CrawlJob) -> None:
+        if job.package_name in self.hang:
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+        self.saved.append(job)
+        self.first_save.set()
+
+
+class _Engine:
+    """Yields `titles`; waits for `wait_for` after the first one."""
+
+    def __init__(self, *titles: str, wait_for: asyncio.Event | None = None) -> None:
+        self.titles = titles
+        self.wait_for = wait_for
+
+    async def iter_search(
+        self, plugin: Any, query: str, max_results: int | None = None, **params: Any
+    ) -> AsyncIterator[SearchResult]:
+        for i, title in enumerate(self.titles):
+            if i == 1 and self.wait_for is not None:
+                await asyncio.wait_for(self.wait_for.wait(), 1.0)
+            yield SearchResult(
+                title=title,
+                download_link=f"https://hoster.example/{i}",
+                position=(i,),
+            )
+        await asyncio.sleep(3600)
+
+
+def _use_case(engine: _Engine, repo: _Repo, deadline: float) -> TorznabSearchUseCase:
+    return TorznabSearchUseCase(
+        plugins=_Plugins(),
+        engine=engine,
+        crawljob_factory=CrawlJobFactory(),
+        crawljob_repo=repo,
+        search_deadline_seconds=deadline,
+    )
+
+
+async def _execute(use_case: TorznabSearchUseCase, **query: Any) -> Any:
+    """Run a search; fails instead of hanging if work outlives the deadline."""
+    q = TorznabQuery(action="search", query="matrix", plugin_name="filmpalast", **query)
+    return await asyncio.wait_for(use_case.execute(q), 2.0)
+
+
+async def test_crawljobs_are_stored_while_the_crawl_runs() -> None:
+    repo = _Repo()
+    # The second result only arrives once the first CrawlJob is stored
+    engine = _Engine("a", "b", wait_for=repo.first_save)
+
+    result = await _execute(_use_case(engine, repo, deadline=0.2))
+
+    assert [item.title for item in result.items] == ["a", "b"]
+    assert [job.package_name for job in repo.saved] == ["a", "b"]
+
+
+async def test_crawljobs_not_stored_by_the_deadline_are_dropped() -> None:
+    repo = _Repo(hang=("b",))
+
+    result = await _execute(_use_case(_Engine("a", "b", "c"), repo, deadline=0.05))
+
+    assert result.partial
+    assert [item.title for item in result.items] == ["a", "c"]
+    assert repo.cancelled == 1  # nothing keeps running after the deadline
+    assert [job.package_name for job in repo.saved] == ["a", "c"]
+
+
+async def test_page_is_selected_from_the_stored_crawljobs() -> None:
+    repo = _Repo(hang=("b",))
+
+    use_case = _use_case(_Engine("a", "b", "c", "d"), repo, deadline=0.05)
+
+    result = await _execute(use_case, offset=1, limit=2)
+
+    assert [item.title for item in result.items] == ["c", "d"]
+    assert all(item.job_id for item in result.items)
+
+
+@pytest.mark.parametrize(("mode", "pending"), [("inline", False), ("deferred", True)])
+async def test_links_are_unchecked_unless_validated_inline(
+    mode: str, pending: bool
+) -> None:
+    repo = _Repo()
+    use_case = _use_case(_Engine("a"), repo, deadline=0.05)
+    use_case.validation_mode = mode
+
+    await _execute(use_case)
+
+    (job,) = repo.saved
+    assert job.is_pending() is pending
+    assert job.validated_urls + job.unchecked_urls == ["https://hoster.example/0"]
@@ -0,0 +1,132 @@
+"""CrawlJobValidationUseCase: scheduled validation, shutdown, job expiry."""
+
+from __future__ import annotations
+
+import asyncio
+import pickle
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+from scavengarr.application.use_cases.crawljob_validation import (
+    CrawlJobValidationUseCase,
+)
+from scavengarr.domain.entities.crawljob import CrawlJob
+from scavengarr.infrastructure.persistence.crawljob_cache import (
+    CacheCrawlJobRepository,
+)
+
+pytestmark = pytest.mark.asyncio
+
+LIVE = "https://hoster.example/live"
+DEAD = "https://hoster.example/dead"
+
+
+class _Cache:
+    """In-memory CachePort recording the TTL of every set()."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+        self.ttls: dict[str, int | None] = {}
+
+    async def get(self, key: str) -> Any:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: Any, *, ttl: int | None = None) -> None:
+        self.data[key] = value
+        self.ttls[key] = ttl
+
+
+class _Validator:
+    """validate_batch() answers from `verdicts`, optionally after `release`."""
+
+    def __init__(self, release: asyncio.Event | None = None) -> None:
+        self.release = release
+        self.cancelled = False
+        self.batches: list[list[str]] = []
+
+    async def validate_batch(self, urls: list[str]) -> dict[str, bool]:
+        self.batches.append(urls)
+        try:
+            if self.release is not None:
+                await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return {url: url == LIVE for url in urls}
+
+
+def _job(expires_in: float) -> CrawlJob:
+    return CrawlJob(
+        text=f"{LIVE}\n{DEAD}",
+        unchecked_urls=[LIVE, DEAD],
+        expires_at=datetime.now(timezone.utc) + timedelta(seconds=expires_in),
+    )
+
+
+async def _drain(use_case: CrawlJobValidationUseCase) -> None:
+    while use_case.pending:
+        await asyncio.sleep(0)
+
+
+async def test_scheduled_validation_saves_verdicts_with_the_remaining_ttl() -> None:
+    cache = _Cache()
+    repo = CacheCrawlJobRepository(cache, ttl_seconds=3600)
+    use_case = CrawlJobValidationUseCase(_Validator(), repo)
+    job = _job(expires_in=600)
+    await repo.save(job)
+    assert cache.ttls[f"crawljob:{job.job_id}"] == 600
+
+    use_case.schedule([job])
+    await _drain(use_case)
+
+    stored = pickle.loads(cache.data[f"crawljob:{job.job_id}"])
+    assert stored.validated_urls == [LIVE]
+    assert not stored.is_pending()
+    assert stored.text == LIVE
+    assert stored.validated_at is not None
+    assert 590 <= cache.ttls[f"crawljob:{job.job_id}"] <= 600
+
+
+async def test_expired_jobs_are_not_saved_again() -> None:
+    cache = _Cache()
+    use_case = CrawlJobValidationUseCase(
+        _Validator(), CacheCrawlJobRepository(cache, ttl_seconds=3600)
+    )
+
+    await use_case.validate(_job(expires_in=-1))
+
+    assert cache.data == {}
+
+
+async def test_aclose_cancels_pending_validations() -> None:
+    cache = _Cache()
+    validator = _Validator(release=asyncio.Event())
+    use_case = CrawlJobValidationUseCase(
+        validator, CacheCrawlJobRepository(cache, ttl_seconds=3600)
+    )
+
+    use_case.schedule([_job(expires_in=600)])
+    await asyncio.sleep(0)
+    assert use_case.pending == 1
+
+    await use_case.aclose()
+
+    assert validator.cancelled
+    assert use_case.pending == 0
+    assert cache.data == {}
+
+
+async def test_only_unchecked_links_are_validated() -> None:
+    validator = _Validator()
+    use_case = CrawlJobValidationUseCase(
+        validator, CacheCrawlJobRepository(_Cache(), ttl_seconds=3600)
+    )
+    checked = CrawlJob(text=LIVE, validated_urls=[LIVE])
+    pending = _job(expires_in=600)
+
+    await use_case.validate_many([checked, pending])
+    await use_case.validate(pending)  # already checked: not asked again
+
+    assert validator.batches == [[LIVE, DEAD]]
@@ -0,0 +1,96 @@
+"""TorznabSearchUseCase: the search deadline returns partial results."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from scavengarr.application.factories import CrawlJobFactory
+from scavengarr.application.use_cases.torznab_search import TorznabSearchUseCase
+from scavengarr.domain.entities import TorznabQuery
+from scavengarr.domain.entities.crawljob import CrawlJob
+from scavengarr.infrastructure.torznab.httpx_scrapy_engine import SearchResult
+
+pytestmark = pytest.mark.asyncio
+
+_PLUGIN = SimpleNamespace(
+    name="filmpalast",
+    base_url="https://filmpalast.to",
+    scraping=SimpleNamespace(mode="scrapy", search_deadline_seconds=None),
+)
+
+
+class _Plugins:
+    def discover(self) -> None:
+        pass
+
+    def get(self, name: str) -> Any:
+        return _PLUGIN
+
+
+class _Repo:
+    def __init__(self) -> None:
+        self.jobs: list[CrawlJob] = []
+
+    async def save(self, job: CrawlJob) -> None:
+        self.jobs.append(job)
+
+
+class _SlowEngine:
+    """Yields `fast` results at once, then hangs until cancelled."""
+
+    def __init__(self, fast: int) -> None:
+        self.fast = fast
+        self.cancelled = False
+
+    async def iter_search(
+        self, plugin: Any, query: str, max_results: int | None = None, **params: Any
+    ) -> AsyncIterator[SearchResult]:
+        for i in range(self.fast):
+            yield SearchResult(
+                title=f"{query} {i}",
+                download_link=f"https://hoster.example/{i}",
+                position=(i,),
+            )
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+def _use_case(engine: _SlowEngine, deadline: float | None) -> TorznabSearchUseCase:
+    return TorznabSearchUseCase(
+        plugins=_Plugins(),
+        engine=engine,
+        crawljob_factory=CrawlJobFactory(),
+        crawljob_repo=_Repo(),
+        search_deadline_seconds=deadline,
+    )
+
+
+async def test_expired_deadline_returns_partial_results() -> None:
+    engine = _SlowEngine(fast=2)
+
+    result = await _use_case(engine, deadline=0.05).execute(
+        TorznabQuery(action="search", query="matrix", plugin_name="filmpalast")
+    )
+
+    assert result.partial
+    assert [item.title for item in result.items] == ["matrix 0", "matrix 1"]
+    assert all(item.job_id for item in result.items)
+    assert engine.cancelled
+
+
+async def test_plugin_deadline_overrides_the_global_one() -> None:
+    plugin = SimpleNamespace(
+        scraping=SimpleNamespace(mode="scrapy", search_deadline_seconds=0.05)
+    )
+    use_case = _use_case(_SlowEngine(fast=1), deadline=None)
+
+    assert use_case._deadline_for(plugin) == 0.05
+    assert use_case._deadline_for(_PLUGIN) is None
@@ -0,0 +1,124 @@
+"""TorznabSearchUseCase paging: crawl budget, its cap and the offset window."""
+
+from __future__ import annotations
+
+import random
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from scavengarr.application.factories import CrawlJobFactory
+from scavengarr.application.use_cases.torznab_search import (
+    TorznabSearchUseCase,
+    _crawl_budget,
+    _select_page,
+)
+from scavengarr.domain.entities import TorznabQuery
+from scavengarr.domain.entities.crawljob import CrawlJob
+from scavengarr.infrastructure.torznab.httpx_scrapy_engine import SearchResult
+
+_PLUGIN = SimpleNamespace(
+    name="filmpalast",
+    base_url="https://filmpalast.to",
+    scraping=SimpleNamespace(mode="scrapy", search_deadline_seconds=None),
+)
+_TITLES = [f"movie {i}" for i in range(6)]
+
+
+class _Plugins:
+    def discover(self) -> None:
+        pass
+
+    def get(self, name: str) -> Any:
+        return _PLUGIN
+
+
+class _Repo:
+    async def save(self, job: CrawlJob) -> None:
+        pass
+
+
+class _Engine:
+    """Yields _TITLES in a different completion order on every search."""
+
+    def __init__(self) -> None:
+        self.rng = random.Random(0)
+        self.budgets: list[int | None] = []
+
+    async def iter_search(
+        self, plugin: Any, query: str, max_results: int | None = None, **params: Any
+    ) -> AsyncIterator[SearchResult]:
+        self.budgets.append(max_results)
+        order = list(range(len(_TITLES)))
+        self.rng.shuffle(order)
+        for i in order:
+            yield SearchResult(
+                title=_TITLES[i],
+                download_link=f"https://hoster.example/{i}",
+                position=(0, i),
+            )
+
+
+def _query(**paging: Any) -> TorznabQuery:
+    return TorznabQuery(
+        action="search", query="matrix", plugin_name="filmpalast", **paging
+    )
+
+
+def _use_case(engine: _Engine, cap: int | None = None) -> TorznabSearchUseCase:
+    return TorznabSearchUseCase(
+        plugins=_Plugins(),
+        engine=engine,
+        crawljob_factory=CrawlJobFactory(),
+        crawljob_repo=_Repo(),
+        max_search_results=cap,
+    )
+
+
+def test_crawl_budget_over_fetches_offset_and_limit() -> None:
+    assert _crawl_budget(_query()) is None
+    assert _crawl_budget(_query(offset=10, limit=5)) == 30
+    assert _crawl_budget(_query(offset=10, limit=5), cap=20) == 20
+    assert _crawl_budget(_query(limit=5), cap=20) == 10
+
+
+def test_select_page_sorts_into_document_order() -> None:
+    results = [SimpleNamespace(position=(0, i)) for i in (3, 0, 2, 1)]
+
+    page = _select_page(_query(offset=1, limit=2), results)
+
+    assert [r.position for r in page] == [(0, 1), (0, 2)]
+    assert len(_select_page(_query(offset=2), results)) == 2
+
+
+@pytest.mark.asyncio
+async def test_pages_are_stable_across_searches() -> None:
+    engine = _Engine()
+    use_case = _use_case(engine)
+
+    first = await use_case.execute(_query(offset=0, limit=3))
+    second = await use_case.execute(_query(offset=3, limit=3))
+
+    titles = [item.title for item in first.items + second.items]
+    assert titles == _TITLES
+
+
+@pytest.mark.asyncio
+async def test_crawl_budget_is_capped_by_max_search_results() -> None:
+    engine = _Engine()
+
+    await _use_case(engine, cap=4).execute(_query(offset=2, limit=2))
+
+    assert engine.budgets == [4]
+
+
+@pytest.mark.asyncio
+async def test_offset_beyond_the_cap_does_not_search() -> None:
+    engine = _Engine()
+
+    result = await _use_case(engine, cap=4).execute(_query(offset=4, limit=2))
+
+    assert result.items == []
+    assert engine.budgets == []
@@ -0,0 +1,185 @@
+"""CircuitBreaker state machine and the adapter's fail-fast / skip paths."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+from scavengarr.adapters.scraping import CrawlIncompleteError, ScrapyAdapter
+from scavengarr.infrastructure.http import (
+    CircuitBreaker,
+    CircuitOpenError,
+    HostCircuitBreakers,
+)
+from scavengarr.infrastructure.plugins.loader import load_yaml_plugin
+
+ROOT = Path(__file__).resolve().parents[3]
+PAGES_DIR = ROOT / "tests" / "fixtures" / "pages"
+URL = "https://filmpalast.to/search/title/matrix"
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _breaker(clock: _Clock, **kwargs: float) -> CircuitBreaker:
+    return CircuitBreaker("indexer.example", open_seconds=30.0, clock=clock, **kwargs)
+
+
+def test_consecutive_failures_open_the_circuit() -> None:
+    breaker = _breaker(_Clock(), failure_threshold=3)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_success()  # resets the streak
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+
+def test_failure_rate_opens_the_circuit_once_min_calls_are_reached() -> None:
+    breaker = _breaker(_Clock(), failure_threshold=100, failure_rate=0.5)
+
+    # 5 of 9 calls failed: above the rate, but judged only from 10 calls on
+    for _ in range(4):
+        breaker.record_failure()
+        breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+
+def test_successful_half_open_trial_closes_the_circuit() -> None:
+    clock = _Clock()
+    breaker = _breaker(clock, failure_threshold=1)
+    breaker.record_failure()
+
+    clock.now += 30.0
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+    assert not breaker.allow()  # one trial at a time
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow()
+
+
+def test_failed_half_open_trial_opens_the_circuit_again() -> None:
+    clock = _Clock()
+    breaker = _breaker(clock, failure_threshold=1)
+    breaker.record_failure()
+
+    clock.now += 30.0
+    assert breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    assert breaker.retry_in() == 30.0
+    clock.now += 29.0
+    assert not breaker.allow()
+
+
+def test_snapshot_does_not_register_a_breaker() -> None:
+    breakers = HostCircuitBreakers()
+
+    snapshot = breakers.snapshot("https://mirror.example/")
+
+    assert snapshot["state"] == "closed"
+    assert breakers.stats() == {}
+
+
+def _adapter(
+    client: httpx.AsyncClient, breakers: HostCircuitBreakers, **kwargs: int
+) -> ScrapyAdapter:
+    plugin = load_yaml_plugin(ROOT / "plugins" / "filmpalast.to.yaml")
+    return ScrapyAdapter(
+        plugin=plugin,
+        http_client=client,
+        cache=None,
+        delay_seconds=0.0,
+        circuit_breakers=breakers,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast_without_a_request() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200)
+
+    breakers = HostCircuitBreakers(failure_threshold=1, open_seconds=60.0)
+    breakers.record(URL, success=False)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        adapter = _adapter(client, breakers)
+        started = time.monotonic()
+        with pytest.raises(CircuitOpenError):
+            await adapter._fetch_response(URL)
+        elapsed = time.monotonic() - started
+
+    assert requests == []
+    assert elapsed < 0.05
+
+
+def _failing_details_transport(requests: list[str]) -> httpx.MockTransport:
+    """Search page answers; the first detail page fails with 503."""
+    search = (PAGES_DIR / "filmpalast_search.html").read_bytes()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path.startswith("/search/"):
+            return httpx.Response(200, content=search)
+        return httpx.Response(503)
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.asyncio
+async def test_iter_scrape_skips_pages_once_the_circuit_opens() -> None:
+    requests: list[str] = []
+    breakers = HostCircuitBreakers(failure_threshold=1, open_seconds=60.0)
+
+    async with httpx.AsyncClient(
+        transport=_failing_details_transport(requests)
+    ) as client:
+        adapter = _adapter(client, breakers, max_concurrency=1, max_retries=1)
+        items = []
+        with pytest.raises(CrawlIncompleteError) as excinfo:
+            async for item in adapter.iter_scrape("matrix"):
+                items.append(item)
+
+    # Only the search page and the first detail page were requested
+    assert len(requests) == 2
+    assert {stage for stage, _, _ in items} == {"search_results"}
+    assert excinfo.value.skipped_urls
+    assert all("/stream/" in url for url in excinfo.value.skipped_urls)
+
+
+@pytest.mark.asyncio
+async def test_scrape_raises_with_the_results_it_collected() -> None:
+    breakers = HostCircuitBreakers(failure_threshold=1, open_seconds=60.0)
+
+    async with httpx.AsyncClient(transport=_failing_details_transport([])) as client:
+        adapter = _adapter(client, breakers, max_concurrency=1, max_retries=1)
+        with pytest.raises(CrawlIncompleteError) as excinfo:
+            await adapter.scrape("matrix")
+
+    assert excinfo.value.skipped_urls
+    assert list(excinfo.value.results) == ["search_results"]
@@ -0,0 +1,122 @@
+"""Per-plugin HTTP clients (HttpClientRegistry) and PooledTransport counters."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+import pytest
+
+from scavengarr.domain.plugins.schema import HttpOverrides
+from scavengarr.infrastructure.http import HttpClientRegistry, PooledTransport
+
+pytestmark = pytest.mark.asyncio
+
+LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+
+def _registry() -> HttpClientRegistry:
+    return HttpClientRegistry(
+        timeout_seconds=30.0,
+        user_agent="Scavengarr/app",
+        follow_redirects=True,
+        limits=LIMITS,
+        http2=False,
+    )
+
+
+def _plugin(name: str, **overrides: Any) -> SimpleNamespace:
+    return SimpleNamespace(name=name, http=HttpOverrides(**overrides))
+
+
+def _transport(client: httpx.AsyncClient) -> PooledTransport:
+    return client._transport
+
+
+async def test_clients_are_created_on_first_use_one_per_plugin() -> None:
+    registry = _registry()
+    assert registry.stats() == {}
+
+    first = registry.client_for(_plugin("a"))
+    assert registry.client_for(_plugin("a")) is first
+    second = registry.client_for(_plugin("b"))
+
+    assert second is not first
+    assert _transport(second) is not _transport(first)
+    assert set(registry.stats()) == {"a", "b"}
+    await registry.aclose()
+
+
+async def test_plugin_overrides_reach_the_client() -> None:
+    registry = _registry()
+
+    client = registry.client_for(
+        _plugin(
+            "a",
+            timeout_seconds=5.0,
+            user_agent="Scavengarr/a",
+            follow_redirects=False,
+            max_connections=4,
+            http2=True,
+        )
+    )
+    defaults = registry.client_for(SimpleNamespace(name="b"))
+
+    assert client.timeout == httpx.Timeout(5.0)
+    assert client.headers["User-Agent"] == "Scavengarr/a"
+    assert not client.follow_redirects
+    transport = _transport(client)
+    assert transport.limits.max_connections == 4
+    assert transport.limits.max_keepalive_connections == 4
+    assert transport.http2
+    assert registry.stats()["a"]["max_connections"] == 4
+
+    assert defaults.timeout == httpx.Timeout(30.0)
+    assert defaults.headers["User-Agent"] == "Scavengarr/app"
+    assert defaults.follow_redirects
+    assert _transport(defaults).limits.max_connections == 50
+    assert _transport(defaults).limits.max_keepalive_connections == 20
+    assert not _transport(defaults).http2
+    await registry.aclose()
+
+
+async def test_changed_overrides_get_a_new_client_all_closed_on_shutdown() -> None:
+    registry = _registry()
+    old = registry.client_for(_plugin("a", timeout_seconds=5.0))
+
+    new = registry.client_for(_plugin("a", timeout_seconds=10.0))
+
+    assert new is not old
+    assert not old.is_closed  # requests still running may finish
+    await registry.aclose()
+    assert old.is_closed
+    assert new.is_closed
+    assert registry.stats() == {}
+
+
+async def test_pool_stats_count_requests_and_pool_wait() -> None:
+    transport = PooledTransport(limits=httpx.Limits(max_connections=10))
+    traced: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.02)  # waiting for a connection
+        await request.extensions["trace"]("connection.connect_tcp.started", {})
+        return httpx.Response(200)
+
+    async def outer_trace(event: str, info: dict) -> None:
+        traced.append(event)
+
+    transport._transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        await asyncio.gather(
+            client.get("https://indexer.example/a"),
+            client.get("https://indexer.example/b", extensions={"trace": outer_trace}),
+        )
+
+    stats = transport.stats()
+    assert (stats["requests"], stats["in_flight"], stats["waiting"]) == (2, 0, 0)
+    assert stats["pool_wait_max_ms"] >= 15
+    assert stats["max_connections"] == 10
+    assert traced == ["connection.connect_tcp.started"]
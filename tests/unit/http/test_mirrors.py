@@ -0,0 +1,154 @@
+"""Mirror scores, mirror selection and the adapter's failover to mirrors."""
+
+from __future__ import annotations
+
+from collections import Counter
+from pathlib import Path
+
+import httpx
+import pytest
+from pydantic import HttpUrl
+
+from scavengarr.adapters.scraping import ScrapyAdapter
+from scavengarr.domain.plugins.schema import PaginationConfig
+from scavengarr.infrastructure.http import HostCircuitBreakers, MirrorHealth
+from scavengarr.infrastructure.plugins.loader import load_yaml_plugin
+
+ROOT = Path(__file__).resolve().parents[3]
+PRIMARY = "https://filmpalast.to"
+MIRROR = "https://filmpalast.example"
+SLOW = "https://filmpalast.slow"
+
+
+def test_unmeasured_mirrors_rank_after_the_primary() -> None:
+    health = MirrorHealth()
+    health.record(PRIMARY, success=True, latency=0.5)
+
+    assert health.rank([PRIMARY, MIRROR]) == [PRIMARY, MIRROR]
+
+
+def test_unmeasured_mirrors_rank_after_measured_ones() -> None:
+    health = MirrorHealth()
+    health.record(PRIMARY, success=True, latency=0.5)
+    health.record(SLOW, success=True, latency=2.0)
+
+    assert health.rank([PRIMARY, MIRROR, SLOW]) == [PRIMARY, SLOW, MIRROR]
+
+
+def test_mirrors_rank_by_latency_and_failures() -> None:
+    health = MirrorHealth()
+    health.record(PRIMARY, success=True, latency=0.5)
+    health.record(MIRROR, success=True, latency=0.1)
+    assert health.rank([PRIMARY, MIRROR]) == [MIRROR, PRIMARY]
+
+    health.record(MIRROR, success=False)  # cooling down: last
+    assert health.rank([PRIMARY, MIRROR]) == [PRIMARY, MIRROR]
+
+
+class _Site:
+    """The filmpalast search (2 pages) and detail pages, on every mirror.
+
+    Requests to hosts in `down` fail to connect.
+    """
+
+    def __init__(self, *down: str) -> None:
+        self.down = {httpx.URL(url).host for url in down}
+        self.requests: Counter[str] = Counter()
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        url = request.url
+        self.requests[f"{url.scheme}://{url.host}{url.path}"] += 1
+        if url.host in self.down:
+            raise httpx.ConnectError("connection refused", request=request)
+        if url.path.startswith("/stream/"):
+            slug = url.path.rsplit("/", 1)[-1]
+            body = (
+                f'<h2 class="bgDark">{slug}</h2>'
+                '<div id="grap-stream-list"><ul class="currentStreamLinks"><li>'
+                f'<a class="button" href="https://hoster.example/{slug}">play</a>'
+                "</li></ul></div>"
+            )
+        elif url.path.endswith("/page/2"):
+            body = '<h2 class="bgDark">b</h2><a href="/stream/b">b</a>'
+        else:
+            body = (
+                '<h2 class="bgDark">a</h2><a href="/stream/a">a</a>'
+                '<a class="next" href="/search/title/matrix/page/2">next</a>'
+            )
+        return httpx.Response(200, content=f"<html><body>{body}</body></html>".encode())
+
+
+def _adapter(
+    client: httpx.AsyncClient,
+    health: MirrorHealth | None = None,
+    breakers: HostCircuitBreakers | None = None,
+) -> ScrapyAdapter:
+    plugin = load_yaml_plugin(ROOT / "plugins" / "filmpalast.to.yaml")
+    plugin.mirrors = [HttpUrl(MIRROR)]
+    stage = next(s for s in plugin.scraping.stages if s.name == "search_results")
+    stage.pagination = PaginationConfig(enabled=True, selector="a.next", max_pages=2)
+    return ScrapyAdapter(
+        plugin=plugin,
+        http_client=client,
+        cache=None,
+        delay_seconds=0.0,
+        max_retries=1,
+        circuit_breakers=breakers,
+        mirror_health=health,
+    )
+
+
+def _hoster_links(results: dict) -> list[str]:
+    return [item["download_links"][0]["link"] for item in results["movie_detail"]]
+
+
+def _hosts(site: _Site) -> Counter[str]:
+    return Counter(httpx.URL(url).host for url in site.requests.elements())
+
+
+@pytest.mark.asyncio
+async def test_connect_error_fails_over_to_the_next_mirror() -> None:
+    site = _Site(PRIMARY)
+    health = MirrorHealth()
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(site)) as client:
+        adapter = _adapter(client, health)
+        results = await adapter.scrape("matrix")
+        next_search = adapter.select_mirror()
+
+    assert _hoster_links(results) == [
+        "https://hoster.example/a",
+        "https://hoster.example/b",
+    ]
+    # Only the start page went to the primary; the next page and the detail
+    # pages were resolved against the mirror that answered
+    assert _hosts(site) == {"filmpalast.to": 1, "filmpalast.example": 4}
+    assert site.requests[f"{MIRROR}/search/title/matrix/page/2"] == 1
+    assert site.requests[f"{MIRROR}/stream/a"] == 1
+    assert next_search == f"{MIRROR}/"  # the primary is cooling down
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_over_without_a_request() -> None:
+    site = _Site()
+    breakers = HostCircuitBreakers(failure_threshold=1)
+    breakers.record(PRIMARY, success=False)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(site)) as client:
+        results = await _adapter(client, breakers=breakers).scrape("matrix")
+
+    assert len(results["movie_detail"]) == 2
+    assert _hosts(site) == {"filmpalast.example": 4}
+
+
+@pytest.mark.asyncio
+async def test_searches_start_on_the_best_mirror() -> None:
+    site = _Site()
+    health = MirrorHealth()
+    health.record(PRIMARY, success=True, latency=1.0)
+    health.record(MIRROR, success=True, latency=0.1)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(site)) as client:
+        await _adapter(client, health).scrape("matrix")
+
+    assert _hosts(site) == {"filmpalast.example": 4}
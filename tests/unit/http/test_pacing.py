@@ -0,0 +1,224 @@
+"""AdaptivePacer (AIMD pacing, Retry-After, persistence) and 429 retries."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+from scavengarr.adapters.scraping import ScrapyAdapter, scrapy_adapter
+from scavengarr.infrastructure.http import (
+    AdaptivePacer,
+    HostRateLimiter,
+    pacing,
+    rate_limiter,
+)
+from scavengarr.infrastructure.plugins.loader import load_yaml_plugin
+
+pytestmark = pytest.mark.asyncio
+
+ROOT = Path(__file__).resolve().parents[3]
+HOST = "indexer.example"
+URL = f"https://{HOST}/search"
+
+
+class _Clock:
+    """Stands in for the `time` module of pacing and rate_limiter."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return 1_700_000_000.0 + self.now
+
+
+class _Cache:
+    """In-memory CachePort (get/set only)."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+        self.ttls: dict[str, int | None] = {}
+
+    async def get(self, key: str) -> Any:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: Any, *, ttl: int | None = None) -> None:
+        self.data[key] = value
+        self.ttls[key] = ttl
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(pacing, "time", clock)
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    return clock
+
+
+def _pacer(
+    cache: _Cache | None = None, rate: float = 4.0, max_rate: float = 4.0
+) -> AdaptivePacer:
+    pacer = AdaptivePacer(HostRateLimiter(), cache=cache)
+    pacer.configure(HOST, rate=rate, max_rate=max_rate)
+    return pacer
+
+
+def _rate(pacer: AdaptivePacer) -> float:
+    return pacer.stats()[HOST]["rate"]
+
+
+async def test_throttling_halves_the_rate_once_per_cooldown(clock: _Clock) -> None:
+    pacer = _pacer()
+
+    await pacer.record(URL, 429)
+    assert _rate(pacer) == 2.0
+    assert pacer.rate_limiter.bucket_for(HOST).rate == 2.0
+
+    # Responses to requests sent before the decrease took effect
+    await pacer.record(URL, 503)
+    assert _rate(pacer) == 2.0
+
+    clock.now += 3.0
+    await pacer.record(URL, 503)
+    assert _rate(pacer) == 1.0
+
+
+async def test_rate_never_drops_below_the_minimum(clock: _Clock) -> None:
+    pacer = _pacer(rate=0.06, max_rate=0.06)
+
+    await pacer.record(URL, 429)
+
+    assert _rate(pacer) == pacing._MIN_RATE
+
+
+async def test_retry_after_pauses_the_host(clock: _Clock) -> None:
+    pacer = _pacer(rate=1.0, max_rate=1.0)
+
+    await pacer.record(URL, 429, retry_after=10.0)
+
+    # Halved to 0.5/s, no token for 10s, then one every 2s
+    bucket = pacer.rate_limiter.bucket_for(HOST)
+    clock.now += 11.9
+    assert not bucket.try_acquire()
+    clock.now += 0.1
+    assert bucket.try_acquire()
+
+
+async def test_successes_recover_additively_up_to_max_rate(clock: _Clock) -> None:
+    pacer = _pacer(rate=1.0, max_rate=2.0)
+
+    await pacer.record(URL, 200)
+    assert _rate(pacer) == 1.1
+
+    for _ in range(30):
+        await pacer.record(URL, 200)
+    assert _rate(pacer) == 2.0
+
+
+async def test_much_slower_response_holds_the_rate(clock: _Clock) -> None:
+    pacer = _pacer(rate=1.0, max_rate=2.0)
+
+    await pacer.record(URL, 200, latency=0.1)
+    await pacer.record(URL, 200, latency=1.0)
+
+    assert _rate(pacer) == 1.1
+
+
+async def test_learned_rate_is_saved_and_restored(clock: _Clock) -> None:
+    cache = _Cache()
+    pacer = _pacer(cache)
+    await pacer.record(URL, 429)
+
+    assert cache.data[f"pacing:rate:{HOST}"]["rate"] == 2.0
+    assert cache.ttls[f"pacing:rate:{HOST}"] == pacing._SAVED_RATE_TTL
+
+    restarted = _pacer(cache)
+    assert _rate(restarted) == 4.0
+    await restarted.acquire(URL)
+    assert _rate(restarted) == 2.0
+
+
+@pytest.mark.parametrize(("stored", "restored"), [(100.0, 4.0), (0.001, 0.05)])
+async def test_restored_rate_is_clamped(
+    clock: _Clock, stored: float, restored: float
+) -> None:
+    cache = _Cache()
+    cache.data[f"pacing:rate:{HOST}"] = {"rate": stored}
+    pacer = _pacer(cache)
+
+    await pacer.acquire(URL)
+
+    assert _rate(pacer) == restored
+
+
+class _Server:
+    """Answers 429 with `retry_after` until `throttled` requests were made."""
+
+    def __init__(self, retry_after: str, throttled: int = 1) -> None:
+        self.retry_after = retry_after
+        self.throttled = throttled
+        self.requests = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if self.requests <= self.throttled:
+            return httpx.Response(429, headers={"Retry-After": self.retry_after})
+        return httpx.Response(200, content=b"<html></html>")
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Backoff sleeps of the adapter (not actually waited)."""
+    slept: list[float] = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(seconds: float) -> None:
+        slept.append(seconds)
+        await real_sleep(0)
+
+    monkeypatch.setattr(scrapy_adapter.asyncio, "sleep", fake_sleep)
+    return slept
+
+
+def _adapter(client: httpx.AsyncClient) -> ScrapyAdapter:
+    plugin = load_yaml_plugin(ROOT / "plugins" / "filmpalast.to.yaml")
+    return ScrapyAdapter(
+        plugin=plugin,
+        http_client=client,
+        cache=None,
+        delay_seconds=0.0,
+        max_retries=3,
+        retry_backoff_base=2.0,
+    )
+
+
+async def test_429_is_retried_after_retry_after(sleeps: list[float]) -> None:
+    server = _Server(retry_after="5")
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as client:
+        page = await _adapter(client)._fetch_with_retries(URL, None, None)
+
+    assert page is not None and page.status_code == 200
+    assert server.requests == 2
+    # Retry-After is a floor for the exponential backoff (1s)
+    assert sleeps == [5.0]
+
+
+async def test_429_with_too_long_retry_after_is_not_retried(
+    sleeps: list[float],
+) -> None:
+    too_long = scrapy_adapter._MAX_RETRY_AFTER_SECONDS + 1
+    server = _Server(retry_after=str(int(too_long)))
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as client:
+        page = await _adapter(client)._fetch_with_retries(URL, None, None)
+
+    assert page is None
+    assert server.requests == 1
+    assert sleeps == []
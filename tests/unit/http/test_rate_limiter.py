@@ -0,0 +1,141 @@
+"""TokenBucket/HostRateLimiter: refill, burst cap and sharing between users."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+
+from scavengarr.adapters.scraping import ScrapyAdapter
+from scavengarr.infrastructure.http import HostRateLimiter, TokenBucket, rate_limiter
+from scavengarr.infrastructure.plugins.loader import load_yaml_plugin
+from scavengarr.infrastructure.validation import HttpLinkValidator
+
+ROOT = Path(__file__).resolve().parents[3]
+
+
+class _Clock:
+    """Stands in for the `time` module of rate_limiter."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def waits(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Rate-limit sleeps (recorded, not actually waited)."""
+    slept: list[float] = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(seconds: float) -> None:
+        slept.append(seconds)
+        await real_sleep(0)
+
+    monkeypatch.setattr(rate_limiter.asyncio, "sleep", fake_sleep)
+    return slept
+
+
+def test_bucket_refills_at_rate(clock: _Clock) -> None:
+    bucket = TokenBucket(rate=2.0)
+
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+    clock.now += 0.4
+    assert not bucket.try_acquire()
+    clock.now += 0.1
+    assert bucket.try_acquire()
+
+
+def test_idle_bucket_holds_at_most_burst_tokens(clock: _Clock) -> None:
+    bucket = TokenBucket(rate=1.0, burst=3)
+
+    clock.now += 100.0
+    taken = 0
+    while bucket.try_acquire():
+        taken += 1
+
+    assert taken == 3
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_spaced_out_at_rate(
+    clock: _Clock, waits: list[float]
+) -> None:
+    bucket = TokenBucket(rate=2.0, burst=2)
+
+    for _ in range(5):
+        await bucket.acquire()
+
+    # Two burst tokens, then one reserved slot every 0.5s
+    assert waits == [0.5, 1.0, 1.5]
+
+
+def test_unconfigured_hosts_are_not_limited(clock: _Clock) -> None:
+    limiter = HostRateLimiter()
+
+    assert all(limiter.try_acquire("https://free.example/") for _ in range(10))
+    assert limiter.bucket_for("free.example") is None
+
+
+def _adapter(client: httpx.AsyncClient, limiter: HostRateLimiter) -> ScrapyAdapter:
+    plugin = load_yaml_plugin(ROOT / "plugins" / "filmpalast.to.yaml")
+    return ScrapyAdapter(
+        plugin=plugin, http_client=client, cache=None, rate_limiter=limiter
+    )
+
+
+def test_adapters_of_one_host_share_its_bucket(clock: _Clock) -> None:
+    limiter = HostRateLimiter()
+    client = httpx.AsyncClient()
+    first, second = _adapter(client, limiter), _adapter(client, limiter)
+    url = "https://filmpalast.to/stream/the-matrix"
+
+    assert first.rate_limiter.bucket_for("filmpalast.to") is (
+        second.rate_limiter.bucket_for("filmpalast.to")
+    )
+    assert first.rate_limiter.try_acquire(url)
+    assert not second.rate_limiter.try_acquire(url)
+
+    # delay_seconds: 2.0
+    clock.now += 2.0
+    assert second.rate_limiter.try_acquire(url)
+
+
+@pytest.mark.asyncio
+async def test_link_validator_waits_for_the_shared_limit(
+    clock: _Clock, waits: list[float]
+) -> None:
+    limiter = HostRateLimiter()
+    limiter.configure("hoster.example", rate=1.0)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200)
+
+    # A page request (e.g. by an adapter) already took the host's token
+    assert limiter.try_acquire("https://hoster.example/")
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        validator = HttpLinkValidator(
+            http_client=client, max_concurrent=1, rate_limiter=limiter
+        )
+        verdicts = await validator.validate_batch(
+            ["https://hoster.example/a", "https://hoster.example/b"]
+        )
+
+    assert verdicts == {
+        "https://hoster.example/a": True,
+        "https://hoster.example/b": True,
+    }
+    assert waits == [1.0, 2.0]
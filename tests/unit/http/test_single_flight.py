@@ -0,0 +1,131 @@
+"""SingleFlight: coalescing of concurrent calls and cancellation of waiters."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from scavengarr.infrastructure.http import SingleFlight
+
+pytestmark = pytest.mark.asyncio
+
+
+class _Upstream:
+    """Call counted per start; finishes when `release` is set."""
+
+    def __init__(self, result: object = "page") -> None:
+        self.result = result
+        self.release = asyncio.Event()
+        self.started = 0
+        self.cancelled = 0
+
+    async def __call__(self) -> object:
+        self.started += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+async def _start(flight: SingleFlight, upstream: _Upstream, n: int, key="k"):
+    """Start `n` callers of `key` and let them all join the flight."""
+    callers = [asyncio.create_task(flight.run(key, upstream)) for _ in range(n)]
+    await asyncio.sleep(0)
+    return callers
+
+
+async def test_concurrent_calls_share_one_upstream_call() -> None:
+    flight = SingleFlight()
+    upstream = _Upstream()
+
+    callers = await _start(flight, upstream, 5)
+    upstream.release.set()
+    results = await asyncio.gather(*callers)
+
+    assert results == ["page"] * 5
+    assert upstream.started == 1
+    assert flight.stats() == {
+        "calls": 5,
+        "coalesced": 4,
+        "upstream": 1,
+        "in_flight": 0,
+    }
+
+
+async def test_different_keys_are_not_coalesced() -> None:
+    flight = SingleFlight()
+    upstream = _Upstream()
+
+    callers = [
+        asyncio.create_task(flight.run(key, upstream)) for key in ("a", "b", "a")
+    ]
+    await asyncio.sleep(0)
+    upstream.release.set()
+    await asyncio.gather(*callers)
+
+    assert upstream.started == 2
+    assert flight.stats()["coalesced"] == 1
+
+
+async def test_exception_is_shared_by_every_waiter() -> None:
+    flight = SingleFlight()
+    upstream = _Upstream(result=RuntimeError("boom"))
+
+    callers = await _start(flight, upstream, 3)
+    upstream.release.set()
+    results = await asyncio.gather(*callers, return_exceptions=True)
+
+    assert [type(r) for r in results] == [RuntimeError] * 3
+    assert upstream.started == 1
+
+
+async def test_finished_call_is_not_cached() -> None:
+    flight = SingleFlight()
+    upstream = _Upstream()
+    upstream.release.set()
+
+    await flight.run("k", upstream)
+    await flight.run("k", upstream)
+
+    assert upstream.started == 2
+    assert flight.stats()["coalesced"] == 0
+
+
+async def test_cancelling_one_waiter_keeps_the_shared_call() -> None:
+    flight = SingleFlight()
+    upstream = _Upstream()
+
+    first, *others = await _start(flight, upstream, 3)
+    first.cancel()
+    await asyncio.sleep(0)
+    upstream.release.set()
+    results = await asyncio.gather(*others)
+
+    assert first.cancelled()
+    assert results == ["page", "page"]
+    assert upstream.started == 1
+    assert upstream.cancelled == 0
+
+
+async def test_cancelling_every_waiter_cancels_the_shared_call() -> None:
+    flight = SingleFlight()
+    upstream = _Upstream()
+
+    callers = await _start(flight, upstream, 3)
+    for caller in callers:
+        caller.cancel()
+    await asyncio.gather(*callers, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert upstream.cancelled == 1
+    assert flight.stats()["in_flight"] == 0
+
+    # The next caller starts a new call instead of joining the cancelled one
+    upstream.release.set()
+    assert await flight.run("k", upstream) == "page"
+    assert upstream.started == 2
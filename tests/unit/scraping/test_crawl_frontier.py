@@ -0,0 +1,168 @@
+"""The crawl frontier: bounded parallel fetches, document order, early close."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from pathlib import Path
+
+import httpx
+import pytest
+
+from scavengarr.adapters.scraping import CrawlContext, ScrapyAdapter
+from scavengarr.adapters.scraping.scrapy_adapter import _CrawlRequest
+from scavengarr.infrastructure.plugins.loader import load_yaml_plugin
+
+pytestmark = pytest.mark.asyncio
+
+ROOT = Path(__file__).resolve().parents[3]
+BASE_URL = "https://filmpalast.to"
+SEARCH_URL = f"{BASE_URL}/search/title/matrix"
+
+
+def _search_page(slugs: list[str]) -> bytes:
+    links = "".join(
+        f'<article><h2 class="bgDark">{slug}</h2>'
+        f'<a href="/stream/{slug}">{slug}</a></article>'
+        for slug in slugs
+    )
+    return f"<html><body>{links}</body></html>".encode()
+
+
+def _detail_page(slug: str) -> bytes:
+    return (
+        f'<html><body><h2 class="bgDark">{slug}</h2>'
+        f'<span id="release_text">{slug}.1080p</span>'
+        '<div id="grap-stream-list"><ul class="currentStreamLinks"><li>'
+        f'<p class="hostName">hoster</p>'
+        f'<a class="button iconPlay" href="https://hoster.example/{slug}">play</a>'
+        "</li></ul></div></body></html>"
+    ).encode()
+
+
+class _Site:
+    """Fake indexer: a search page linking `slugs`, one detail page per slug."""
+
+    def __init__(self, slugs: list[str], delays: dict[str, float] | None = None):
+        self.slugs = slugs
+        self.delays = delays or {}
+        self.requests: Counter[str] = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled = 0
+        self.release = asyncio.Event()
+        self.hang = False
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.requests[path] += 1
+        if path.startswith("/search/"):
+            return httpx.Response(200, content=_search_page(self.slugs))
+
+        slug = path.rsplit("/", 1)[-1]
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.hang:
+                await self.release.wait()
+            await asyncio.sleep(self.delays.get(slug, 0.01))
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+        return httpx.Response(200, content=_detail_page(slug))
+
+
+def _adapter(client: httpx.AsyncClient, max_concurrency: int) -> ScrapyAdapter:
+    plugin = load_yaml_plugin(ROOT / "plugins" / "filmpalast.to.yaml")
+    return ScrapyAdapter(
+        plugin=plugin,
+        http_client=client,
+        cache=None,
+        delay_seconds=0.0,
+        max_concurrency=max_concurrency,
+    )
+
+
+def _start() -> _CrawlRequest:
+    return _CrawlRequest(stage_name="search_results", url=SEARCH_URL, depth=0, order=())
+
+
+async def test_siblings_are_fetched_in_parallel_up_to_max_concurrency() -> None:
+    site = _Site([f"movie-{i}" for i in range(8)])
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(site)) as client:
+        results = await _adapter(client, max_concurrency=3)._crawl(
+            _start(), CrawlContext()
+        )
+
+    assert len(results["movie_detail"]) == 8
+    assert site.max_in_flight == 3
+
+
+async def test_crawl_returns_items_in_document_order() -> None:
+    slugs = [f"movie-{i}" for i in range(5)]
+    # Later links finish first
+    site = _Site(slugs, delays={slug: 0.01 * (5 - i) for i, slug in enumerate(slugs)})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(site)) as client:
+        results = await _adapter(client, max_concurrency=5)._crawl(
+            _start(), CrawlContext()
+        )
+
+    assert [item["title"] for item in results["movie_detail"]] == slugs
+
+
+async def test_a_url_linked_twice_is_visited_once() -> None:
+    site = _Site(["movie-a", "movie-b", "movie-a"])
+    context = CrawlContext()
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(site)) as client:
+        results = await _adapter(client, max_concurrency=3)._crawl(_start(), context)
+
+    assert site.requests["/stream/movie-a"] == 1
+    assert site.requests["/stream/movie-b"] == 1
+    assert [item["title"] for item in results["movie_detail"]] == [
+        "movie-a",
+        "movie-b",
+    ]
+    assert f"{BASE_URL}/stream/movie-a" in context.visited_urls
+
+
+async def test_closing_the_stream_early_cancels_in_flight_fetches() -> None:
+    site = _Site([f"movie-{i}" for i in range(6)])
+    site.hang = True
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(site)) as client:
+        stream = _adapter(client, max_concurrency=3)._iter_crawl(
+            _start(), CrawlContext()
+        )
+        first = await anext(stream)
+        while site.in_flight < 3:
+            await asyncio.sleep(0)
+
+        await stream.aclose()
+
+    assert first.stage_name == "search_results"
+    assert site.cancelled == 3
+    assert site.in_flight == 0
+    assert sum(site.requests.values()) == 4  # search page + 3 detail pages
+
+
+@pytest.mark.parametrize(
+    ("max_links", "item_budget", "fetched"),
+    [(None, None, 10), (None, 25, 25), (5, 25, 5)],
+)
+async def test_links_followed_per_page(
+    max_links: int | None, item_budget: int | None, fetched: int
+) -> None:
+    # Unset max_links: 10, or the result budget if larger
+    site = _Site([f"movie-{i}" for i in range(30)])
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(site)) as client:
+        adapter = _adapter(client, max_concurrency=5)
+        adapter.stages["search_results"].stage.max_links = max_links
+        await adapter._crawl(_start(), CrawlContext(item_budget=item_budget))
+
+    assert sum(site.requests.values()) == 1 + fetched
@@ -0,0 +1,184 @@
+"""Reading response bodies: max_response_bytes truncation and early stop."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+from scavengarr.adapters.scraping import CrawlContext, ScrapyAdapter
+from scavengarr.adapters.scraping.scrapy_adapter import StageScraper
+from scavengarr.adapters.scraping.selectors import LxmlBackend, SoupBackend
+from scavengarr.infrastructure.plugins.loader import load_yaml_plugin
+
+ROOT = Path(__file__).resolve().parents[3]
+PAGES_DIR = ROOT / "tests" / "fixtures" / "pages"
+PLUGIN_PATH = ROOT / "plugins" / "filmpalast.to.yaml"
+BASE_URL = "https://filmpalast.to"
+URL = f"{BASE_URL}/stream/the-matrix"
+
+_COMMENT = (
+    '<div class="comment"><p>Kommentar <b>Text</b> <span>s</span> '
+    '<a href="/user/x">@x</a></p></div>\n'
+)
+
+
+def _detail_page(target_kb: int = 200) -> bytes:
+    """The detail fixture, its comment section padded to `target_kb`."""
+    page = (PAGES_DIR / "filmpalast_detail.html").read_text(encoding="utf-8")
+    head, marker, tail = page.partition("<h3>Kommentare</h3>")
+    filler = _COMMENT * (target_kb * 1024 // len(_COMMENT))
+    return (head + marker + filler + tail).encode("utf-8")
+
+
+class _Server:
+    """Serves `page` in `chunk_size` chunks, counting the chunks read."""
+
+    def __init__(self, page: bytes, chunk_size: int = 4096) -> None:
+        self.page = page
+        self.chunk_size = chunk_size
+        self.chunks_read = 0
+
+    async def _body(self) -> AsyncIterator[bytes]:
+        for start in range(0, len(self.page), self.chunk_size):
+            self.chunks_read += 1
+            yield self.page[start : start + self.chunk_size]
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            headers={"Content-Type": "text/html; charset=utf-8"},
+            content=self._body(),
+        )
+
+
+class _Cache:
+    """In-memory CachePort."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+
+    async def get(self, key: str) -> Any:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: Any, *, ttl: int | None = None) -> None:
+        self.data[key] = value
+
+
+def _adapter(
+    client: httpx.AsyncClient,
+    max_response_bytes: int | None = None,
+    cache: _Cache | None = None,
+) -> ScrapyAdapter:
+    plugin = load_yaml_plugin(PLUGIN_PATH)
+    if max_response_bytes is not None:
+        plugin.scraping.max_response_bytes = max_response_bytes
+    return ScrapyAdapter(
+        plugin=plugin, http_client=client, cache=cache, delay_seconds=0.0
+    )
+
+
+@pytest.mark.asyncio
+async def test_body_is_cut_at_max_response_bytes() -> None:
+    server = _Server(_detail_page(), chunk_size=1024)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as client:
+        fetched = await _adapter(client, max_response_bytes=8192)._fetch_response(URL)
+
+    assert fetched.truncated
+    assert len(fetched.content) == 8192
+    assert server.chunks_read == 9  # the chunk crossing the limit, no more
+
+
+@pytest.mark.asyncio
+async def test_early_stop_extracts_what_a_full_read_does() -> None:
+    page = _detail_page()
+    server = _Server(page)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as client:
+        adapter = _adapter(client)
+        stage = adapter.stages["movie_detail"]
+        fetched = await adapter._fetch_response(URL, stage=stage)
+
+    assert stage.early_stop
+    assert fetched.extraction is not None
+    assert not fetched.truncated
+    assert len(fetched.content) < len(page) // 4
+    assert server.chunks_read < len(page) // server.chunk_size // 4
+    unscoped = StageScraper(stage.stage, BASE_URL, LxmlBackend(), partial_parse=False)
+    assert fetched.extraction == unscoped.extract_page(page, "utf-8", URL, BASE_URL)
+
+
+# Pages whose prefixes must never early-stop with another result
+_PREFIX_PAGES = {
+    **{path.name: path.read_bytes() for path in sorted(PAGES_DIR.glob("*.html"))},
+    "closed_by_ancestor": (
+        b'<html><body><h2 class="bgDark">T</h2>'
+        b'<p><span id="release_text">R</p><p>later</p></span>'
+        b'<span itemprop="description">D</span>'
+        b'<div id="grap-stream-list"><ul class="currentStreamLinks"><li>'
+        b'<a class="button" href="https://hoster.example/a">a</a>'
+        b"</li></ul></div></body></html>"
+    ),
+    "unclosed_container_in_cell": (
+        b'<html><body><h2 class="bgDark">T</h2><span id="release_text">R</span>'
+        b'<span itemprop="description">D</span>'
+        b'<table><tr><td><div id="grap-stream-list">'
+        b'<ul class="currentStreamLinks"><li>'
+        b'<a class="button" href="https://hoster.example/in">in</a>'
+        b"</li></ul></td></tr></table>"
+        b'<ul class="currentStreamLinks"><li>'
+        b'<a class="button" href="https://hoster.example/out">out</a>'
+        b"</li></ul></div></body></html>"
+    ),
+}
+
+
+@pytest.mark.parametrize("backend_cls", [LxmlBackend, SoupBackend])
+@pytest.mark.parametrize("name", list(_PREFIX_PAGES))
+def test_no_prefix_early_stops_with_another_result(name: str, backend_cls) -> None:
+    plugin = load_yaml_plugin(PLUGIN_PATH)
+    stage_config = next(s for s in plugin.scraping.stages if s.name == "movie_detail")
+    stage = StageScraper(stage_config, BASE_URL, backend_cls())
+    unscoped = StageScraper(stage_config, BASE_URL, backend_cls(), partial_parse=False)
+    page = _PREFIX_PAGES[name]
+    full = unscoped.extract_page(page, "utf-8", URL, BASE_URL)
+
+    for cut in range(1, len(page) + 1, 7):
+        prefix = stage.extract_prefix(page[:cut], "utf-8", URL, BASE_URL)
+        assert prefix is None or prefix == full, f"cut at {cut}"
+
+
+@pytest.mark.asyncio
+async def test_truncated_pages_are_not_cached() -> None:
+    cache = _Cache()
+
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(_Server(_detail_page()))
+    ) as client:
+        adapter = _adapter(client, max_response_bytes=8192, cache=cache)
+        page = await adapter._load_page(
+            adapter.stages["movie_detail"], URL, CrawlContext()
+        )
+
+    assert page is not None
+    assert cache.data == {}
+
+
+@pytest.mark.asyncio
+async def test_early_stopped_pages_are_cached_like_full_reads() -> None:
+    cache = _Cache()
+    server = _Server(_detail_page())
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as client:
+        adapter = _adapter(client, cache=cache)
+        stage = adapter.stages["movie_detail"]
+        page = await adapter._load_page(stage, URL, CrawlContext())
+        cached = await adapter.stage_cache.get(stage.name, URL)
+
+    assert server.chunks_read < len(server.page) // server.chunk_size
+    assert cached is not None
+    assert cached.items == page.items
@@ -0,0 +1,114 @@
+"""Execution plans are compiled once per plugin; searches keep their own state."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+
+from scavengarr.adapters.scraping import ScrapyAdapter, scrapy_adapter
+from scavengarr.infrastructure.plugins.loader import load_yaml_plugin
+from scavengarr.infrastructure.torznab.httpx_scrapy_engine import (
+    HttpxScrapySearchEngine,
+)
+
+ROOT = Path(__file__).resolve().parents[3]
+PLUGIN_PATH = ROOT / "plugins" / "filmpalast.to.yaml"
+
+
+@pytest.fixture
+def compiled(monkeypatch) -> list[str]:
+    """Names of the plugins whose plan gets compiled."""
+    names: list[str] = []
+    compile_plan = scrapy_adapter.ExecutionPlan.compile
+
+    def spy(plugin):
+        names.append(plugin.name)
+        return compile_plan(plugin)
+
+    monkeypatch.setattr(scrapy_adapter.ExecutionPlan, "compile", spy)
+    return names
+
+
+def _engine(client: httpx.AsyncClient) -> HttpxScrapySearchEngine:
+    return HttpxScrapySearchEngine(http_client=client, cache=None)
+
+
+def test_plan_is_compiled_once_per_plugin(compiled: list[str]) -> None:
+    plugin = load_yaml_plugin(PLUGIN_PATH)
+    client = httpx.AsyncClient()
+
+    first = ScrapyAdapter(plugin=plugin, http_client=client, cache=None)
+    second = ScrapyAdapter(plugin=plugin, http_client=client, cache=None)
+
+    assert compiled == ["filmpalast"]
+    assert first.plan is second.plan
+    assert first.stages is second.stages
+
+
+def test_engine_reuses_the_adapter_until_the_plugin_is_reloaded(
+    compiled: list[str],
+) -> None:
+    plugin = load_yaml_plugin(PLUGIN_PATH)
+    engine = _engine(httpx.AsyncClient())
+
+    adapter = engine._adapter_for(plugin)
+    assert engine._adapter_for(plugin) is adapter
+    assert compiled == ["filmpalast"]
+
+    reloaded = load_yaml_plugin(PLUGIN_PATH)
+    assert engine._adapter_for(reloaded) is not adapter
+    assert engine._adapter_for(reloaded).plan is not adapter.plan
+    assert compiled == ["filmpalast", "filmpalast"]
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    """Search "q" links /stream/q-1, /stream/q-2 and /stream/shared."""
+    path = request.url.path
+    if path.startswith("/search/"):
+        query = path.rsplit("/", 1)[-1]
+        slugs = [f"{query}-1", f"{query}-2", "shared"]
+        body = "".join(
+            f'<h2 class="bgDark">{slug}</h2><a href="/stream/{slug}">{slug}</a>'
+            for slug in slugs
+        )
+    else:
+        slug = path.rsplit("/", 1)[-1]
+        body = (
+            f'<h2 class="bgDark">{slug}</h2>'
+            '<div id="grap-stream-list"><ul class="currentStreamLinks"><li>'
+            f'<a class="button" href="https://hoster.example/{slug}">play</a>'
+            "</li></ul></div>"
+        )
+    return httpx.Response(200, content=f"<html><body>{body}</body></html>".encode())
+
+
+async def _slow_handler(request: httpx.Request) -> httpx.Response:
+    await asyncio.sleep(0.01)  # keep the searches interleaved
+    return _handler(request)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_searches_on_one_adapter_keep_their_own_state() -> None:
+    plugin = load_yaml_plugin(PLUGIN_PATH)
+    plugin.scraping.delay_seconds = 0.0
+    transport = httpx.MockTransport(_slow_handler)
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        adapter = _engine(client)._adapter_for(plugin)
+        first, second, limited = await asyncio.gather(
+            adapter.scrape("alpha"),
+            adapter.scrape("beta"),
+            adapter.scrape("gamma", max_results=1),
+        )
+
+    def titles(results: dict) -> list[str]:
+        return [item["title"] for item in results["movie_detail"]]
+
+    # Each search visits the shared page and keeps its own item budget
+    assert titles(first) == ["alpha-1", "alpha-2", "shared"]
+    assert titles(second) == ["beta-1", "beta-2", "shared"]
+    assert titles(limited)[0] == "gamma-1"
+    assert "alpha-1" not in titles(limited)
@@ -0,0 +1,143 @@
+"""ScrapyAdapter._send_hedged: duplicate requests for slow fetches."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+
+from scavengarr.adapters.scraping import ScrapyAdapter
+from scavengarr.infrastructure.http import HostCircuitBreakers, RequestHedger
+from scavengarr.infrastructure.plugins.loader import load_yaml_plugin
+
+pytestmark = pytest.mark.asyncio
+
+ROOT = Path(__file__).resolve().parents[3]
+URL = "https://filmpalast.to/stream/the-matrix"
+
+# Past fetches took 10ms, so a fetch is hedged after 10ms
+_LATENCY = 0.01
+
+
+class _Server:
+    """Answers the n-th request after delays[n]; requests in `fail` fail."""
+
+    def __init__(self, *delays: float, fail: tuple[int, ...] = ()) -> None:
+        self.delays = list(delays)
+        self.fail = fail
+        self.requests = 0
+        self.cancelled: list[int] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        n = self.requests
+        self.requests += 1
+        try:
+            await asyncio.sleep(self.delays[n])
+        except asyncio.CancelledError:
+            self.cancelled.append(n)
+            raise
+        if n in self.fail:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, content=f"request {n}".encode())
+
+
+def _adapter(
+    client: httpx.AsyncClient,
+    delay_seconds: float = 0.0,
+    circuit_breakers: HostCircuitBreakers | None = None,
+) -> ScrapyAdapter:
+    plugin = load_yaml_plugin(ROOT / "plugins" / "filmpalast.to.yaml")
+    plugin.scraping.hedge_percentile = 0.9
+    hedger = RequestHedger()
+    for _ in range(20):
+        hedger.observe(URL, _LATENCY)
+    return ScrapyAdapter(
+        plugin=plugin,
+        http_client=client,
+        cache=None,
+        delay_seconds=delay_seconds,
+        circuit_breakers=circuit_breakers,
+        hedger=hedger,
+    )
+
+
+def _counters(adapter: ScrapyAdapter) -> dict[str, int]:
+    stats = adapter.hedger.stats()["filmpalast.to"]
+    return {key: stats[key] for key in ("hedged", "hedge_wins", "budget_skipped")}
+
+
+async def test_slow_request_is_hedged_and_the_loser_cancelled() -> None:
+    server = _Server(1.0, 0.0)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as client:
+        adapter = _adapter(client)
+        page = await adapter._send_hedged(URL, None, None)
+
+    assert page.content == b"request 1"
+    assert server.cancelled == [0]
+    assert _counters(adapter) == {"hedged": 1, "hedge_wins": 1, "budget_skipped": 0}
+
+
+async def test_fast_request_is_not_hedged() -> None:
+    server = _Server(0.0)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as client:
+        adapter = _adapter(client)
+        page = await adapter._send_hedged(URL, None, None)
+
+    assert page.content == b"request 0"
+    assert server.requests == 1
+    assert _counters(adapter)["hedged"] == 0
+
+
+async def test_no_hedge_unless_the_circuit_is_closed() -> None:
+    server = _Server(0.05)
+    breakers = HostCircuitBreakers(failure_threshold=1, open_seconds=0)
+    breakers.record(URL, success=False)
+    assert breakers.breaker(URL).state == "half_open"
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as client:
+        adapter = _adapter(client, circuit_breakers=breakers)
+        page = await adapter._send_hedged(URL, None, None)
+
+    assert page.content == b"request 0"
+    assert server.requests == 1
+    assert _counters(adapter)["hedged"] == 0
+
+
+async def test_no_hedge_without_a_spare_rate_limit_token() -> None:
+    server = _Server(0.05)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as client:
+        adapter = _adapter(client, delay_seconds=1.0)
+        while adapter.rate_limiter.try_acquire(URL):
+            pass
+        page = await adapter._send_hedged(URL, None, None)
+
+    assert page.content == b"request 0"
+    assert server.requests == 1
+    assert _counters(adapter) == {"hedged": 0, "hedge_wins": 0, "budget_skipped": 1}
+
+
+async def test_slow_primary_wins_when_the_hedge_fails() -> None:
+    server = _Server(0.05, 0.0, fail=(1,))
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as client:
+        adapter = _adapter(client)
+        page = await adapter._send_hedged(URL, None, None)
+
+    assert page.content == b"request 0"
+    assert _counters(adapter) == {"hedged": 1, "hedge_wins": 0, "budget_skipped": 0}
+
+
+async def test_error_is_raised_when_both_requests_fail() -> None:
+    server = _Server(0.05, 0.0, fail=(0, 1))
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as client:
+        adapter = _adapter(client)
+        with pytest.raises(httpx.ConnectError):
+            await adapter._send_hedged(URL, None, None)
+
+    assert server.requests == 2
@@ -0,0 +1,80 @@
+"""Concurrent searches share page fetches through the adapter's SingleFlight."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from pathlib import Path
+
+import httpx
+import pytest
+
+from scavengarr.adapters.scraping import ScrapyAdapter
+from scavengarr.infrastructure.http import SingleFlight
+from scavengarr.infrastructure.plugins.loader import load_yaml_plugin
+
+pytestmark = pytest.mark.asyncio
+
+ROOT = Path(__file__).resolve().parents[3]
+PAGES_DIR = ROOT / "tests" / "fixtures" / "pages"
+
+
+def _transport(requests: Counter[str]) -> httpx.MockTransport:
+    search = (PAGES_DIR / "filmpalast_search.html").read_bytes()
+    detail = (PAGES_DIR / "filmpalast_detail.html").read_bytes()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests[request.url.path] += 1
+        await asyncio.sleep(0.05)  # keep the fetches overlapping
+        if request.url.path.startswith("/search/"):
+            return httpx.Response(200, content=search)
+        return httpx.Response(200, content=detail)
+
+    return httpx.MockTransport(handler)
+
+
+def _adapter(
+    client: httpx.AsyncClient, flight: SingleFlight, max_concurrency: int = 5
+) -> ScrapyAdapter:
+    plugin = load_yaml_plugin(ROOT / "plugins" / "filmpalast.to.yaml")
+    return ScrapyAdapter(
+        plugin=plugin,
+        http_client=client,
+        cache=None,
+        delay_seconds=0.0,
+        max_concurrency=max_concurrency,
+        single_flight=flight,
+    )
+
+
+async def test_concurrent_searches_fetch_each_page_once() -> None:
+    requests: Counter[str] = Counter()
+    flight = SingleFlight()
+
+    async with httpx.AsyncClient(transport=_transport(requests)) as client:
+        first, second = await asyncio.gather(
+            _adapter(client, flight).scrape("matrix"),
+            _adapter(client, flight).scrape("matrix"),
+        )
+
+    assert first == second
+    assert first["movie_detail"]
+    assert set(requests.values()) == {1}
+    stats = flight.stats()
+    assert stats["upstream"] == len(requests)
+    assert stats["coalesced"] == len(requests)
+
+
+async def test_each_search_keeps_its_own_item_budget() -> None:
+    requests: Counter[str] = Counter()
+    flight = SingleFlight()
+
+    async with httpx.AsyncClient(transport=_transport(requests)) as client:
+        # One worker: the budget is met before another detail page is taken
+        small, full = await asyncio.gather(
+            _adapter(client, flight, max_concurrency=1).scrape("matrix", max_results=1),
+            _adapter(client, flight).scrape("matrix"),
+        )
+
+    assert len(small["movie_detail"]) == 1
+    assert len(full["movie_detail"]) == 5
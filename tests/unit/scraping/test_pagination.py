@@ -0,0 +1,175 @@
+"""List-stage pagination: concurrent page ranges and "next page" links."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from pathlib import Path
+
+import httpx
+import pytest
+
+from scavengarr.adapters.scraping import CrawlContext, ScrapyAdapter
+from scavengarr.domain.plugins.schema import PaginationConfig
+from scavengarr.infrastructure.plugins.loader import load_yaml_plugin
+
+pytestmark = pytest.mark.asyncio
+
+ROOT = Path(__file__).resolve().parents[3]
+PAGE_PATH = "/search/title/matrix/page/"
+
+
+class _Site:
+    """Search result pages 2..: `missing` answer 404, `empty` have no results.
+
+    Page n answers after delays[n] (default: later pages answer first).
+    """
+
+    def __init__(
+        self,
+        *,
+        delays: dict[int, float] | None = None,
+        missing: tuple[int, ...] = (),
+        empty: tuple[int, ...] = (),
+    ) -> None:
+        self.delays = delays or {}
+        self.missing = missing
+        self.empty = empty
+        self.requests: Counter[int] = Counter()
+        self.cancelled: list[int] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        page = int(request.url.path.removeprefix(PAGE_PATH))
+        self.requests[page] += 1
+        try:
+            await asyncio.sleep(self.delays.get(page, 0.05 / page))
+        except asyncio.CancelledError:
+            self.cancelled.append(page)
+            raise
+        if page in self.missing:
+            return httpx.Response(404)
+        if page in self.empty:
+            return httpx.Response(200, content=b"<html><body></body></html>")
+        return httpx.Response(
+            200,
+            content=(
+                f'<html><body><h2 class="bgDark">page {page}</h2>'
+                f'<a href="/stream/movie-{page}">movie {page}</a>'
+                f'<a class="next" href="{PAGE_PATH}{page + 1}">next</a>'
+                "</body></html>"
+            ).encode(),
+        )
+
+
+def _adapter(
+    client: httpx.AsyncClient, pagination: PaginationConfig, terminal: bool = False
+) -> ScrapyAdapter:
+    plugin = load_yaml_plugin(ROOT / "plugins" / "filmpalast.to.yaml")
+    stage = next(s for s in plugin.scraping.stages if s.name == "search_results")
+    stage.pagination = pagination
+    if terminal:
+        stage.next_stage = None
+    return ScrapyAdapter(
+        plugin=plugin,
+        http_client=client,
+        cache=None,
+        delay_seconds=0.0,
+        max_retries=1,
+    )
+
+
+def _page_range(max_pages: int = 4) -> PaginationConfig:
+    return PaginationConfig(
+        enabled=True,
+        url_pattern="/search/title/{query}/page/{page}",
+        max_pages=max_pages,
+    )
+
+
+def _next_links(max_pages: int = 4) -> PaginationConfig:
+    return PaginationConfig(enabled=True, selector="a.next", max_pages=max_pages)
+
+
+def _context(item_budget: int | None = None) -> CrawlContext:
+    return CrawlContext(url_params={"query": "matrix"}, item_budget=item_budget)
+
+
+async def _paginate(
+    site: _Site,
+    pagination: PaginationConfig,
+    context: CrawlContext,
+    terminal: bool = False,
+    pending: int = 0,
+) -> list[str]:
+    """Titles of the pages after page 1, in the order they are returned."""
+    async with httpx.AsyncClient(transport=httpx.MockTransport(site)) as client:
+        adapter = _adapter(client, pagination, terminal)
+        stage = adapter.stages["search_results"]
+        pages = await adapter._handle_pagination(
+            stage, f"https://filmpalast.to{PAGE_PATH}2", context, pending=pending
+        )
+    return [page.items[0]["title"] for page in pages]
+
+
+async def test_page_range_keeps_page_order() -> None:
+    site = _Site()
+
+    titles = await _paginate(site, _page_range(), _context())
+
+    assert titles == ["page 2", "page 3", "page 4"]
+    assert set(site.requests) == {2, 3, 4}
+
+
+async def test_page_range_stops_at_the_item_budget() -> None:
+    # Page 1 brought one item; page 2 (slowest) meets the budget of two
+    site = _Site(delays={2: 0.05, 3: 0.2, 4: 0.2})
+
+    titles = await _paginate(
+        site, _page_range(), _context(item_budget=2), terminal=True, pending=1
+    )
+
+    assert titles == ["page 2"]
+    assert sorted(site.cancelled) == [3, 4]
+
+
+@pytest.mark.parametrize("site_kwargs", [{"missing": (3,)}, {"empty": (3,)}])
+async def test_page_range_ends_at_a_missing_page(site_kwargs: dict) -> None:
+    site = _Site(**site_kwargs)
+
+    titles = await _paginate(site, _page_range(), _context())
+
+    # Page 4 answered first, but comes after the gap: discarded
+    assert titles == ["page 2"]
+
+
+async def test_next_links_are_followed_in_order_up_to_max_pages() -> None:
+    site = _Site()
+
+    titles = await _paginate(site, _next_links(max_pages=4), _context())
+
+    assert titles == ["page 2", "page 3", "page 4"]
+    assert set(site.requests) == {2, 3, 4}
+
+
+async def test_next_links_stop_at_the_item_budget() -> None:
+    site = _Site()
+
+    titles = await _paginate(
+        site,
+        _next_links(max_pages=4),
+        _context(item_budget=3),
+        terminal=True,
+        pending=1,
+    )
+
+    assert titles == ["page 2", "page 3"]
+    assert set(site.requests) == {2, 3}
+
+
+async def test_next_links_stop_at_a_failed_page() -> None:
+    site = _Site(missing=(3,))
+
+    titles = await _paginate(site, _next_links(max_pages=5), _context())
+
+    assert titles == ["page 2"]
+    assert set(site.requests) == {2, 3}
@@ -0,0 +1,136 @@
+"""ParsePool kinds and the adapter's parse jobs in thread and process workers."""
+
+from __future__ import annotations
+
+import pickle
+import threading
+from pathlib import Path
+
+import httpx
+import pytest
+
+from scavengarr.adapters.scraping import ScrapyAdapter
+from scavengarr.adapters.scraping.scrapy_adapter import (
+    _worker_plans,
+    extract_in_worker,
+    get_plan,
+)
+from scavengarr.infrastructure.parsing import ParsePool
+from scavengarr.infrastructure.plugins.loader import load_yaml_plugin
+
+ROOT = Path(__file__).resolve().parents[3]
+PAGES_DIR = ROOT / "tests" / "fixtures" / "pages"
+PLUGIN_PATH = ROOT / "plugins" / "filmpalast.to.yaml"
+BASE_URL = "https://filmpalast.to"
+URL = f"{BASE_URL}/stream/the-matrix"
+
+
+def _thread_name() -> str:
+    return threading.current_thread().name
+
+
+@pytest.mark.asyncio
+async def test_thread_pool_runs_jobs_in_workers_until_closed() -> None:
+    pool = ParsePool("thread", max_workers=2)
+
+    assert (await pool.run(_thread_name)).startswith("scavengarr-parse")
+    stats = pool.stats()
+    assert (stats["kind"], stats["tasks"], stats["pending"]) == ("thread", 1, 0)
+
+    pool.close()
+    assert await pool.run(_thread_name) == threading.current_thread().name
+
+
+@pytest.mark.asyncio
+async def test_inline_pool_runs_jobs_on_the_event_loop() -> None:
+    pool = ParsePool("inline", max_workers=0)
+
+    assert await pool.run(_thread_name) == threading.current_thread().name
+    assert not pool.requires_pickling
+    assert pool.stats()["max_workers"] == 0
+
+
+def test_pool_needs_a_worker() -> None:
+    with pytest.raises(ValueError):
+        ParsePool("process", max_workers=0)
+
+
+def test_pickled_plugins_keep_the_plan_fingerprint() -> None:
+    plugin = load_yaml_plugin(PLUGIN_PATH)
+    fingerprint = get_plan(plugin).fingerprint
+    content = (PAGES_DIR / "filmpalast_detail.html").read_bytes()
+    _worker_plans.clear()
+
+    for _ in range(2):
+        copy = pickle.loads(pickle.dumps(plugin))
+        extract_in_worker(
+            copy, fingerprint, "movie_detail", "extract_page", content, None, URL
+        )
+
+    # Each job unpickles a new plugin object; the plan is compiled once
+    assert list(_worker_plans) == [fingerprint]
+    assert get_plan(copy).fingerprint == fingerprint
+
+
+@pytest.mark.asyncio
+async def test_process_pool_extracts_what_an_inline_parse_does() -> None:
+    plugin = load_yaml_plugin(PLUGIN_PATH)
+    plan = get_plan(plugin)
+    pool = ParsePool("process", max_workers=1)
+    assert pool.requires_pickling
+
+    try:
+        for name, stage_name in [
+            ("filmpalast_search.html", "search_results"),
+            ("filmpalast_detail.html", "movie_detail"),
+        ]:
+            content = (PAGES_DIR / name).read_bytes()
+            in_worker = await pool.run(
+                extract_in_worker,
+                plugin,
+                plan.fingerprint,
+                stage_name,
+                "extract_page",
+                content,
+                None,
+                URL,
+                BASE_URL,
+            )
+            inline = plan.stages[stage_name].extract_page(content, None, URL, BASE_URL)
+            assert in_worker == inline
+    finally:
+        pool.close()
+    assert pool.stats()["tasks"] == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("kind", ["thread", "process"])
+async def test_scrape_results_do_not_depend_on_the_pool(kind: str) -> None:
+    search = (PAGES_DIR / "filmpalast_search.html").read_bytes()
+    detail = (PAGES_DIR / "filmpalast_detail.html").read_bytes()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/search/"):
+            return httpx.Response(200, content=search)
+        return httpx.Response(200, content=detail)
+
+    async def scrape(pool: ParsePool | None) -> dict:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            adapter = ScrapyAdapter(
+                plugin=load_yaml_plugin(PLUGIN_PATH),
+                http_client=client,
+                cache=None,
+                delay_seconds=0.0,
+                parse_pool=pool,
+            )
+            return await adapter.scrape("matrix")
+
+    pool = ParsePool(kind, max_workers=2)
+    try:
+        pooled = await scrape(pool)
+    finally:
+        pool.close()
+
+    assert pooled["movie_detail"]
+    assert pooled == await scrape(None)
+    assert pool.stats()["tasks"] > 0
@@ -0,0 +1,100 @@
+"""Partial parsing must extract the same data as parsing the full page.
+
+Every page under tests/fixtures/pages, plus inline cases the byte scanner
+has to get right, goes through every stage of plugins/filmpalast.to.yaml
+with both backends, once with scraping.partial_parse and once without.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from scavengarr.adapters.scraping.scrapy_adapter import StageScraper
+from scavengarr.adapters.scraping.selectors import LxmlBackend, SoupBackend
+from scavengarr.infrastructure.plugins.loader import load_yaml_plugin
+
+ROOT = Path(__file__).resolve().parents[3]
+PAGES_DIR = ROOT / "tests" / "fixtures" / "pages"
+PLUGIN = load_yaml_plugin(ROOT / "plugins" / "filmpalast.to.yaml")
+
+_BODY = (
+    '<h2 class="bgDark">Real</h2><span id="release_text">R</span>'
+    '<article><a href="/stream/real">Real</a></article>'
+)
+_DECOY = '<h2 class="bgDark">Decoy</h2><a href="/stream/decoy">Decoy</a>'
+
+
+def _page(before: str) -> bytes:
+    return f"<html><body>{before}{_BODY}</body></html>".encode()
+
+
+INLINE_PAGES = {
+    "template": _page(f"<template>{_DECOY}</template>"),
+    "xmp": _page(f"<xmp>{_DECOY}</xmp>"),
+    "noembed": _page(f"<noembed>{_DECOY}</noembed>"),
+    "iframe": _page(f"<iframe>{_DECOY}</iframe>"),
+    "empty_iframe": _page('<iframe src="/player"></iframe>'),
+    "noframes": _page(f"<noframes>{_DECOY}</noframes>"),
+    "plaintext": _page(f"<plaintext>{_DECOY}"),
+    "textarea": _page(f"<textarea>{_DECOY}</textarea>"),
+    "vertical_tab_class": _page('<h2 class="x\x0bbgDark">V</h2>'),
+    "form_feed_class": _page('<h2 class="x\x0cbgDark">F</h2>'),
+    "svg_title": _page("<svg><title>icon</title></svg>"),
+    "svg_title_unclosed": _page("<svg><title>icon</svg>"),
+    "title_unclosed": _page("<title>x"),
+    "unclosed_script": _page("") + b'<script>var a = "<h2 class=bgDark>";',
+    "no_match": b"<html><body><p>nothing</p></body></html>",
+    # An ancestor's end tag closes the anchor before its own end tag
+    "closed_by_ancestor": _page('<p><span id="release_text">R</p><p>later</p></span>'),
+    "unclosed_container_in_cell": _page(
+        '<table><tr><td><div id="grap-stream-list">'
+        '<ul class="currentStreamLinks"><li><p class="hostName">in</p>'
+        '<a class="button iconPlay" href="https://hoster.example/in">in</a>'
+        "</li></ul></td></tr></table>"
+        '<ul class="currentStreamLinks"><li><p class="hostName">out</p>'
+        '<a class="button iconPlay" href="https://hoster.example/out">out</a>'
+        "</li></ul></div>"
+    ),
+}
+
+PAGES = {path.name: path.read_bytes() for path in sorted(PAGES_DIR.rglob("*.html"))}
+PAGES.update(INLINE_PAGES)
+
+
+@pytest.mark.parametrize("backend_cls", [LxmlBackend, SoupBackend])
+@pytest.mark.parametrize("stage", PLUGIN.scraping.stages, ids=lambda s: s.name)
+@pytest.mark.parametrize("name", list(PAGES))
+def test_partial_parse_extracts_what_a_full_parse_does(
+    name: str, stage, backend_cls
+) -> None:
+    base_url = str(PLUGIN.base_url)
+    extracted = {}
+    for partial in (False, True):
+        scraper = StageScraper(stage, base_url, backend_cls(), partial_parse=partial)
+        doc = scraper.parse(PAGES[name])
+        extracted[partial] = (
+            scraper.extract_data(doc),
+            scraper.extract_links(doc, base_url),
+        )
+
+    assert extracted[True] == extracted[False]
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "template",
+        "plaintext",
+        "no_match",
+        "closed_by_ancestor",
+        "unclosed_container_in_cell",
+    ],
+)
+def test_unscopable_pages_are_parsed_in_full(name: str) -> None:
+    stage = next(s for s in PLUGIN.scraping.stages if s.name == "movie_detail")
+    scraper = StageScraper(stage, str(PLUGIN.base_url), LxmlBackend())
+
+    assert scraper.scope is not None
+    assert scraper.scope.reduce(PAGES[name], "utf-8") is None
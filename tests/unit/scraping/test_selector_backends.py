@@ -0,0 +1,137 @@
+"""LxmlBackend and SoupBackend must extract the same data from the same page.
+
+Every page under tests/fixtures/pages is parsed by both backends; for each
+selector, select() / select_one() must match the same elements in the same
+order, with the same text and attribute values.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from scavengarr.adapters.scraping.selectors import (
+    LxmlBackend,
+    ParserBackend,
+    SoupBackend,
+)
+
+PAGES_DIR = Path(__file__).resolve().parents[2] / "fixtures" / "pages"
+
+# Selectors of plugins/filmpalast.to.yaml, then generic ones covering
+# descendant/child combinators, selector lists and attribute operators
+SELECTORS = [
+    "a[href*='/stream/']",
+    "h2.bgDark",
+    "span#release_text",
+    "span[itemprop='description']",
+    "div#grap-stream-list",
+    "ul.currentStreamLinks",
+    "li",
+    "p.hostName, p",
+    "a.button.iconPlay, a.button",
+    "title",
+    "head > title",
+    "meta[name]",
+    "a[href]",
+    "h1",
+    "h2 > a",
+    "article h2 a",
+    "ul > li a",
+    "div[id^='grap'] ul li a[data-player-url]",
+    "a[href$='.html']",
+    "span[class~='since']",
+    "table td",
+    "pre code",
+    "script",
+    "template",
+    "textarea",
+]
+
+ATTRIBUTES = ["href", "id", "title", "data-player-url", "onclick", "itemprop"]
+
+# "html.parser" is not an HTML5 tree builder (see the selectors module)
+KNOWN_DIFFERENCES = {
+    "malformed.html": "html.parser applies no implied end tags and keeps CDATA",
+}
+
+
+def _page_params() -> list[Any]:
+    params = []
+    for path in sorted(PAGES_DIR.rglob("*.html")):
+        name = path.relative_to(PAGES_DIR).as_posix()
+        reason = KNOWN_DIFFERENCES.get(name)
+        marks = [pytest.mark.xfail(reason=reason, strict=True)] if reason else []
+        params.append(pytest.param(path, id=name, marks=marks))
+    return params
+
+
+def _describe(backend: ParserBackend, node: Any) -> tuple[str, list[Any]] | None:
+    if node is None:
+        return None
+    return backend.text(node), [node.get(attr) for attr in ATTRIBUTES]
+
+
+def _extract(backend: ParserBackend, content: bytes) -> dict[str, Any]:
+    doc = backend.parse(content)
+    extracted = {}
+    for css in SELECTORS:
+        selector = backend.compile(css)
+        extracted[css] = {
+            "select": [_describe(backend, n) for n in backend.select(doc, selector)],
+            "select_one": _describe(backend, backend.select_one(doc, selector)),
+        }
+    return extracted
+
+
+@pytest.mark.parametrize("path", _page_params())
+def test_backends_extract_the_same_data(path: Path) -> None:
+    content = path.read_bytes()
+
+    lxml_result = _extract(LxmlBackend(), content)
+    soup_result = _extract(SoupBackend(), content)
+
+    for css in SELECTORS:
+        assert lxml_result[css] == soup_result[css], css
+
+
+@pytest.mark.parametrize("backend", [LxmlBackend(), SoupBackend()], ids=["lxml", "bs4"])
+def test_filmpalast_detail_fields(backend: ParserBackend) -> None:
+    doc = backend.parse((PAGES_DIR / "filmpalast_detail.html").read_bytes())
+
+    def first_text(css: str) -> str:
+        return backend.text(backend.select_one(doc, backend.compile(css)))
+
+    assert first_text("h2.bgDark") == "Matrix"
+    assert (
+        first_text("span#release_text")
+        == "The.Matrix.1999.German.DL.1080p.BluRay.x264-GROUP"
+    )
+    assert first_text("span[itemprop='description']").startswith("Der HackerNeowird")
+
+    players = backend.select(doc, backend.compile("a.button.iconPlay, a.button"))
+    assert [a.get("data-player-url") for a in players] == [
+        "https://voe.sx/e/abc123",
+        "https://streamtape.com/e/Xy9kLm",
+        None,
+        None,
+    ]
+
+
+@pytest.mark.parametrize("backend", [LxmlBackend(), SoupBackend()], ids=["lxml", "bs4"])
+def test_meta_charset_is_honoured(backend: ParserBackend) -> None:
+    doc = backend.parse((PAGES_DIR / "windows1252.html").read_bytes())
+
+    title = backend.select_one(doc, backend.compile("h2.bgDark"))
+
+    assert backend.text(title) == "Die fabelhafte Welt der Amélie"
+
+
+@pytest.mark.parametrize("backend", [LxmlBackend(), SoupBackend()], ids=["lxml", "bs4"])
+def test_empty_document_matches_nothing(backend: ParserBackend) -> None:
+    doc = backend.parse(b"")
+
+    assert backend.select(doc, backend.compile("a[href]")) == []
+    assert backend.select_one(doc, backend.compile("a[href]")) is None
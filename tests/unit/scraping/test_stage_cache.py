@@ -0,0 +1,261 @@
+"""Stage-output cache: hits, per-stage TTLs, revalidation of expired pages."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+from scavengarr.adapters.scraping import CrawlContext, ScrapyAdapter
+from scavengarr.infrastructure.http import HostCircuitBreakers
+from scavengarr.infrastructure.plugins.loader import load_yaml_plugin
+
+pytestmark = pytest.mark.asyncio
+
+ROOT = Path(__file__).resolve().parents[3]
+URL = "https://filmpalast.to/stream/the-matrix"
+LAST_MODIFIED = "Tue, 13 Oct 2026 08:00:00 GMT"
+
+
+class _Cache:
+    """In-memory CachePort."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+        self.ttls: dict[str, int | None] = {}
+
+    async def get(self, key: str) -> Any:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: Any, *, ttl: int | None = None) -> None:
+        self.data[key] = value
+        self.ttls[key] = ttl
+
+
+class _Site:
+    """A detail page titled `title` with ETag `etag`.
+
+    Answers 304 to a matching If-None-Match (with `etag` and a newer
+    Last-Modified), `status` instead of 200 if set.
+    """
+
+    def __init__(self, title: str = "v1", etag: str = '"v1"') -> None:
+        self.title = title
+        self.etag = etag
+        self.last_modified = LAST_MODIFIED
+        self.status: int | None = None
+        self.delay = 0.0
+        self.requests: list[httpx.Headers] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request.headers)
+        await asyncio.sleep(self.delay)
+        if self.status is not None:
+            return httpx.Response(self.status)
+        headers = {"ETag": self.etag, "Last-Modified": self.last_modified}
+        if request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304, headers=headers)
+        content = (
+            f'<html><body><h2 class="bgDark">{self.title}</h2>'
+            '<div id="grap-stream-list"><ul class="currentStreamLinks"><li>'
+            '<a class="button" href="https://hoster.example/a">play</a>'
+            "</li></ul></div></body></html>"
+        )
+        return httpx.Response(200, headers=headers, content=content.encode())
+
+
+def _adapter(
+    client: httpx.AsyncClient,
+    cache: _Cache,
+    breakers: HostCircuitBreakers | None = None,
+) -> ScrapyAdapter:
+    plugin = load_yaml_plugin(ROOT / "plugins" / "filmpalast.to.yaml")
+    return ScrapyAdapter(
+        plugin=plugin,
+        http_client=client,
+        cache=cache,
+        delay_seconds=0.0,
+        max_retries=1,
+        circuit_breakers=breakers,
+    )
+
+
+async def _load(adapter: ScrapyAdapter) -> Any:
+    return await adapter._load_page(adapter.stages["movie_detail"], URL, CrawlContext())
+
+
+async def _expire(adapter: ScrapyAdapter) -> None:
+    """Make the cached page stale (still kept for revalidation)."""
+    page = await adapter.stage_cache.get("movie_detail", URL)
+    page.fresh_until = 0.0
+    await adapter.stage_cache.set("movie_detail", URL, page, ttl=60)
+
+
+async def _stored(adapter: ScrapyAdapter) -> Any:
+    return await adapter.stage_cache.get("movie_detail", URL)
+
+
+def _search_site(requests: Counter[str]) -> httpx.MockTransport:
+    """Search page linking two detail pages (no validators)."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        requests[path] += 1
+        if path.startswith("/search/"):
+            body = "".join(
+                f'<h2 class="bgDark">{slug}</h2><a href="/stream/{slug}">{slug}</a>'
+                for slug in ("a", "b")
+            )
+        else:
+            body = (
+                f'<h2 class="bgDark">{path}</h2>'
+                '<div id="grap-stream-list"><ul class="currentStreamLinks"><li>'
+                f'<a class="button" href="https://hoster.example{path}">play</a>'
+                "</li></ul></div>"
+            )
+        return httpx.Response(200, content=f"<html><body>{body}</body></html>".encode())
+
+    return httpx.MockTransport(handler)
+
+
+async def _search_twice(cache: _Cache, search_ttl: int | None = None) -> Counter[str]:
+    """Requests per path of two identical searches sharing `cache`."""
+    requests: Counter[str] = Counter()
+    async with httpx.AsyncClient(transport=_search_site(requests)) as client:
+        for _ in range(2):
+            adapter = _adapter(client, cache)
+            adapter.stages["search_results"].stage.cache_ttl = search_ttl
+            results = await adapter.scrape("matrix")
+            assert len(results["movie_detail"]) == 2
+    return requests
+
+
+async def test_cache_hits_skip_the_fetch() -> None:
+    # Only movie_detail has a cache_ttl: the search page is fetched twice
+    requests = await _search_twice(_Cache())
+
+    assert requests == {
+        "/search/title/matrix": 2,
+        "/stream/a": 1,
+        "/stream/b": 1,
+    }
+
+
+async def test_cache_ttl_is_per_stage() -> None:
+    cache = _Cache()
+
+    requests = await _search_twice(cache, search_ttl=60)
+
+    assert set(requests.values()) == {1}
+    ttls = {key.split(":", 4)[-1]: ttl for key, ttl in cache.ttls.items()}
+    assert ttls == {
+        "search_results:https://filmpalast.to/search/title/matrix": 60,
+        "movie_detail:https://filmpalast.to/stream/a": 21600,
+        "movie_detail:https://filmpalast.to/stream/b": 21600,
+    }
+
+
+async def test_expired_pages_are_fetched_again() -> None:
+    requests = await _search_twice(_Cache(), search_ttl=0)
+
+    assert requests["/search/title/matrix"] == 2
+
+
+@pytest.mark.parametrize(("revalidate_ttl", "ttl"), [(None, 43200), (600, 22200)])
+async def test_pages_with_validators_are_kept_for_revalidation(
+    revalidate_ttl: int | None, ttl: int
+) -> None:
+    cache = _Cache()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_Site())) as client:
+        adapter = _adapter(client, cache)
+        adapter.stages["movie_detail"].stage.cache_revalidate_ttl = revalidate_ttl
+        await _load(adapter)
+
+    assert list(cache.ttls.values()) == [ttl]
+    stored = await _stored(adapter)
+    assert stored.fresh_until == pytest.approx(time.time() + 21600, abs=5)
+
+
+async def test_304_keeps_the_page_and_takes_the_new_validators() -> None:
+    site = _Site()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(site)) as client:
+        adapter = _adapter(client, _Cache())
+        await _load(adapter)
+        await _expire(adapter)
+        site.title = "changed"  # not sent: the server answers 304
+        site.last_modified = "Fri, 16 Oct 2026 08:00:00 GMT"
+
+        page = await _load(adapter)
+        stored = await _stored(adapter)
+
+    assert site.requests[1]["If-None-Match"] == '"v1"'
+    assert site.requests[1]["If-Modified-Since"] == LAST_MODIFIED
+    assert page.items[0]["title"] == "v1"
+    assert stored.items == page.items
+    assert stored.last_modified == "Fri, 16 Oct 2026 08:00:00 GMT"
+    assert stored.fresh_until > time.time()
+
+
+async def test_200_replaces_the_page() -> None:
+    site = _Site()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(site)) as client:
+        adapter = _adapter(client, _Cache())
+        await _load(adapter)
+        await _expire(adapter)
+        site.title, site.etag = "v2", '"v2"'
+
+        page = await _load(adapter)
+        stored = await _stored(adapter)
+
+    assert site.requests[1]["If-None-Match"] == '"v1"'
+    assert page.items[0]["title"] == "v2"
+    assert stored.items == page.items
+    assert stored.etag == '"v2"'
+
+
+async def test_stale_page_is_served_when_revalidation_fails() -> None:
+    site = _Site()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(site)) as client:
+        adapter = _adapter(client, _Cache())
+        await _load(adapter)
+        await _expire(adapter)
+        site.status = 503
+
+        page = await _load(adapter)
+
+    assert len(site.requests) == 2
+    assert page.items[0]["title"] == "v1"
+
+
+async def test_stale_page_is_served_while_the_circuit_is_open() -> None:
+    site = _Site()
+    breakers = HostCircuitBreakers(failure_threshold=1)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(site)) as client:
+        adapter = _adapter(client, _Cache(), breakers)
+        await _load(adapter)
+        await _expire(adapter)
+        breakers.record(URL, success=False)
+
+        page = await _load(adapter)
+
+    assert len(site.requests) == 1  # no revalidation attempt
+    assert page.items[0]["title"] == "v1"
+
+
+async def test_loads_during_a_pending_revalidation_share_it() -> None:
+    site = _Site()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(site)) as client:
+        adapter = _adapter(client, _Cache())
+        await _load(adapter)
+        await _expire(adapter)
+        site.delay = 0.05
+
+        pages = await asyncio.gather(_load(adapter), _load(adapter))
+
+    assert len(site.requests) == 2  # one conditional request for both
+    assert [page.items[0]["title"] for page in pages] == ["v1", "v1"]
@@ -0,0 +1,99 @@
+"""HttpLinkValidator.validate_batch: global and per-host concurrency limits."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+
+import httpx
+import pytest
+
+from scavengarr.infrastructure.http import host_of
+from scavengarr.infrastructure.validation import HttpLinkValidator, ProbeResult
+
+pytestmark = pytest.mark.asyncio
+
+
+class _Probe:
+    """Answers 200 after `delay`; records start order and peak concurrency."""
+
+    def __init__(self, delay: float = 0.01) -> None:
+        self.delay = delay
+        self.started: list[str] = []
+        self.running: Counter[str] = Counter()
+        self.max_running: Counter[str] = Counter()
+        self.max_total = 0
+
+    async def probe(
+        self, client: httpx.AsyncClient, url: str, *, timeout: float
+    ) -> ProbeResult:
+        host = host_of(url)
+        self.started.append(url)
+        self.running[host] += 1
+        self.max_running[host] = max(self.max_running[host], self.running[host])
+        self.max_total = max(self.max_total, self.running.total())
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running[host] -= 1
+        return ProbeResult(200, "HEAD")
+
+
+def _urls(host: str, n: int) -> list[str]:
+    return [f"https://{host}/file/{i}" for i in range(n)]
+
+
+async def test_batch_respects_global_and_per_host_limits() -> None:
+    probe = _Probe()
+    validator = HttpLinkValidator(
+        http_client=httpx.AsyncClient(), max_concurrent=5, max_per_host=2, probe=probe
+    )
+    urls = _urls("a.example", 8) + _urls("b.example", 8) + _urls("c.example", 8)
+
+    verdicts = await validator.validate_batch(urls)
+
+    assert verdicts == dict.fromkeys(urls, True)
+    assert probe.max_running == {"a.example": 2, "b.example": 2, "c.example": 2}
+    assert probe.max_total == 5
+
+
+async def test_domain_limit_applies_to_subdomains() -> None:
+    probe = _Probe()
+    validator = HttpLinkValidator(
+        http_client=httpx.AsyncClient(),
+        max_per_host=4,
+        host_limits={"Rapidgator.net": 1},
+        probe=probe,
+    )
+    urls = (
+        _urls("rapidgator.net", 3)
+        + _urls("dl.rapidgator.net", 3)
+        + _urls("other.example", 6)
+    )
+
+    await validator.validate_batch(urls)
+
+    assert probe.max_running == {
+        "rapidgator.net": 1,
+        "dl.rapidgator.net": 1,
+        "other.example": 4,
+    }
+
+
+async def test_batch_is_started_round_robin_across_hosts() -> None:
+    probe = _Probe(delay=0.0)
+    validator = HttpLinkValidator(
+        http_client=httpx.AsyncClient(), max_concurrent=1, probe=probe
+    )
+    urls = _urls("a.example", 3) + _urls("b.example", 2) + _urls("c.example", 1)
+
+    await validator.validate_batch(urls)
+
+    assert [host_of(url) for url in probe.started] == [
+        "a.example",
+        "b.example",
+        "c.example",
+        "a.example",
+        "b.example",
+        "a.example",
+    ]
@@ -0,0 +1,111 @@
+"""LinkProbe: HEAD, the ranged GET fallback and the per-host method memory."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+
+from scavengarr.infrastructure.validation import LinkProbe
+from scavengarr.infrastructure.validation import probe as probe_module
+
+pytestmark = pytest.mark.asyncio
+
+URL = "https://hoster.example/file/1"
+
+
+class _Hoster:
+    """Answers HEAD with `head`, GET with `get` and a body it counts reads of."""
+
+    def __init__(self, head: int, get: int = 206) -> None:
+        self.head = head
+        self.get = get
+        self.requests: list[tuple[str, str]] = []
+        self.ranges: list[str | None] = []
+        self.chunks_read = 0
+
+    async def _body(self) -> AsyncIterator[bytes]:
+        for _ in range(4):
+            self.chunks_read += 1
+            yield b"x" * 1024
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append((request.method, request.url.host))
+        if request.method == "HEAD":
+            return httpx.Response(self.head)
+        self.ranges.append(request.headers.get("Range"))
+        return httpx.Response(self.get, content=self._body())
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _probe(probe: LinkProbe, hoster: _Hoster, url: str = URL):
+    async with httpx.AsyncClient(transport=httpx.MockTransport(hoster)) as client:
+        return await probe.probe(client, url, timeout=5.0)
+
+
+async def test_head_answer_is_used_as_is() -> None:
+    hoster = _Hoster(head=404)
+
+    result = await _probe(LinkProbe(), hoster)
+
+    assert (result.status_code, result.method, result.ok) == (404, "HEAD", False)
+    assert hoster.requests == [("HEAD", "hoster.example")]
+
+
+@pytest.mark.parametrize("status", [403, 405, 501])
+async def test_unsupported_head_falls_back_to_a_ranged_get(status: int) -> None:
+    hoster = _Hoster(head=status)
+
+    result = await _probe(LinkProbe(), hoster)
+
+    assert (result.status_code, result.method, result.ok) == (206, "GET", True)
+    assert [method for method, _ in hoster.requests] == ["HEAD", "GET"]
+    assert hoster.ranges == ["bytes=0-0"]
+    assert hoster.chunks_read == 0  # the body is never read
+
+
+async def test_hosts_needing_get_skip_head_for_6_hours(monkeypatch) -> None:
+    clock = _Clock()
+    monkeypatch.setattr(probe_module.time, "monotonic", clock)
+    probe = LinkProbe()
+    hoster = _Hoster(head=405)
+
+    await _probe(probe, hoster)
+    hoster.requests.clear()
+    clock.now += 6 * 3600 - 1
+    await _probe(probe, hoster, "https://hoster.example/file/2")
+    await _probe(probe, hoster, "https://other.example/file/3")
+
+    assert hoster.requests == [
+        ("GET", "hoster.example"),
+        ("HEAD", "other.example"),
+        ("GET", "other.example"),
+    ]
+    assert probe.stats() == {"hoster.example": "GET", "other.example": "GET"}
+
+    hoster.requests.clear()
+    clock.now += 2
+    assert probe.method_for(URL) == "GET"  # renewed by the second probe
+    clock.now += 6 * 3600
+    await _probe(probe, hoster)
+
+    assert hoster.requests == [("HEAD", "hoster.example"), ("GET", "hoster.example")]
+
+
+async def test_failed_get_fallback_is_not_remembered() -> None:
+    probe = LinkProbe()
+    hoster = _Hoster(head=403, get=403)
+
+    result = await _probe(probe, hoster)
+
+    assert (result.status_code, result.method, result.ok) == (403, "GET", False)
+    assert probe.method_for(URL) == "HEAD"
+    assert probe.stats() == {}
@@ -0,0 +1,143 @@
+"""HttpLinkValidator.validate_any: racing alternative links of one result."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+
+from scavengarr.infrastructure.validation import HttpLinkValidator, ProbeResult
+
+pytestmark = pytest.mark.asyncio
+
+
+class _Probe:
+    """Answers each URL with a fixed status after a fixed delay."""
+
+    def __init__(self, answers: dict[str, tuple[float, int]]) -> None:
+        self.answers = answers
+        self.started: list[str] = []
+        self.cancelled: list[str] = []
+        self.running = 0
+        self.max_running = 0
+
+    async def probe(
+        self, client: httpx.AsyncClient, url: str, *, timeout: float
+    ) -> ProbeResult:
+        delay, status_code = self.answers[url]
+        self.started.append(url)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(url)
+            raise
+        finally:
+            self.running -= 1
+        return ProbeResult(status_code, "HEAD")
+
+
+class _Cache:
+    """In-memory CachePort."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+
+    async def get(self, key: str) -> Any:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: Any, *, ttl: int | None = None) -> None:
+        self.data[key] = value
+
+    async def delete(self, key: str) -> bool:
+        return self.data.pop(key, None) is not None
+
+    async def exists(self, key: str) -> bool:
+        return key in self.data
+
+    async def clear(self) -> None:
+        self.data.clear()
+
+    async def aclose(self) -> None:
+        pass
+
+    def verdicts(self) -> dict[str, bool]:
+        return {
+            key.removeprefix("linkcheck:"): value["valid"]
+            for key, value in self.data.items()
+        }
+
+
+def _validator(probe: _Probe, cache: _Cache) -> HttpLinkValidator:
+    return HttpLinkValidator(http_client=httpx.AsyncClient(), cache=cache, probe=probe)
+
+
+async def test_race_stops_after_the_first_live_link() -> None:
+    probe = _Probe(
+        {
+            "https://a.example/f": (0.01, 404),
+            "https://b.example/f": (0.02, 200),
+            "https://c.example/f": (1.0, 200),
+            "https://d.example/f": (0.0, 200),
+        }
+    )
+    cache = _Cache()
+
+    live = await _validator(probe, cache).validate_any(list(probe.answers), fan_out=2)
+
+    assert live == ["https://b.example/f"]
+    # a's slot went to c; d was never started, c was cancelled
+    assert probe.started == [
+        "https://a.example/f",
+        "https://b.example/f",
+        "https://c.example/f",
+    ]
+    assert probe.cancelled == ["https://c.example/f"]
+    assert cache.verdicts() == {
+        "https://a.example/f": False,
+        "https://b.example/f": True,
+    }
+
+
+async def test_cached_live_link_is_not_probed() -> None:
+    probe = _Probe(
+        {"https://a.example/f": (0.0, 404), "https://b.example/f": (0.0, 200)}
+    )
+    cache = _Cache()
+    validator = _validator(probe, cache)
+    await validator.validate("https://b.example/f")
+    probe.started.clear()
+
+    live = await validator.validate_any(["https://a.example/f", "https://b.example/f"])
+
+    assert live == ["https://b.example/f"]
+    assert probe.started == []
+
+
+async def test_all_dead_probes_every_link_at_most_fan_out_at_once() -> None:
+    urls = [f"https://h{i}.example/f" for i in range(7)]
+    probe = _Probe({url: (0.01 * (i % 3 + 1), 404) for i, url in enumerate(urls)})
+    cache = _Cache()
+
+    live = await _validator(probe, cache).validate_any(urls, fan_out=3)
+
+    assert live == []
+    assert sorted(probe.started) == sorted(urls)
+    assert probe.max_running == 3
+    assert probe.cancelled == []
+    assert cache.verdicts() == dict.fromkeys(urls, False)
+
+
+async def test_rate_limited_answer_is_not_stored() -> None:
+    probe = _Probe(
+        {"https://a.example/f": (0.0, 429), "https://b.example/f": (0.0, 404)}
+    )
+    cache = _Cache()
+
+    live = await _validator(probe, cache).validate_any(list(probe.answers))
+
+    assert live == []
+    assert cache.verdicts() == {"https://b.example/f": False}
@@ -0,0 +1,114 @@
+"""HttpLinkValidator verdict cache: hits skip probes, errors are not stored."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+import pytest
+
+from scavengarr.infrastructure.validation import HttpLinkValidator, ProbeResult
+
+pytestmark = pytest.mark.asyncio
+
+
+class _Probe:
+    """Answers each URL with a status code or raises the given error."""
+
+    def __init__(self, answers: dict[str, int | Exception]) -> None:
+        self.answers = answers
+        self.probed: list[str] = []
+
+    async def probe(
+        self, client: httpx.AsyncClient, url: str, *, timeout: float
+    ) -> ProbeResult:
+        self.probed.append(url)
+        answer = self.answers[url]
+        if isinstance(answer, Exception):
+            raise answer
+        return ProbeResult(answer, "HEAD")
+
+
+class _Cache:
+    """In-memory CachePort (get/set only)."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+
+    async def get(self, key: str) -> Any:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: Any, *, ttl: int | None = None) -> None:
+        self.data[key] = value
+
+    def verdicts(self) -> dict[str, bool]:
+        return {
+            key.removeprefix("linkcheck:"): value["valid"]
+            for key, value in self.data.items()
+        }
+
+
+def _validator(probe: _Probe, cache: _Cache) -> HttpLinkValidator:
+    return HttpLinkValidator(http_client=httpx.AsyncClient(), cache=cache, probe=probe)
+
+
+async def test_batch_probes_only_cache_misses() -> None:
+    probe = _Probe({"https://a.example/f": 200, "https://b.example/f": 404})
+    cache = _Cache()
+    validator = _validator(probe, cache)
+    await validator.validate("https://a.example/f")
+    probe.probed.clear()
+
+    verdicts = await validator.validate_batch(
+        [
+            "https://a.example/f",
+            "https://b.example/f",
+            "HTTPS://B.example:443/f#top",  # same link as b
+        ]
+    )
+
+    assert verdicts == {
+        "https://a.example/f": True,
+        "https://b.example/f": False,
+        "HTTPS://B.example:443/f#top": False,
+    }
+    assert probe.probed == ["https://b.example/f"]
+    assert cache.verdicts() == {
+        "https://a.example/f": True,
+        "https://b.example/f": False,
+    }
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        httpx.ConnectTimeout("timed out"),
+        httpx.ConnectError("connection reset"),
+        RuntimeError("unexpected"),
+    ],
+)
+async def test_failed_probe_is_not_stored(error: Exception) -> None:
+    url = "https://slow.example/f"
+    probe = _Probe({url: error})
+    cache = _Cache()
+    validator = _validator(probe, cache)
+
+    assert await validator.validate(url) is False
+    assert cache.verdicts() == {}
+
+    # The next search asks the hoster again
+    probe.answers[url] = 200
+    assert await validator.validate(url) is True
+    assert probe.probed == [url, url]
+
+
+@pytest.mark.parametrize("status", [403, 429])
+async def test_blocked_probe_is_not_stored(status: int) -> None:
+    # 403: rejected by HEAD and by the ranged GET fallback (see LinkProbe)
+    url = "https://blocking.example/f"
+    probe = _Probe({url: status})
+    cache = _Cache()
+    validator = _validator(probe, cache)
+
+    assert await validator.validate(url) is False
+    assert cache.verdicts() == {}